@@ -0,0 +1,37 @@
+# Apache License 2.0
+
+"""
+Write a Viewer of large polylines shaped like GPS tracks, with positions as
+decimal text, as base64 typed arrays and quantized, and compare their size and
+generation time.
+
+    python benchmarks/bench_array_encoding.py [n_polylines] [n_vertices]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import cesiumpy
+
+
+def main(n: int = 100, vertices: int = 10000) -> None:
+    rng = np.random.default_rng(0)
+    viewer = cesiumpy.Viewer()
+    for _ in range(n):
+        # steps of about 10 m from a random origin
+        origin = [rng.uniform(-180, 180), rng.uniform(-60, 60), 100.0]
+        steps = rng.normal(0.0, [1e-4, 1e-4, 1.0], size=(vertices, 3))
+        positions = origin + np.cumsum(steps, axis=0)
+        viewer.entities.add(cesiumpy.Polyline(positions=positions))
+
+    for encoding in (None, "float64", "float32", "quantized"):
+        start = time.perf_counter()
+        html = viewer.to_html(array_encoding=encoding)
+        elapsed = time.perf_counter() - start
+        print(f"{str(encoding):9}: {len(html) / 1e6:6.1f} MB, {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,39 @@
+# Apache License 2.0
+
+"""
+Build a polyline of many vertices from an array and from a list of rows,
+then generate its script.
+
+    python benchmarks/bench_cartesian_array.py [n_vertices]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import cesiumpy
+
+
+def main(n: int = 2000000) -> None:
+    rng = np.random.default_rng(0)
+    values = np.column_stack(
+        [rng.uniform(-180, 180, n), rng.uniform(-90, 90, n), np.zeros(n)]
+    )
+
+    start = time.perf_counter()
+    cesiumpy.Polyline(positions=values)
+    print(f"from array: {time.perf_counter() - start:.3f} s")
+
+    rows = values.tolist()
+    start = time.perf_counter()
+    polyline = cesiumpy.Polyline(positions=rows)
+    print(f"from rows:  {time.perf_counter() - start:.3f} s")
+
+    start = time.perf_counter()
+    polyline.generate_script()
+    print(f"script:     {time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000000)
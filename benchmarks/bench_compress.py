@@ -0,0 +1,65 @@
+# Apache License 2.0
+
+"""
+Compare size and generation time of plain, compact and compressed HTML for a
+Viewer inlining a large CZML document.
+
+    python benchmarks/bench_compress.py [n_packets] [n_samples]
+
+Decompression in the browser is not measured here. It can be approximated by
+running the loader of the compressed page with node, which also provides
+DecompressionStream.
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+import time
+
+import cesiumpy
+
+
+def _czml(n_packets: int, n_samples: int) -> list:
+    epoch = datetime.datetime(2024, 1, 1)
+    czml = [{"id": "document", "version": "1.0"}]
+    for i in range(n_packets):
+        cartographic = []
+        for j in range(n_samples):
+            cartographic += [60.0 * j, -180.0 + (i + j) % 360, 40.0 + j / 100, 5e5]
+        czml.append(
+            {
+                "id": f"satellite{i}",
+                "position": {
+                    "epoch": epoch.isoformat() + "Z",
+                    "cartographicDegrees": cartographic,
+                },
+                "point": {"pixelSize": 5, "color": {"rgba": [255, 0, 0, 255]}},
+            }
+        )
+    return czml
+
+
+def main(n_packets: int = 1000, n_samples: int = 200) -> None:
+    viewer = cesiumpy.Viewer()
+    viewer.data_sources.add(cesiumpy.CzmlDataSource(_czml(n_packets, n_samples)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for options in (
+            {},
+            {"compact": True},
+            {"compress": True},
+            {"compact": True, "compress": True},
+        ):
+            path = os.path.join(directory, "viewer.html")
+            start = time.perf_counter()
+            viewer.write_html(path, **options)
+            elapsed = time.perf_counter() - start
+
+            size = os.path.getsize(path) / 1e6
+            print(f"{str(options):40} {size:8.1f} MB {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*args)
@@ -0,0 +1,68 @@
+# Apache License 2.0
+
+"""
+Decimate positions and orientations of a satellite sampled every second for
+a day, within an error of 1 meter and 1e-4 radians, and compare the number
+of samples and the size of the page for each interpolation.
+
+    python benchmarks/bench_decimate.py [n_samples] [max_error_m]
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+import cesiumpy
+
+
+def _satellite(epoch: datetime, samples: int):
+    seconds = np.arange(samples, dtype=np.float64)
+    # circular orbit of about 95 minutes, nadir pointing
+    angles = seconds * 2 * np.pi / 5700.0
+    lon = (np.degrees(angles) - 180.0) % 360.0 - 180.0
+    lat = 50.0 * np.sin(angles)
+    positions = np.column_stack([lon, lat, np.full(samples, 500e3)])
+    q = np.column_stack(
+        [np.zeros((samples, 2)), np.sin(angles / 2), np.cos(angles / 2)]
+    )
+
+    position = cesiumpy.SampledPositionProperty()
+    position.add_samples(seconds, positions, epoch=epoch, degrees=True)
+    orientation = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+    orientation.add_samples(seconds, q, epoch=epoch)
+    return position, orientation
+
+
+def _size(position, orientation) -> float:
+    viewer = cesiumpy.Viewer()
+    viewer.entities.add(
+        cesiumpy.Box(position=position, orientation=orientation, dimensions=(1, 1, 1))
+    )
+    return sum(len(s) + 1 for s in viewer.iter_script()) / 1e6
+
+
+def main(samples: int = 86400, max_error: float = 1.0) -> None:
+    epoch = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+    position, orientation = _satellite(epoch, samples)
+    print(
+        f"{'original':10}: {samples:6} samples, {_size(position, orientation):5.1f} MB"
+    )
+
+    for interpolation, degree in (("linear", 1), ("lagrange", 5), ("lagrange", 9)):
+        position, orientation = _satellite(epoch, samples)
+        start = time.perf_counter()
+        position.decimate(max_error, interpolation=interpolation, degree=degree)
+        orientation.decimate(1e-4, interpolation=interpolation, degree=degree)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{interpolation + str(degree):10}: {len(position):6} positions, "
+            f"{len(orientation):6} orientations, "
+            f"{_size(position, orientation):5.1f} MB, {elapsed:.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main(*[float(a) if i else int(a) for i, a in enumerate(sys.argv[1:3])])
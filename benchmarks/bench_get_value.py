@@ -0,0 +1,52 @@
+# Apache License 2.0
+
+"""
+Interpolate positions and orientations of a satellite sampled every 10
+seconds for a day at random times, and measure the time of the lookups for
+each interpolation.
+
+    python benchmarks/bench_get_value.py [n_queries]
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+import cesiumpy
+
+
+def main(n: int = 1_000_000) -> None:
+    epoch = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    seconds = np.arange(8640) * 10.0
+
+    # circular orbit of about 95 minutes, nadir pointing
+    angles = seconds * 2 * np.pi / 5700.0
+    lon = (np.degrees(angles) - 180.0) % 360.0 - 180.0
+    lat = 50.0 * np.sin(angles)
+    positions = np.column_stack([lon, lat, np.full(len(seconds), 500e3)])
+    q = np.column_stack(
+        [np.zeros((len(seconds), 2)), np.sin(angles / 2), np.cos(angles / 2)]
+    )
+
+    position = cesiumpy.SampledPositionProperty()
+    position.add_samples(seconds, positions, epoch=epoch, degrees=True)
+    orientation = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+    orientation.add_samples(seconds, q, epoch=epoch)
+
+    rng = np.random.default_rng(0)
+    microseconds = rng.integers(0, int(seconds[-1] * 1e6), n)
+    times = np.datetime64("2022-01-01") + microseconds.astype("timedelta64[us]")
+
+    for interpolation, degree in (("linear", 1), ("lagrange", 5), ("lagrange", 9)):
+        for label, prop in (("position", position), ("orientation", orientation)):
+            prop.set_interpolation_options(interpolation, degree)
+            start = time.perf_counter()
+            prop.get_value(times)
+            elapsed = time.perf_counter() - start
+            print(f"{interpolation + str(degree):10} {label:12}: {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
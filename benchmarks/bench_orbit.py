@@ -0,0 +1,70 @@
+# Apache License 2.0
+
+"""
+Time the propagation of a constellation over a day, as Keplerian elements
+with J2 and as two-line elements propagated by SGP4, serially and by
+workers, then the addition of samples to satellites.
+
+    python benchmarks/bench_orbit.py [n_satellites] [step_seconds] [workers]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from cesiumpy import orbit
+
+
+def _elements(satellites: int) -> orbit.KeplerianElements:
+    # Walker constellation of 20 planes at 550 km
+    index = np.arange(satellites)
+    planes = 20
+    return orbit.KeplerianElements(
+        semi_major_axis=6928e3,
+        eccentricity=0.001,
+        inclination=53.0,
+        raan=360.0 * (index % planes) / planes,
+        argument_of_perigee=0.0,
+        mean_anomaly=360.0 * index / satellites,
+        epoch=np.datetime64("2024-03-20"),
+        degrees=True,
+    )
+
+
+def _tle(satellites: int) -> orbit.TLE:
+    first = "1 {0:05d}U 24001A   24080.00000000  .00001000  00000-0  10000-3 0  999"
+    second = "2 {0:05d}  53.0000 {1:8.4f} 0001000   0.0000 {2:8.4f} 15.0000000000001"
+    lines = []
+    for i in range(satellites):
+        raan = 360.0 * (i % 20) / 20
+        anomaly = 360.0 * i / satellites
+        lines.append(first.format(i % 100000))
+        lines.append(second.format(i % 100000, raan, anomaly))
+    return orbit.TLE(line + str(orbit.tle._checksum(line)) for line in lines)
+
+
+def main(satellites: int = 2000, step: int = 30, workers: int = 4) -> None:
+    times = np.datetime64("2024-03-20") + np.arange(0, 86400, step) * np.timedelta64(
+        1, "s"
+    )
+    print(f"{satellites} satellites, {len(times)} times")
+
+    for label, orbits in (
+        ("kepler", _elements(satellites)),
+        ("sgp4", _tle(satellites)),
+    ):
+        for n in (None, workers):
+            start = time.perf_counter()
+            ephemeris = orbit.propagate(orbits, times, workers=n)
+            elapsed = time.perf_counter() - start
+            print(f"{label}, workers={n}: {elapsed:.2f} s")
+
+    start = time.perf_counter()
+    ephemeris.satellites()
+    elapsed = time.perf_counter() - start
+    print(f"satellites: {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:4]])
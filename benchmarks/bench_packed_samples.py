@@ -0,0 +1,64 @@
+# Apache License 2.0
+
+"""
+Write a Viewer of satellites sampled every 10 seconds for a day, with one
+addSample statement per sample as samples used to be written, and with a
+single addSamplesPackedArray per property, and compare their size and
+generation time.
+
+    python benchmarks/bench_packed_samples.py [n_satellites] [n_samples]
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+import cesiumpy
+
+
+def _per_sample_script(viewer: cesiumpy.Viewer) -> list:
+    scripts = []
+    for entity in viewer.entities:
+        prop = entity.position
+        scripts.append(
+            f"widget.{prop.name} = new Cesium.SampledProperty(Cesium.Cartesian3);"
+        )
+        for t, value, _ in prop.samples:
+            scripts.append(
+                f'widget.{prop.name}.addSample("{t.isoformat()}", {value.generate_script()});'
+            )
+    return scripts
+
+
+def _measure(label: str, func) -> None:
+    start = time.perf_counter()
+    size = sum(len(s) + 1 for s in func())
+    elapsed = time.perf_counter() - start
+    print(f"{label:10}: {size / 1e6:6.1f} MB, {elapsed:.3f} s")
+
+
+def main(n: int = 20, samples: int = 8640) -> None:
+    epoch = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    seconds = np.arange(samples) * 10.0
+
+    viewer = cesiumpy.Viewer()
+    for i in range(n):
+        # circular orbit of about 95 minutes
+        lon = (seconds * 360.0 / 5700.0 + i * 18.0) % 360.0 - 180.0
+        lat = 50.0 * np.sin(seconds * 2 * np.pi / 5700.0)
+        values = np.column_stack([lon, lat, np.full(samples, 500e3)])
+
+        prop = cesiumpy.SampledPositionProperty()
+        prop.add_samples(seconds, values, epoch=epoch, degrees=True)
+        viewer.entities.add(cesiumpy.Point(position=prop))
+
+    _measure("addSample", lambda: _per_sample_script(viewer))
+    _measure("packed", lambda: viewer.iter_script())
+    for encoding in ("float64", "quantized"):
+        _measure(encoding, lambda: viewer.iter_script(array_encoding=encoding))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,81 @@
+# Apache License 2.0
+
+"""
+Compare serial script generation with a process pool, for many simple
+entities and for fewer polylines with long position arrays. Entities are
+pickled in the main process to be sent to workers, which is timed apart:
+workers can only pay off when it is much cheaper than the serial run.
+
+    python benchmarks/bench_parallel.py [n_points] [n_polylines] [workers]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+import cesiumpy
+import cesiumpy.util.parallel as parallel
+
+
+def _points(n: int) -> cesiumpy.Viewer:
+    viewer = cesiumpy.Viewer()
+    for i in range(n):
+        lon = -180.0 + (i % 360)
+        if i % 2 == 0:
+            viewer.entities.add(cesiumpy.Point(position=[lon, 40.0, 0.0]))
+        else:
+            viewer.entities.add(
+                cesiumpy.Box(
+                    position=[lon, 30.0, 0.0],
+                    dimensions=(1e4, 1e4, 1e4),
+                    material=cesiumpy.color.RED.with_alpha(0.5),
+                )
+            )
+    return viewer
+
+
+def _polylines(n: int, vertices: int = 2000) -> cesiumpy.Viewer:
+    rng = np.random.default_rng(0)
+    viewer = cesiumpy.Viewer()
+    for _ in range(n):
+        positions = np.column_stack(
+            [
+                rng.uniform(-10.0, 10.0, vertices),
+                rng.uniform(-10.0, 10.0, vertices),
+                np.zeros(vertices),
+            ]
+        )
+        viewer.entities.add(
+            cesiumpy.Polyline(positions=cesiumpy.Cartesian3.fromDegreesArray(positions))
+        )
+    return viewer
+
+
+def main(
+    points: int = 20000, polylines: int = 300, workers: int = os.cpu_count() or 1
+) -> None:
+    print(f"{os.cpu_count()} cpus")
+    for name, build in (
+        (f"{points} points", lambda: _points(points)),
+        (f"{polylines} polylines", lambda: _polylines(polylines)),
+    ):
+        viewer = build()
+        start = time.perf_counter()
+        parallel.dumps(viewer.entities._items)
+        print(f"{name}: pickle      {time.perf_counter() - start:6.2f} s")
+
+        # separate viewers, so that no run reuses scripts cached by another
+        for label, options in (
+            ("serial", {}),
+            (f"workers={workers}", {"workers": workers}),
+        ):
+            viewer = build()
+            start = time.perf_counter()
+            viewer.to_html(**options)
+            print(f"{name}: {label:11} {time.perf_counter() - start:6.2f} s")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
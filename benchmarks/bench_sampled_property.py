@@ -0,0 +1,73 @@
+# Apache License 2.0
+
+"""
+Add a day of positions sampled every second to SampledPositionProperty, one
+Cartesian3 at a time and from arrays at once, and compare their time and the
+memory they hold with a list of sample tuples, as samples used to be stored.
+
+    python benchmarks/bench_sampled_property.py [n_samples]
+"""
+
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+import cesiumpy
+
+
+def _measure(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    # held until the traced memory is read
+    result = func()  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:12}: {elapsed:.3f} s, {size / 1e6:6.1f} MB")
+
+
+def main(n: int = 86400) -> None:
+    epoch = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    seconds = np.arange(n, dtype=np.float64)
+    values = np.column_stack(
+        [(seconds / 240.0) % 360.0 - 180.0, np.zeros(n), np.full(n, 500e3)]
+    )
+
+    def tuples():
+        return [
+            (
+                epoch + timedelta(seconds=s),
+                cesiumpy.Cartesian3.fromDegrees(lon, lat, height),
+                None,
+            )
+            for s, (lon, lat, height) in zip(seconds.tolist(), values.tolist())
+        ]
+
+    def one_by_one():
+        prop = cesiumpy.SampledPositionProperty()
+        for s, (lon, lat, height) in zip(seconds.tolist(), values.tolist()):
+            prop.add_sample(
+                epoch + timedelta(seconds=s),
+                cesiumpy.Cartesian3.fromDegrees(lon, lat, height),
+            )
+        # samples are appended to columns when they are read
+        prop.values
+        return prop
+
+    def at_once():
+        prop = cesiumpy.SampledPositionProperty()
+        prop.add_samples(seconds, values, epoch=epoch, degrees=True)
+        return prop
+
+    _measure("tuples", tuples)
+    _measure("add_sample", one_by_one)
+    _measure("add_samples", at_once)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
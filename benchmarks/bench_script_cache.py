@@ -0,0 +1,37 @@
+# Apache License 2.0
+
+"""
+Render a Viewer repeatedly, modifying a single entity between renders.
+Only the modified entity is serialized again, the others reuse their cached
+script.
+
+    python benchmarks/bench_script_cache.py [n_entities]
+"""
+
+import sys
+import time
+
+import cesiumpy
+
+
+def main(n: int = 50000) -> None:
+    viewer = cesiumpy.Viewer()
+    points = []
+    for i in range(n):
+        point = cesiumpy.Point(position=[-180.0 + (i % 360), 40.0, 0.0], pixel_size=5)
+        viewer.entities.add(point)
+        points.append(point)
+
+    start = time.perf_counter()
+    viewer.to_html()
+    print(f"first render: {time.perf_counter() - start:.3f} s")
+
+    for i in range(3):
+        points[i].pixel_size = 10
+        start = time.perf_counter()
+        viewer.to_html()
+        print(f"re-render:    {time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
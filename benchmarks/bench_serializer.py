@@ -0,0 +1,66 @@
+# Apache License 2.0
+
+"""
+Compare the generic to_jsobject path with the serializers compiled per class.
+
+    python benchmarks/bench_serializer.py [n_entities]
+"""
+
+import sys
+import time
+
+import cesiumpy
+import cesiumpy.util.common as com
+
+
+def _entities(n: int) -> list:
+    entities = []
+    for i in range(n):
+        lon = -180.0 + (i % 360)
+        if i % 3 == 0:
+            entities.append(cesiumpy.Point(position=[lon, 40.0, 0.0], pixel_size=5))
+        elif i % 3 == 1:
+            entities.append(
+                cesiumpy.Cylinder(
+                    position=[lon, 40.0, 5e5],
+                    length=1e6,
+                    top_radius=1e5,
+                    bottom_radius=1e5,
+                    material=cesiumpy.color.AQUA,
+                )
+            )
+        else:
+            entities.append(
+                cesiumpy.Polyline(
+                    positions=[lon, 25.0, 0.0, lon, 30.0, 0.0],
+                    width=0.5,
+                    material=cesiumpy.color.BLUE,
+                )
+            )
+    return entities
+
+
+def _generic(entities: list) -> list:
+    return ["".join(com.to_jsobject(e._property_dict)) for e in entities]
+
+
+def _compiled(entities: list) -> list:
+    return [e.generate_script() for e in entities]
+
+
+def main(n: int) -> None:
+    entities = _entities(n)
+
+    timings = {}
+    for name, func in (("to_jsobject", _generic), ("compiled", _compiled)):
+        start = time.perf_counter()
+        result = func(entities)
+        timings[name] = time.perf_counter() - start
+        print(f"{name:>12}: {timings[name]:.3f} s for {n} entities")
+
+    assert _generic(entities) == result
+    print(f"{'speedup':>12}: {timings['to_jsobject'] / timings['compiled']:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
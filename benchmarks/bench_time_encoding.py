@@ -0,0 +1,50 @@
+# Apache License 2.0
+
+"""
+Compare the size and generation time of a page of entities available over
+time intervals, with datetimes written as ISO 8601 strings or as seconds
+from the start of the clock.
+
+    python benchmarks/bench_time_encoding.py [n_entities]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import cesiumpy
+
+
+def _viewer(entities: int) -> cesiumpy.Viewer:
+    start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    clock = cesiumpy.Clock(start_time=start, stop_time=start + timedelta(days=1))
+    viewer = cesiumpy.Viewer(clock_view_model=cesiumpy.ClockViewModel(clock))
+
+    # passes of a few minutes every 10 minutes, repeated across entities
+    for i in range(entities):
+        begin = start + timedelta(minutes=10 * (i % 144))
+        interval = cesiumpy.TimeInterval(start=begin, stop=begin + timedelta(minutes=5))
+        viewer.entities.add(
+            cesiumpy.Point(
+                position=[i % 360 - 180, 0, 0],
+                availability=cesiumpy.TimeIntervalCollection([interval]),
+            )
+        )
+    return viewer
+
+
+def main(entities: int = 10000) -> None:
+    viewer = _viewer(entities)
+
+    for relative_times in (False, True):
+        start = time.perf_counter()
+        size = sum(
+            len(s) + 1 for s in viewer.iter_script(relative_times=relative_times)
+        )
+        elapsed = time.perf_counter() - start
+        label = "relative" if relative_times else "iso 8601"
+        print(f"{label}: {size / 1e6:.2f} MB, {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
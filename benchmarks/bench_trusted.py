@@ -0,0 +1,52 @@
+# Apache License 2.0
+
+"""
+Construct entities with and without validation of their values, see
+cesiumpy.trusted.
+
+    python benchmarks/bench_trusted.py [n_entities]
+"""
+
+import sys
+import time
+
+import cesiumpy
+
+
+def _build(n: int) -> list:
+    color = cesiumpy.color.RED
+    return [
+        cesiumpy.Point(
+            position=[-180.0 + (i % 360), 40.0, 0.0], color=color, pixel_size=5.0
+        )
+        for i in range(n)
+    ] + [
+        cesiumpy.Cylinder(
+            position=[-180.0 + (i % 360), 40.0, 0.0],
+            length=1000.0,
+            top_radius=10.0,
+            bottom_radius=10.0,
+            material=color,
+        )
+        for i in range(n)
+    ]
+
+
+def main(n: int = 20000) -> None:
+    start = time.perf_counter()
+    validated = _build(n)
+    elapsed = time.perf_counter() - start
+    print(f"validated: {elapsed:.3f} s")
+
+    start = time.perf_counter()
+    with cesiumpy.trusted():
+        trusted = _build(n)
+    trusted_elapsed = time.perf_counter() - start
+    print(f"trusted:   {trusted_elapsed:.3f} s ({elapsed / trusted_elapsed:.1f}x)")
+
+    scripts = [e.generate_script() for e in validated]
+    assert scripts == [e.generate_script() for e in trusted]
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -36,11 +36,6 @@ from cesiumpy.entities.model import Model  # noqa
 from cesiumpy.entities.pinbuilder import Pin  # noqa
 from cesiumpy.entities.transform import Transforms  # noqa
 
-# extension
-import cesiumpy.extension as extension  # noqa
-from cesiumpy.extension import geocode  # noqa
-from cesiumpy.extension import io  # noqa
-from cesiumpy.extension import spatial  # noqa
 
 from cesiumpy.camera import Camera  # noqa
 from cesiumpy.constants import (
@@ -59,31 +54,11 @@ from cesiumpy.datasource import (
     KmlDataSource,
 )  # noqa
 
-from cesiumpy.provider import (
-    TerrainProvider,  # noqa
-    ArcGisImageServerTerrainProvider,  # noqa
-    CesiumTerrainProvider,  # noqa
-    EllipsoidTerrainProvider,  # noqa
-    VRTheWorldTerrainProvider,  # noqa
-    ImageryProvider,  # noqa
-    ArcGisMapServerImageryProvider,  # noqa
-    BingMapsImageryProvider,  # noqa
-    GoogleEarthImageryProvider,  # noqa
-    GridImageryProvider,  # noqa
-    MapboxImageryProvider,  # noqa
-    OpenStreetMapImageryProvider,  # noqa
-    SingleTileImageryProvider,  # noqa
-    TileCoordinatesImageryProvider,  # noqa
-    TileMapServiceImageryProvider,  # noqa
-    UrlTemplateImageryProvider,  # noqa
-    WebMapServiceImageryProvider,  # noqa
-    WebMapTileServiceImageryProvider,
-)  # noqa
-
 from cesiumpy.clock import ClockViewModel  # noqa
 from cesiumpy.clock import Clock  # noqa
 
 from cesiumpy.path_graphics import PathGraphics
+from cesiumpy.distance_display_condition import DistanceDisplayCondition  # noqa
 
 from cesiumpy.time import TimeInterval
 from cesiumpy.time import TimeIntervalCollection
@@ -100,11 +75,63 @@ from cesiumpy.widget import CesiumWidget  # noqa
 
 from cesiumpy.version import version as __version__  # noqa
 
-from cesiumpy.satellite import Satellite  # noqa
-from cesiumpy.sensor import Sensor  # noqa
-from cesiumpy.sensor import CustomPatternSensor  # noqa
-from cesiumpy.sensor import RectangularSensor  # noqa
-from cesiumpy.sensor import CylindricalSensor  # noqa
-from cesiumpy.sensor import ConicSensor  # noqa
+from cesiumpy.util.trait import trusted  # noqa
 
 from cesiumpy import math  # noqa
+
+# imported on first access, as they are slow to import or depend on slow
+# optional packages
+_LAZY_MODULES = {
+    "extension": "cesiumpy.extension",
+    "geocode": "cesiumpy.extension.geocode",
+    "io": "cesiumpy.extension.io",
+    "lod": "cesiumpy.extension.lod",
+    "orbit": "cesiumpy.orbit",
+    "spatial": "cesiumpy.extension.spatial",
+}
+
+_LAZY_ATTRIBUTES = {
+    "CartesianBatch": "cesiumpy.entities.cartesian_batch",
+    "TerrainProvider": "cesiumpy.provider",
+    "ArcGisImageServerTerrainProvider": "cesiumpy.provider",
+    "CesiumTerrainProvider": "cesiumpy.provider",
+    "EllipsoidTerrainProvider": "cesiumpy.provider",
+    "VRTheWorldTerrainProvider": "cesiumpy.provider",
+    "ImageryProvider": "cesiumpy.provider",
+    "ArcGisMapServerImageryProvider": "cesiumpy.provider",
+    "BingMapsImageryProvider": "cesiumpy.provider",
+    "GoogleEarthImageryProvider": "cesiumpy.provider",
+    "GridImageryProvider": "cesiumpy.provider",
+    "MapboxImageryProvider": "cesiumpy.provider",
+    "OpenStreetMapImageryProvider": "cesiumpy.provider",
+    "SingleTileImageryProvider": "cesiumpy.provider",
+    "TileCoordinatesImageryProvider": "cesiumpy.provider",
+    "TileMapServiceImageryProvider": "cesiumpy.provider",
+    "UrlTemplateImageryProvider": "cesiumpy.provider",
+    "WebMapServiceImageryProvider": "cesiumpy.provider",
+    "WebMapTileServiceImageryProvider": "cesiumpy.provider",
+    "Satellite": "cesiumpy.satellite",
+    "Sensor": "cesiumpy.sensor",
+    "CustomPatternSensor": "cesiumpy.sensor",
+    "RectangularSensor": "cesiumpy.sensor",
+    "CylindricalSensor": "cesiumpy.sensor",
+    "ConicSensor": "cesiumpy.sensor",
+}
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(_LAZY_MODULES[name])
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES) | set(_LAZY_ATTRIBUTES))
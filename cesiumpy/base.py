@@ -2,15 +2,25 @@
 
 from __future__ import unicode_literals
 
-import functools
-import operator
-from typing import List, Dict, Optional
+import collections
+import datetime
+import itertools
+from typing import IO, Iterator, List, Dict, Optional, Set, Tuple, Union
 
 import traitlets
 
 import cesiumpy.util.common as com
 import cesiumpy.util.html as html
+import cesiumpy.util.parallel as parallel
 from cesiumpy.util.trait import _JavaScriptObject, _JavaScriptEnum, _DIV
+from cesiumpy.util.serializer import (
+    ARRAY_DECODER_SCRIPTS,
+    ConstantTable,
+    J2000,
+    time_decoder_script,
+    validate_array_encoding,
+)
+from cesiumpy.util.trait import mark_script_side_effect
 
 
 CESIUM_VERSION: str = "1.86"
@@ -42,6 +52,15 @@ class _CesiumBase(_CesiumObject):
 
     _varname = "widget"
 
+    # hoisted constants of the output being generated, see iter_script
+    _constants: Optional[ConstantTable] = None
+    # encoding of position arrays of the output being generated
+    _array_encoding: Optional[str] = None
+    # epoch which times of the output being generated are relative to
+    _time_epoch: Optional[datetime.datetime] = None
+    # whether positions in degrees are converted in Python
+    _fixed_frame: bool = False
+
     _props = [
         "clock_view_model",
         "imagery_provider",
@@ -168,6 +187,8 @@ class _CesiumBase(_CesiumObject):
 
         self._property_map: Dict[str, List[str]] = {}
 
+        self._entity_ids = itertools.count()
+
     # Properties
 
     @property
@@ -176,22 +197,7 @@ class _CesiumBase(_CesiumObject):
 
     @property
     def script(self):
-        self._property_map = {}
-
-        entities_scripts = self._entities.generate_script(widget=self)
-        data_sources_scripts = self._data_sources.generate_script(widget=self)
-        scene_scripts = self._scene.generate_script(widget=self)
-
-        return (
-            self._setup_scripts
-            + self._widget_scripts
-            + self._property_scripts
-            + entities_scripts
-            + data_sources_scripts
-            + self._camera_scripts
-            + scene_scripts
-            + self.scripts._items
-        )
+        return list(self.iter_script())
 
     @property
     def camera(self):
@@ -199,7 +205,214 @@ class _CesiumBase(_CesiumObject):
 
     # Methods
 
+    def iter_script(
+        self,
+        hoist: bool = False,
+        workers: Optional[int] = None,
+        array_encoding: Optional[str] = None,
+        relative_times: bool = False,
+        fixed_frame: bool = False,
+    ) -> Iterator[str]:
+        """
+        Yield scripts one by one, generating entity scripts lazily.
+
+        Property scripts registered while generating an entity or a data source
+        are emitted right before the first script which refers to them.
+
+        Parameters
+        ----------
+
+        hoist: bool, default False
+            Declare repeated expressions such as colors or pins once as
+            constants, and refer to them by name. Scripts are buffered to
+            find the repeated expressions, and cached scripts are not used
+            while hoisting.
+        workers: int, optional
+            Number of processes generating scripts of entities and data
+            sources, see RestrictedList.iter_script.
+        array_encoding: str, optional
+            Embed positions of Cartesian3Array, such as the ones of Polyline
+            or Polygon, and samples of SampledProperty, as base64 typed
+            arrays decoded once in the page, either "float64" or "float32".
+            "float32" keeps coordinates in degrees to about 1 m, and only
+            applies to them, others being kept as float64. "quantized"
+            rounds them to micro degrees and heights to centimeters, samples
+            to microseconds and centimeters, and stores differences between
+            consecutive rows as varints. Cached scripts are not used when
+            encoding.
+        relative_times: bool, default False
+            Write datetimes as seconds from one epoch of the page, the start
+            time of the clock if any, converted to JulianDate by a function
+            declared once, instead of parsing each ISO 8601 string. Cached
+            scripts are not used with relative times.
+        fixed_frame: bool, default False
+            Write positions in degrees as coordinates in the Earth-fixed
+            frame computed by cesiumpy.math.geodesy, instead of converting
+            them in the browser by Cesium.Cartesian3.fromDegrees. Cached
+            scripts are not used when converting.
+        """
+
+        validate_array_encoding(array_encoding)
+
+        self._property_map = {}
+        self._constants = ConstantTable() if hoist else None
+        self._array_encoding = array_encoding
+        self._time_epoch = self._document_epoch() if relative_times else None
+        self._fixed_frame = fixed_frame
+
+        try:
+            scripts = self._iter_scripts(workers, array_encoding)
+            if self._constants is not None:
+                # repeated expressions are only known once all are generated
+                scripts = self._constants.resolve(list(scripts))
+            yield from scripts
+        finally:
+            self._constants = None
+            self._array_encoding = None
+            self._time_epoch = None
+            self._fixed_frame = False
+
+    def _iter_scripts(
+        self, workers: Optional[int], array_encoding: Optional[str]
+    ) -> Iterator[str]:
+        emitted: Set[str] = set()
+
+        yield from self._setup_scripts
+
+        if array_encoding is not None:
+            yield from ARRAY_DECODER_SCRIPTS
+
+        if self._time_epoch is not None:
+            yield time_decoder_script(self._time_epoch)
+
+        widget_scripts = self._widget_scripts
+        yield from self._flush_property_scripts(emitted)
+        yield from widget_scripts
+
+        for script in self._entities.iter_script(widget=self, workers=workers):
+            yield from self._flush_property_scripts(emitted)
+            yield script
+
+        for script in self._data_sources.iter_script(widget=self, workers=workers):
+            yield from self._flush_property_scripts(emitted)
+            yield script
+
+        camera_scripts = self._camera_scripts
+        yield from self._flush_property_scripts(emitted)
+        yield from camera_scripts
+
+        for script in self._scene.generate_script(widget=self):
+            yield from self._flush_property_scripts(emitted)
+            yield script
+
+        yield from self.scripts._items
+
+    def snapshot(self) -> "ViewerSnapshot":
+        """
+        Record the current entities, to be passed to diff_script later.
+
+        Entities without id are recorded with their position, which is their
+        position in the page rendered from the viewer, so that taking a
+        snapshot does not change the page.
+        """
+
+        entities = collections.OrderedDict()
+        positions = {}
+        for position, entity in enumerate(self._entities):
+            key = entity.id
+            if key is None:
+                key = position
+                positions[id(entity)] = (entity, position)
+            entities[key] = self._entity_state(entity)
+        return ViewerSnapshot(entities, positions)
+
+    def diff_script(self, since: "ViewerSnapshot") -> List[str]:
+        """
+        Return scripts updating a page rendered at the snapshot to the current
+        entities: removed entities, added entities and modified properties,
+        addressed by entity id, or by their position in the page for entities
+        without id. Entities added by the scripts are given an id.
+
+        Parameters
+        ----------
+
+        since: ViewerSnapshot
+            Snapshot returned by snapshot, before the page was rendered.
+        """
+
+        entities = f"{self._varname}.entities"
+        # entities of the page as rendered, before scripts remove or add any
+        page = f"{self._varname}SnapshotEntities"
+        keys = [since._key(entity) for entity in self._entities]
+        current = set(keys)
+        positions: Set[int] = set()
+
+        def _target(key) -> str:
+            if isinstance(key, str):
+                return f'{entities}.getById("{key}")'
+            positions.add(key)
+            return f"{page}[{key}]"
+
+        scripts: List[str] = []
+        for key in since._entities:
+            if key not in current:
+                if isinstance(key, str):
+                    scripts.append(f'{entities}.removeById("{key}");')
+                else:
+                    scripts.append(f"{entities}.remove({_target(key)});")
+
+        emitted: Set[str] = set()
+        for entity, key in zip(self._entities, keys):
+            if key is None:
+                # added entities are addressed by id in later scripts
+                self._assign_entity_ids([entity])
+            previous = since._entities.get(key)
+
+            # cached scripts make the comparison of unchanged entities cheap
+            self._property_map = {}
+            script = entity.generate_script(widget=self)
+            properties = self._property_map
+            if previous is not None and previous[0] == script:
+                if previous[2] == properties:
+                    continue
+
+            script, fields, properties = self._entity_state(entity)
+
+            self._property_map = dict(properties)
+            scripts.extend(self._flush_property_scripts(emitted))
+
+            if (
+                previous is None
+                or fields is None
+                or previous[1] is None
+                or previous[2] != properties
+            ):
+                # replace entities which cannot be updated property by property
+                if previous is not None:
+                    if isinstance(key, str):
+                        scripts.append(f'{entities}.removeById("{key}");')
+                    else:
+                        scripts.append(f"{entities}.remove({_target(key)});")
+                        self._assign_entity_ids([entity])
+                        script = self._entity_state(entity)[0]
+                scripts.append(f"{entities}.add({script});")
+                continue
+
+            target = _target(key)
+            previous_fields = dict(previous[1])
+            for name, value in fields:
+                if previous_fields.pop(name, None) != value:
+                    scripts.append(f"{target}.{name} = {value or 'undefined'};")
+            for name in previous_fields:
+                scripts.append(f"{target}.{name} = undefined;")
+
+        if positions:
+            scripts.insert(0, f"var {page} = {entities}.values.slice();")
+        return scripts
+
     def register_property(self, property: str, scripts: List[str]) -> None:
+        # scripts referring to registered properties must not be cached
+        mark_script_side_effect()
         self._property_map[property] = scripts
 
     # Private properties
@@ -279,25 +492,228 @@ class _CesiumBase(_CesiumObject):
     def scripts(self):
         return self._scripts
 
-    @property
-    def _property_scripts(self) -> List[str]:
-        return functools.reduce(operator.iconcat, self._property_map.values(), [])
-
     # Methods
 
-    def to_html(self) -> str:
-        headers = self._load_scripts
-        container = self.container
-        scripts = html.wrap_scripts(self.script)
+    def iter_html(
+        self,
+        hoist: Optional[bool] = None,
+        compact: bool = False,
+        digits: Optional[int] = 10,
+        compress: bool = False,
+        workers: Optional[int] = None,
+        array_encoding: Optional[str] = None,
+        relative_times: Optional[bool] = None,
+        fixed_frame: bool = False,
+    ) -> Iterator[str]:
+        """
+        Yield HTML lines one by one, without building the whole page in memory.
+
+        Parameters
+        ----------
+
+        hoist: bool, optional
+            Declare repeated expressions once as constants, see iter_script.
+            Enabled in compact output by default.
+        compact: bool, default False
+            Remove indentation and spaces from scripts, shorten keys of entity
+            options, and format floats with the specified number of
+            significant digits.
+        digits: int, default 10
+            Number of significant digits of floats in compact output, which
+            keeps coordinates in degrees to about 1 cm. None keeps floats as
+            they are.
+        compress: bool, default False
+            Embed scripts compressed with gzip, which are decompressed in the
+            browser with DecompressionStream before execution.
+        workers: int, optional
+            Number of processes generating scripts of entities and data
+            sources, see iter_script.
+        array_encoding: str, optional
+            Embed position arrays as base64 typed arrays, either "float64",
+            "float32" or "quantized", see iter_script.
+        relative_times: bool, optional
+            Write datetimes as seconds from one epoch, see iter_script.
+            Enabled in compact output by default.
+        fixed_frame: bool, default False
+            Write positions in degrees in the Earth-fixed frame, see
+            iter_script.
+        """
+
+        if hoist is None:
+            hoist = compact
+        if relative_times is None:
+            relative_times = compact
+
+        scripts = self.iter_script(
+            hoist=hoist,
+            workers=workers,
+            array_encoding=array_encoding,
+            relative_times=relative_times,
+            fixed_frame=fixed_frame,
+        )
+        if compact:
+            scripts = html.iter_compact_scripts(scripts, digits=digits)
+
+        indent = 0 if compact else 2
+        if compress:
+            scripts = html.iter_compressed_scripts(
+                html._iter_wrap_async_init(scripts, indent=indent)
+            )
+        else:
+            scripts = html.iter_wrap_scripts(scripts, indent=indent)
+
+        return html.iter_html(self._load_scripts, self.container, scripts)
+
+    def write_html(
+        self,
+        fp: Union[str, IO[str]],
+        hoist: Optional[bool] = None,
+        compact: bool = False,
+        digits: Optional[int] = 10,
+        compress: bool = False,
+        workers: Optional[int] = None,
+        array_encoding: Optional[str] = None,
+        relative_times: Optional[bool] = None,
+        fixed_frame: bool = False,
+    ) -> None:
+        """
+        Write HTML to a path or a file-like object, streaming each script.
 
-        return html.build_html(headers, container, scripts)
+        Parameters
+        ----------
+
+        fp: str or file-like object
+            Output path, or file-like object having ``write`` method.
+        hoist, compact, digits, compress, workers, array_encoding, relative_times,
+        fixed_frame:
+            See iter_html.
+        """
+
+        lines = self.iter_html(
+            hoist=hoist,
+            compact=compact,
+            digits=digits,
+            compress=compress,
+            workers=workers,
+            array_encoding=array_encoding,
+            relative_times=relative_times,
+            fixed_frame=fixed_frame,
+        )
+        if isinstance(fp, str):
+            with open(fp, "w") as f:
+                html.write_html(f, lines)
+        else:
+            html.write_html(fp, lines)
+
+    def to_html(
+        self,
+        hoist: Optional[bool] = None,
+        compact: bool = False,
+        digits: Optional[int] = 10,
+        compress: bool = False,
+        workers: Optional[int] = None,
+        array_encoding: Optional[str] = None,
+        relative_times: Optional[bool] = None,
+        fixed_frame: bool = False,
+    ) -> str:
+        return html.build_html(
+            self.iter_html(
+                hoist=hoist,
+                compact=compact,
+                digits=digits,
+                compress=compress,
+                workers=workers,
+                array_encoding=array_encoding,
+                relative_times=relative_times,
+                fixed_frame=fixed_frame,
+            )
+        )
 
     # Private methods
 
+    def _document_epoch(self) -> datetime.datetime:
+        # offsets from the clock are small, so that they are short, J2000
+        # otherwise
+        if self.clock_view_model is not None:
+            clock = self.clock_view_model.clock
+            for time in (clock.start_time, clock.current_time):
+                if time is not None:
+                    return time
+        return J2000
+
+    def _flush_property_scripts(self, emitted: Set[str]) -> Iterator[str]:
+        for name in list(self._property_map):
+            # release property scripts as soon as they are emitted
+            scripts = self._property_map.pop(name)
+            if name not in emitted:
+                emitted.add(name)
+                yield from scripts
+
+    def _assign_entity_ids(self, entities: list) -> None:
+        ids = set(entity.id for entity in self._entities)
+        for entity in entities:
+            while entity.id is None:
+                id = f"entity{next(self._entity_ids)}"
+                if id not in ids:
+                    entity.id = id
+
+    def _entity_state(
+        self, entity
+    ) -> Tuple[str, Optional[List[Tuple[str, str]]], Dict[str, List[str]]]:
+        """
+        Return the script of entity, its top-level properties and the property
+        scripts it registers.
+        """
+
+        self._property_map = {}
+
+        fields = entity._script_fields(widget=self)
+        if fields is None:
+            script = entity.generate_script(widget=self)
+        elif len(fields) == 0:
+            script = ""
+        else:
+            # same as the compiled serializer
+            script = "{" + ", ".join(f"{name}: {value}" for name, value in fields) + "}"
+
+        properties = self._property_map
+        self._property_map = {}
+        return script, fields, properties
+
     def _repr_html_(self) -> str:
         return self.to_html()
 
 
+class ViewerSnapshot:
+    """
+    Entities of a viewer at some point, see Viewer.snapshot.
+    """
+
+    def __init__(
+        self,
+        entities: Dict[Union[str, int], tuple],
+        positions: Optional[Dict[int, tuple]] = None,
+    ) -> None:
+        # id, or position of entities without id -> (script, top-level
+        # properties, registered property scripts)
+        self._entities = entities
+        # id() of entities without id -> (entity, position), entities being
+        # kept so that their id() is not reused
+        self._positions = positions or {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def _key(self, entity) -> Optional[Union[str, int]]:
+        """Return key of entity in the snapshot, None if not recorded"""
+        if entity.id is not None:
+            return entity.id
+        recorded = self._positions.get(id(entity))
+        if recorded is None or recorded[0] is not entity:
+            return None
+        return recorded[1]
+
+
 class RestrictedList(_CesiumObject):
     widget = traitlets.Instance(klass=_CesiumBase)
 
@@ -326,6 +742,14 @@ class RestrictedList(_CesiumObject):
 
             raise ValueError(msg.format(allowed=allowed, item=item))
 
+    def remove(self, item):
+        # compare by identity, as items are equal when their scripts are
+        for i, x in enumerate(self._items):
+            if x is item:
+                del self._items[i]
+                return
+        raise ValueError(f"item is not in the list: {item}")
+
     def clear(self):
         self._items = []
 
@@ -341,12 +765,43 @@ class RestrictedList(_CesiumObject):
         each script may be a list of commands also
         """
 
-        results = []
+        return list(self.iter_script(widget=widget))
+
+    def iter_script(self, widget=None, workers: Optional[int] = None):
+        """
+        Yield scripts built from entities one by one
+
+        Parameters
+        ----------
+
+        widget: _CesiumBase, optional
+            Widget the scripts are generated for, the owner by default.
+        workers: int, optional
+            Number of processes generating scripts. Items are pickled in this
+            process, which costs more than generating scripts of simple
+            entities such as points, so that workers only pay off for
+            entities with large arrays such as long polylines, see
+            benchmarks/bench_parallel.py. Scripts are generated serially for
+            lists not longer than workers, or while hoisting constants.
+        """
+
+        widget = widget or self.widget
+        script = "{varname}.{propertyname}.add({{item}});".format(
+            varname=widget._varname, propertyname=self._propertyname
+        )
+
+        if (
+            workers is not None
+            and workers > 1
+            and len(self._items) > workers
+            and widget._constants is None
+        ):
+            items = parallel.iter_parallel_scripts(self._items, widget, workers)
+            for properties, item in items:
+                # registered properties are emitted by the widget before item
+                widget._property_map.update(properties)
+                yield script.format(item=item)
+            return
+
         for item in self._items:
-            script = "{varname}.{propertyname}.add({item});".format(
-                varname=(widget or self.widget)._varname,
-                propertyname=self._propertyname,
-                item=item.generate_script(widget=(widget or self.widget)),
-            )
-            results.append(script)
-        return results
+            yield script.format(item=item.generate_script(widget=widget))
@@ -29,14 +29,18 @@ class CountryLoader(object):
             self._countries = countries
         return self._countries
 
-    def get(self, name):
+    def get(self, name, simplify=None, lod=None):
+        """
+        Return entities of the country, see extension.io.read_geojson for
+        simplify and lod.
+        """
         fname = name.lower()
         fname = self.countries.get(fname, fname)
         path = os.path.join(data_path, "data", "{0}.geo.json".format(fname))
         if os.path.exists(path):
             from cesiumpy.extension.io import read_geojson
 
-            return read_geojson(path)
+            return read_geojson(path, simplify=simplify, lod=lod)
         else:
             msg = "Unable to load country data, file not found: '{name}'"
             raise ValueError(msg.format(name=name))
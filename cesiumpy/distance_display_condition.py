@@ -0,0 +1,54 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+from typing import Optional
+
+import traitlets
+
+from cesiumpy.base import _CesiumObject
+
+
+class DistanceDisplayCondition(_CesiumObject):
+    """
+    Interval of distances in meters from the camera within which a graphics
+    is displayed.
+
+    Parameters
+    ----------
+
+    near: float, default 0.0
+        The smallest distance in the interval.
+    far: float, optional
+        The largest distance in the interval, unbounded by default.
+    """
+
+    # Definitions
+
+    _props = ["near", "far"]
+
+    near = traitlets.Float(allow_none=False)
+    far = traitlets.Float(allow_none=True)
+
+    # Constructor
+
+    def __init__(
+        self,
+        near: float = 0.0,
+        far: Optional[float] = None,
+    ) -> None:
+        if far is not None and far <= near:
+            msg = "far must be larger than near: {near}, {far}"
+            raise ValueError(msg.format(near=near, far=far))
+
+        self.near: float = near
+        self.far: Optional[float] = far
+
+    # Methods
+
+    def generate_script(self, widget=None) -> str:
+        far = "Number.MAX_VALUE" if self.far is None else self.far
+        return f"new Cesium.DistanceDisplayCondition({self.near}, {far})"
+
+    def __repr__(self) -> str:
+        return f"DistanceDisplayCondition({self.near}, {self.far})"
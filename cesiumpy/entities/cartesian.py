@@ -4,12 +4,19 @@ from __future__ import annotations
 from __future__ import unicode_literals
 
 import math
+from typing import TYPE_CHECKING
+
 import traitlets
 
 from cesiumpy.base import _CesiumObject
 import cesiumpy.extension.geocode as geocode
 import cesiumpy.extension.shapefile as shapefile
 import cesiumpy.util.common as com
+from cesiumpy.util.serializer import encode_array
+from cesiumpy.util.trait import is_trusted
+
+if TYPE_CHECKING:
+    from cesiumpy.entities.cartesian_batch import CartesianBatch
 
 
 class _Cartesian(_CesiumObject):
@@ -17,6 +24,7 @@ class _Cartesian(_CesiumObject):
 
     # class property
     _is_array = False
+    _script_leaf = True
 
     def __init__(self):
         raise NotImplementedError
@@ -108,6 +116,11 @@ class Cartesian2(_Cartesian):
 class Cartesian3(_Cartesian):
     # Definitions
 
+    # components stored by SampledProperty, and their quantized units when
+    # packed in the Earth-fixed frame, centimeters
+    _components = ("x", "y", "z")
+    _quantization_scales = (1e2, 1e2, 1e2)
+
     x = traitlets.Float()
     y = traitlets.Float()
     z = traitlets.Float()
@@ -127,12 +140,23 @@ class Cartesian3(_Cartesian):
 
         self._is_degrees: bool = degrees
 
-        if degrees:
+        if degrees and not is_trusted():
             com.validate_longitude(x, key="x")
             com.validate_latitude(y, key="y")
 
     # Methods
 
+    def generate_script(self, widget=None) -> str:
+        # read trait values directly, getattr through the traitlets descriptor
+        # dominates the cost of scripts of many positions
+        values = self._trait_values
+        x, y, z = values["x"], values["y"], values["z"]
+        if values["_is_degrees"]:
+            if getattr(widget, "_fixed_frame", False):
+                return self.to_fixed_frame().generate_script(widget)
+            return f"Cesium.Cartesian3.fromDegrees({x}, {y}, {z})"
+        return f"new Cesium.Cartesian3({x}, {y}, {z})"
+
     def __eq__(self, other: Cartesian3) -> bool:
         """
         Return True if two vectors are equal.
@@ -207,6 +231,19 @@ class Cartesian3(_Cartesian):
             z=self.x * other.y - self.y * other.x,
         )
 
+    def to_fixed_frame(self) -> Cartesian3:
+        """
+        Return this position in the Earth-fixed frame, computed in Python
+        instead of by Cesium.Cartesian3.fromDegrees in the browser.
+        """
+
+        if not self._is_degrees:
+            return self
+
+        from cesiumpy.math.geodesy import geodetic_to_ecef
+
+        return Cartesian3(*geodetic_to_ecef(self.x, self.y, self.z).tolist())
+
     def __repr__(self) -> str:
         """
         Return string representation of Cartesian3.
@@ -225,18 +262,34 @@ class Cartesian3(_Cartesian):
 
     @classmethod
     def fromDegreesArray(cls, x) -> Cartesian3Array:
+        import numpy as np
+
         # convert shaply.Polygon to coordinateslist
         x = shapefile._maybe_shapely_polygon(x)
         x = shapefile._maybe_shapely_line(x)
-        x = geocode._maybe_geocode(x, height=0)
-
-        if com.is_listlike_2elem(x):
-            x = com.flatten_list_of_listlike([(i[0], i[1], 0.0) for i in x])
-
-        elif com.is_listlike_3elem(x):
-            x = com.flatten_list_of_listlike(x)
 
-        return Cartesian3Array(x)
+        # numeric inputs are converted at once, others may contain locations
+        try:
+            values = np.asarray(x)
+        except ValueError:
+            values = None
+        if values is None or values.dtype.kind not in "biuf":
+            x = geocode._maybe_geocode(x, height=0)
+            if com.is_listlike_2elem(x) or com.is_listlike_3elem(x):
+                # rows may have both 2 and 3 elements after geocoding
+                x = [(*i[:2], i[2] if len(i) == 3 else 0.0) for i in x]
+            return Cartesian3Array(x)
+
+        pairs = values.ndim == 2 and values.shape[1] == 2
+        if not isinstance(x, np.ndarray):
+            if pairs:
+                # lon, lat pairs are placed at height 0
+                x = [v for lon, lat in x for v in (lon, lat, 0.0)]
+            return Cartesian3Array(x)
+
+        if pairs:
+            values = np.column_stack([values, np.zeros(len(values))])
+        return Cartesian3Array(values)
 
     @classmethod
     def maybe(cls, x, degrees=False):
@@ -244,10 +297,12 @@ class Cartesian3(_Cartesian):
         if isinstance(x, Cartesian3):
             return x
 
-        x = shapefile._maybe_shapely_point(x)
+        # trusted coordinates are neither shapely instances nor locations
+        if not is_trusted():
+            x = shapefile._maybe_shapely_point(x)
 
-        # currently, only Cartesian3 tries to geocode passed loc
-        x = geocode._maybe_geocode(x, height=0)
+            # currently, only Cartesian3 tries to geocode passed loc
+            x = geocode._maybe_geocode(x, height=0)
         if com.is_listlike(x):
             if len(x) == 3:
                 return Cartesian3(*x, degrees=degrees)
@@ -258,19 +313,118 @@ class Cartesian3(_Cartesian):
         return x
 
 
+# units of quantized positions, micro degrees and centimeters
+QUANTIZATION_SCALES = (1e6, 1e6, 1e2)
+
+
 class Cartesian3Array(_Cartesian):
+    """
+    Array of positions in degrees, as flat longitude, latitude and height
+    values. Values given as list are kept as they are, and arrays of shape
+    (N, 3) or (3N,) which are already float64 and contiguous are stored
+    without copy.
+
+    Parameters
+    ----------
+
+    x: list-like
+        Flat longitude, latitude and height values, or their rows.
+    """
+
     _is_array = True
 
     def __init__(self, x):
         if isinstance(x, Cartesian3Array):
-            x = x.x
+            x = x.x if x._values is None else x._values
+        self.x = x
 
-        self.x = com.validate_listlike_lonlatalt(x, "x")
         # currently, array always be degrees
         self._is_degrees = True
 
+    # Properties
+
+    @property
+    def x(self) -> list:
+        """Flat longitude, latitude and height values"""
+        if self._x is not None:
+            return self._x
+        return self._values.reshape(-1).tolist()
+
+    @x.setter
+    def x(self, x) -> None:
+        import numpy as np
+
+        values = com.validate_listlike_lonlatalt(x, "x")
+        if isinstance(x, np.ndarray):
+            self._x, self._values = None, values
+        else:
+            # lists are written as they are, keeping integers
+            if len(x) and com.is_listlike(x[0]):
+                x = [v for row in x for v in row]
+            self._x, self._values = list(x) if isinstance(x, tuple) else x, None
+
+    @property
+    def values(self):
+        """
+        Positions as float64 array of shape (N, 3), the stored array, or an
+        array built from values given as list.
+        """
+        import numpy as np
+
+        if self._values is not None:
+            return self._values
+        return np.array(self._x, dtype=np.float64).reshape(-1, 3)
+
+    # Methods
+
+    def generate_script(self, widget=None) -> str:
+        if getattr(widget, "_fixed_frame", False):
+            return self.to_fixed_frame().generate_script(widget)
+
+        encoding = getattr(widget, "_array_encoding", None)
+        if encoding is None:
+            return self.script
+        return "Cesium.Cartesian3.fromDegreesArrayHeights({x})".format(
+            x=encode_array(self.values, encoding, scales=QUANTIZATION_SCALES)
+        )
+
     def __len__(self):
-        return len(self.x)
+        return len(self.x) if self._values is None else self._values.size
+
+    def _script_fingerprint(self):
+        # values are modified in place through .x or .values
+        if self._values is None:
+            return tuple(self._x)
+        return self._values.tobytes()
+
+    def simplify(self, tolerance: float, closed: bool = False) -> Cartesian3Array:
+        """
+        Return positions simplified by the Douglas-Peucker algorithm, see
+        cesiumpy.math.simplify.simplify_positions.
+
+        Parameters
+        ----------
+
+        tolerance: float
+            Largest distance in meters between removed positions and the
+            simplified line.
+        closed: bool, default False
+            Whether positions form a ring, such as a polygon hierarchy.
+        """
+
+        from cesiumpy.math.simplify import simplify_positions
+
+        return Cartesian3Array(simplify_positions(self.values, tolerance, closed))
+
+    def to_fixed_frame(self) -> CartesianBatch:
+        """
+        Return positions in the Earth-fixed frame as CartesianBatch, computed
+        in Python instead of by Cesium in the browser.
+        """
+
+        from cesiumpy.entities.cartesian_batch import CartesianBatch
+
+        return CartesianBatch.from_degrees(*self.values.T)
 
     def __repr__(self):
         rep = """Cartesian3.fromDegreesArrayHeights({x})"""
@@ -0,0 +1,213 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+from typing import List, Union
+
+import numpy as np
+
+import cesiumpy.entities.cartesian as cartesian
+from cesiumpy.orientation import Quaternion
+from cesiumpy.util.serializer import encode_array
+
+# units of quantized coordinates, centimeters
+QUANTIZATION_SCALES = (1e2, 1e2, 1e2)
+
+
+class CartesianBatch(cartesian._Cartesian):
+    """
+    Batch of Cartesian3 vectors, stored as contiguous float64 array of shape
+    (N, 3), with vectorized algebra. Operands may be batches of the same
+    length, single Cartesian3 or arrays broadcast against the batch.
+
+    Parameters
+    ----------
+
+    values: array-like
+        Vectors of shape (N, 3), or a list of Cartesian3.
+    """
+
+    # Constructor
+
+    def __init__(self, values) -> None:
+        if isinstance(values, CartesianBatch):
+            values = values.values
+        elif isinstance(values, list) and all(
+            isinstance(v, cartesian.Cartesian3) for v in values
+        ):
+            values = [(v.x, v.y, v.z) for v in values]
+
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != 3:
+            msg = "values must be an array of shape (N, 3): {shape}"
+            raise ValueError(msg.format(shape=values.shape))
+
+        self.values = values
+
+    # Properties
+
+    @property
+    def script(self) -> str:
+        return "Cesium.Cartesian3.unpackArray({x})".format(
+            x=self.values.reshape(-1).tolist()
+        )
+
+    # Methods
+
+    def generate_script(self, widget=None) -> str:
+        encoding = getattr(widget, "_array_encoding", None)
+        if encoding is None:
+            return self.script
+        return "Cesium.Cartesian3.unpackArray({x})".format(
+            # meters from the center of the Earth
+            x=encode_array(
+                self.values, encoding, scales=QUANTIZATION_SCALES, float32=False
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _script_fingerprint(self) -> bytes:
+        return self.values.tobytes()
+
+    def __getitem__(self, key) -> Union[cartesian.Cartesian3, CartesianBatch]:
+        if isinstance(key, (int, np.integer)):
+            return cartesian.Cartesian3(*self.values[key].tolist())
+        return CartesianBatch(self.values[key])
+
+    def __iter__(self):
+        for x, y, z in self.values.tolist():
+            yield cartesian.Cartesian3(x, y, z)
+
+    def __repr__(self) -> str:
+        return f"CartesianBatch({self.values.tolist()})"
+
+    def __add__(self, other) -> CartesianBatch:
+        return CartesianBatch(self.values + _as_array(other))
+
+    def __sub__(self, other) -> CartesianBatch:
+        return CartesianBatch(self.values - _as_array(other))
+
+    def __neg__(self) -> CartesianBatch:
+        return CartesianBatch(-self.values)
+
+    def __mul__(self, scalar) -> CartesianBatch:
+        """
+        Return vectors multiplied by scalar, or by one scalar per vector.
+        """
+
+        return CartesianBatch(self.values * _as_scalars(scalar))
+
+    def __truediv__(self, scalar) -> CartesianBatch:
+        """
+        Return vectors divided by scalar, or by one scalar per vector.
+        """
+
+        return CartesianBatch(self.values / _as_scalars(scalar))
+
+    def magnitude(self) -> np.ndarray:
+        """
+        Return magnitudes of vectors.
+        """
+
+        return np.sqrt(np.einsum("ij,ij->i", self.values, self.values))
+
+    def normalized(self) -> CartesianBatch:
+        """
+        Return normalized vectors.
+        """
+
+        return self / self.magnitude()
+
+    def dot(self, other) -> np.ndarray:
+        """
+        Return dot products of vectors.
+        """
+
+        values, other = np.broadcast_arrays(self.values, _as_array(other))
+        return np.einsum("ij,ij->i", values, other)
+
+    def cross(self, other) -> CartesianBatch:
+        """
+        Return cross products of vectors.
+        """
+
+        return CartesianBatch(np.cross(self.values, _as_array(other)))
+
+    def angle_with(self, other) -> np.ndarray:
+        """
+        Return angles between vectors in radians.
+        """
+
+        other = CartesianBatch(np.broadcast_to(_as_array(other), self.values.shape))
+        # more accurate than acos for nearly parallel vectors
+        return np.arctan2(self.cross(other).magnitude(), self.dot(other))
+
+    def rotate(self, quaternion) -> CartesianBatch:
+        """
+        Return vectors rotated by quaternions, as
+        Cesium.Matrix3.fromQuaternion followed by multiplyByVector.
+
+        Parameters
+        ----------
+
+        quaternion: Quaternion or array-like
+            Quaternion, or components x, y, z and w of one quaternion or of
+            one quaternion per vector, of shape (4,) or (N, 4).
+        """
+
+        q = _as_quaternions(quaternion)
+        axis, w = q[..., :3], q[..., 3:]
+
+        # v + 2w (u x v) + 2u x (u x v), for unit quaternions
+        t = 2.0 * np.cross(axis, self.values)
+        return CartesianBatch(self.values + w * t + np.cross(axis, t))
+
+    def to_cartesians(self) -> List[cartesian.Cartesian3]:
+        return list(self)
+
+    # Class methods
+
+    @classmethod
+    def from_degrees(cls, lon, lat, height=0.0) -> CartesianBatch:
+        """
+        Return positions in the Earth-fixed frame, see
+        cesiumpy.math.geodesy.geodetic_to_ecef.
+        """
+
+        from cesiumpy.math.geodesy import geodetic_to_ecef
+
+        return cls(geodetic_to_ecef(lon, lat, height).reshape(-1, 3))
+
+
+def _as_array(x) -> np.ndarray:
+    if isinstance(x, CartesianBatch):
+        return x.values
+    if isinstance(x, cartesian.Cartesian3):
+        if x._is_degrees:
+            msg = "Cartesian3 in degrees must be converted by to_fixed_frame: {x}"
+            raise ValueError(msg.format(x=x))
+        return np.array([x.x, x.y, x.z])
+    return np.asarray(x, dtype=np.float64)
+
+
+def _as_scalars(x) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    # one scalar per vector
+    return x[:, np.newaxis] if x.ndim == 1 else x
+
+
+def _as_quaternions(x) -> np.ndarray:
+    if isinstance(x, Quaternion):
+        if type(x) is not Quaternion:
+            # products and conversions are only computed by Cesium
+            msg = "Unable to rotate by a quaternion computed in the browser: {x}"
+            raise ValueError(msg.format(x=x))
+        x = [x.x, x.y, x.z, x.w]
+
+    x = np.asarray(x, dtype=np.float64)
+    if x.shape[-1] != 4:
+        msg = "quaternion must have 4 components x, y, z and w: {shape}"
+        raise ValueError(msg.format(shape=x.shape))
+    return x
@@ -15,6 +15,7 @@ from cesiumpy.entities.material import Material
 
 class Color(Material):
     _props = ["red", "green", "blue", "alpha"]
+    _script_leaf = True
 
     red = traitlets.Float(min=0.0, max=1.0)
     green = traitlets.Float(min=0.0, max=1.0)
@@ -12,7 +12,9 @@ import cesiumpy.constants as constants
 import cesiumpy.time as time
 import cesiumpy.position as position
 from cesiumpy.path_graphics import PathGraphics
+from cesiumpy.distance_display_condition import DistanceDisplayCondition
 import cesiumpy.util.common as com
+from cesiumpy.util.serializer import ObjectSerializer
 from cesiumpy.util.trait import MaybeTrait
 
 
@@ -44,6 +46,7 @@ class _CesiumEntity(_CesiumObject):
         "pixel_offset_scale_by_distance",
         "availability",
         "path",
+        "distance_display_condition",
     ]
 
     width = traitlets.Float(allow_none=True)
@@ -78,6 +81,15 @@ class _CesiumEntity(_CesiumObject):
         klass=time.TimeIntervalCollection, allow_none=True
     )
     path = traitlets.Instance(klass=PathGraphics, allow_none=True)
+    distance_display_condition = traitlets.Instance(
+        klass=DistanceDisplayCondition, allow_none=True
+    )
+
+    # number of vertices removed by simplification, see _simplify
+    removed_vertices = 0
+
+    # identifies the entity in the page, see Viewer.diff_script
+    id = traitlets.Unicode(default_value=None, allow_none=True)
 
     position = traitlets.Union(
         trait_types=[
@@ -118,6 +130,7 @@ class _CesiumEntity(_CesiumObject):
         name=None,
         availability=None,
         path=None,
+        distance_display_condition=None,
     ) -> None:
         self.width = width
         self.height = height
@@ -153,6 +166,7 @@ class _CesiumEntity(_CesiumObject):
 
         self.availability = availability
         self.path = path
+        self.distance_display_condition = distance_display_condition
 
         self.pixel_offset_scale_by_distance = com.notimplemented(
             pixel_offset_scale_by_distance
@@ -170,6 +184,7 @@ class _CesiumEntity(_CesiumObject):
     @property
     def _property_dict(self):
         props = collections.OrderedDict()
+        props["id"] = self.id
         props["name"] = self.name
         props["position"] = self.position
         props["orientation"] = self.orientation
@@ -181,8 +196,58 @@ class _CesiumEntity(_CesiumObject):
         props[self._klass] = childs
         return props
 
+    # Class methods
+
+    @classmethod
+    def _build_serializer(cls):
+        # must be consistent with _property_dict
+        if cls._property_dict is not _CesiumEntity._property_dict:
+            return None
+        if not isinstance(cls._klass, str) or not isinstance(cls._props, list):
+            return None
+
+        childs = ObjectSerializer(cls._props + cls._common_props)
+        return ObjectSerializer(
+            ["id", "name", "position", "orientation", (cls._klass, childs)]
+        )
+
+    # Private methods
+
+    def _script_fields(self, widget=None):
+        """
+        Return (name, script) of the top-level properties, or None when the
+        class has no compiled serializer.
+        """
+
+        serializer = self._get_serializer()
+        if serializer is None:
+            return None
+        return serializer.serialize_fields(self, widget=widget)
+
+    def _simplify(self, positions, tolerance, closed=False):
+        """
+        Return positions simplified within tolerance in meters, and record
+        the number of removed vertices in removed_vertices.
+        """
+
+        if tolerance is None:
+            return positions
+
+        simplified = positions.simplify(tolerance, closed=closed)
+        self.removed_vertices = len(positions.values) - len(simplified.values)
+        return simplified
+
     # Methods
 
+    def simplified(self, tolerance):
+        """
+        Return a copy whose positions are simplified within tolerance in
+        meters, only supported by entities defined by arrays of positions.
+        """
+
+        msg = "Unable to simplify {klass}"
+        raise NotImplementedError(msg.format(klass=self.__class__.__name__))
+
     def copy(self):
         kwds = {}
         for key in (
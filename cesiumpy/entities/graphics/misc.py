@@ -520,6 +520,8 @@ class Wall(_CesiumEntity):
         A numeric Property specifying the width of the outline.
     granularity : float, default cesiumpy.math.RADIANS_PER_DEGREE
         A numeric Property specifying the angular distance between each latitude and longitude point.
+    distance_display_condition : DistanceDisplayCondition, optional
+        A Property specifying at what distance from the camera that this wall will be displayed.
     """
 
     _klass = "wall"
@@ -540,6 +542,7 @@ class Wall(_CesiumEntity):
         outline_width=None,
         granularity=None,
         name=None,
+        distance_display_condition=None,
     ):
         # Wall uses "positions", not "position"
         super(Wall, self).__init__(
@@ -551,6 +554,7 @@ class Wall(_CesiumEntity):
             outline_width=outline_width,
             granularity=granularity,
             name=name,
+            distance_display_condition=distance_display_condition,
         )
 
         # ToDo: Support fromDegreesArrayHeights
@@ -571,6 +575,19 @@ class Wall(_CesiumEntity):
         self.maximum_heights = _init_heights(maximum_heights, key="maximum_heights")
         self.minimum_heights = _init_heights(minimum_heights, key="minimum_heights")
 
+    def simplified(self, tolerance):
+        from cesiumpy.math.simplify import simplify_mask
+
+        # heights are given per position, and are removed with them
+        mask = simplify_mask(self.positions.values, tolerance).tolist()
+
+        wall = self.copy()
+        wall.positions = cartesian.Cartesian3Array(self.positions.values[mask])
+        wall.maximum_heights = [h for h, k in zip(self.maximum_heights, mask) if k]
+        wall.minimum_heights = [h for h, k in zip(self.minimum_heights, mask) if k]
+        wall.removed_vertices = mask.count(False)
+        return wall
+
 
 class Rectangle(_CesiumEntity):
     """
@@ -698,6 +715,10 @@ class Polygon(_CesiumEntity):
         A numeric Property specifying the angular distance between each latitude and longitude point.
     per_position_height : bool, default False
         A boolean specifying whether or not the the height of each position is used.
+    simplify : float, optional
+        Tolerance in meters to simplify the hierarchy with, the number of removed positions is stored in removed_vertices.
+    distance_display_condition : DistanceDisplayCondition, optional
+        A Property specifying at what distance from the camera that this polygon will be displayed.
     """
 
     _klass = "polygon"
@@ -720,6 +741,8 @@ class Polygon(_CesiumEntity):
         granularity=None,
         per_position_height=None,
         name=None,
+        simplify=None,
+        distance_display_condition=None,
     ):
         super(Polygon, self).__init__(
             height=height,
@@ -733,11 +756,18 @@ class Polygon(_CesiumEntity):
             st_rotation=st_rotation,
             granularity=granularity,
             name=name,
+            distance_display_condition=distance_display_condition,
         )
 
-        self.hierarchy = cartesian.Cartesian3.fromDegreesArray(hierarchy)
+        hierarchy = cartesian.Cartesian3.fromDegreesArray(hierarchy)
+        self.hierarchy = self._simplify(hierarchy, simplify, closed=True)
         self.per_position_height = per_position_height
 
+    def simplified(self, tolerance):
+        polygon = self.copy()
+        polygon.hierarchy = polygon._simplify(self.hierarchy, tolerance, closed=True)
+        return polygon
+
     @property
     def positions(self):
         # for compat
@@ -70,4 +70,4 @@ class Point(_CesiumEntity):
             **kwargs,
         )
 
-        self.pixel_size = pixel_size if pixel_size is not None else 10
+        self.pixel_size = pixel_size if pixel_size is not None else 10.0
@@ -31,6 +31,10 @@ class Polyline(_CesiumEntity):
         A Property specifying the material used to draw the polyline.
     granularity : float, default cesiumpy.math.RADIANS_PER_DEGREE
         A numeric Property specifying the angular distance between each latitude and longitude if follow_surface is true.
+    simplify : float, optional
+        Tolerance in meters to simplify positions with, the number of removed positions is stored in removed_vertices.
+    distance_display_condition : DistanceDisplayCondition, optional
+        A Property specifying at what distance from the camera that this polyline will be displayed.
     """
 
     # Definitions
@@ -59,6 +63,8 @@ class Polyline(_CesiumEntity):
         material=None,
         granularity=None,
         name=None,
+        simplify=None,
+        distance_display_condition=None,
     ) -> None:
         super().__init__(
             width=width,
@@ -66,16 +72,23 @@ class Polyline(_CesiumEntity):
             material=material,
             granularity=granularity,
             name=name,
+            distance_display_condition=distance_display_condition,
         )
 
         if not isinstance(positions, cartesian.Cartesian3Array):
-            self.positions = cartesian.Cartesian3.fromDegreesArray(positions)
-        else:
-            self.positions = positions
+            positions = cartesian.Cartesian3.fromDegreesArray(positions)
+        self.positions = self._simplify(positions, simplify)
 
         self.arc_type = arc_type
         self.follow_surface = follow_surface
 
+    # Methods
+
+    def simplified(self, tolerance):
+        polyline = self.copy()
+        polyline.positions = polyline._simplify(self.positions, tolerance)
+        return polyline
+
 
 class PolylineArrowMaterialProperty(Material):
     # Definitions
@@ -95,6 +95,7 @@ class CustomPatternSensor(_CesiumEntity):
     def _property_dict(self) -> dict:
         props = collections.OrderedDict()
 
+        props["id"] = self.id
         props["name"] = self.name
         props["position"] = self.position
         props["orientation"] = self.orientation
@@ -99,6 +99,7 @@ class RectangularSensor(_CesiumEntity):
     def _property_dict(self) -> dict:
         props = collections.OrderedDict()
 
+        props["id"] = self.id
         props["name"] = self.name
         props["position"] = self.position
         props["orientation"] = self.orientation
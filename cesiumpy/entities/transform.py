@@ -23,6 +23,13 @@ class Transforms(_CesiumObject):
         script = "Cesium.Transforms.{transform}({script})"
         return script.format(transform=self.transform, script=self.origin.script)
 
+    def generate_script(self, widget=None):
+        # origin may be written in the Earth-fixed frame
+        script = "Cesium.Transforms.{transform}({script})"
+        return script.format(
+            transform=self.transform, script=self.origin.generate_script(widget)
+        )
+
     @classmethod
     def eastNorthUpToFixedFrame(cls, origin):
         """
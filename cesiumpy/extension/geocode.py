@@ -2,12 +2,20 @@
 
 from __future__ import unicode_literals
 
-from geopy.geocoders.geocodefarm import GeocodeFarm
-
 import cesiumpy.util.common as com
 
 # ToDo: want different geocoders?
-_GEOCODER = GeocodeFarm()
+# created on first use, as importing geopy is slow
+_GEOCODER = None
+
+
+def _get_geocoder():
+    global _GEOCODER
+    if _GEOCODER is None:
+        from geopy.geocoders.geocodefarm import GeocodeFarm
+
+        _GEOCODER = GeocodeFarm()
+    return _GEOCODER
 
 
 def _maybe_geocode(x, height=None):
@@ -16,7 +24,7 @@ def _maybe_geocode(x, height=None):
     height can be used to create base data for Cartesian3
     """
     if isinstance(x, str):
-        loc = _GEOCODER.geocode(x)
+        loc = _get_geocoder().geocode(x)
         if loc is not None:
             if height is None:
                 # return x, y order
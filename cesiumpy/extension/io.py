@@ -4,11 +4,23 @@ from __future__ import unicode_literals
 
 import json
 
+from cesiumpy.extension.lod import LOD_LEVELS, to_lod
 from cesiumpy.extension.shapefile import to_entity
 import cesiumpy.util.common as com
 
 
-def read_geojson(path):
+def _maybe_lod(entities, lod):
+    if lod is None or lod is False:
+        return entities
+    return to_lod(entities, levels=LOD_LEVELS if lod is True else lod)
+
+
+def read_geojson(path, simplify=None, lod=None):
+    """
+    Read GeoJSON features as entities, simplifying lines and polygons within
+    simplify meters if specified. Lines and polygons are converted to levels
+    of detail if lod is True or a list of levels, see extension.lod.to_lod.
+    """
     sp = com._check_package("shapely.geometry")
 
     with open(path) as f:
@@ -18,15 +30,20 @@ def read_geojson(path):
     results = []
     for feature in geos["features"]:
         shape = sp.shape(feature["geometry"])
-        result = to_entity(shape)
+        result = to_entity(shape, simplify=simplify)
         if isinstance(result, list):
             results.extend(result)
         else:
             results.append(result)
-    return results
+    return _maybe_lod(results, lod)
 
 
-def read_shape(path):
+def read_shape(path, simplify=None, lod=None):
+    """
+    Read shapefile records as entities, simplifying lines and polygons within
+    simplify meters if specified. Lines and polygons are converted to levels
+    of detail if lod is True or a list of levels, see extension.lod.to_lod.
+    """
     sp = com._check_package("shapely.geometry")
     fiona = com._check_package("fiona")
 
@@ -34,9 +51,9 @@ def read_shape(path):
     with fiona.open(path) as f:
         for shape in f:
             shape = sp.shape(shape["geometry"])
-            result = to_entity(shape)
+            result = to_entity(shape, simplify=simplify)
             if isinstance(result, list):
                 results.extend(result)
             else:
                 results.append(result)
-    return results
+    return _maybe_lod(results, lod)
@@ -0,0 +1,70 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+from cesiumpy.distance_display_condition import DistanceDisplayCondition
+import cesiumpy.util.common as com
+
+# (near, tolerance) in meters of each level of detail, from the closest one.
+# tolerances are a thousandth of near distances, around a pixel at the default
+# field of view, and the closest level keeps all the vertices
+LOD_LEVELS = (
+    (0.0, None),
+    (1.0e5, 100.0),
+    (1.0e6, 1000.0),
+    (1.0e7, 10000.0),
+)
+
+
+def to_lod(entities, levels=LOD_LEVELS):
+    """
+    Return entities at several levels of detail. Each entity defined by an
+    array of positions, such as Polyline, Polygon or Wall, is replaced by its
+    simplified copies which are displayed within successive camera distances,
+    so that the browser only tessellates the level that it displays. Levels
+    which have the same number of vertices are merged. Other entities are
+    returned as they are.
+
+    Parameters
+    ----------
+
+    entities: entity or list of entities
+        Entities to convert.
+    levels: list of tuples, default LOD_LEVELS
+        Camera distance from which each level is displayed and its tolerance
+        in meters, or None to keep all the vertices, by increasing distance.
+    """
+
+    if not com.is_listlike(entities):
+        entities = [entities]
+
+    nears = [near for near, _ in levels]
+    if not nears or any(a >= b for a, b in zip(nears[:-1], nears[1:])):
+        msg = "levels must be sorted by increasing distance: {levels}"
+        raise ValueError(msg.format(levels=levels))
+
+    results = []
+    for entity in entities:
+        try:
+            versions = [
+                entity.copy() if tolerance is None else entity.simplified(tolerance)
+                for _, tolerance in levels
+            ]
+        except NotImplementedError:
+            results.append(entity)
+            continue
+
+        # the first of versions having the same number of vertices is kept
+        kept = []
+        for near, version in zip(nears, versions):
+            if kept and len(version.positions.values) == len(
+                kept[-1][1].positions.values
+            ):
+                continue
+            kept.append((near, version))
+
+        fars = [near for near, _ in kept[1:]] + [None]
+        for (near, version), far in zip(kept, fars):
+            version.distance_display_condition = DistanceDisplayCondition(near, far)
+            results.append(version)
+    return results
@@ -3,6 +3,7 @@
 from __future__ import unicode_literals
 
 import itertools
+import sys
 
 import cesiumpy
 
@@ -10,30 +11,14 @@ import cesiumpy
 # Shapely Functions
 # --------------------------------------------------
 
-try:
-    import shapely.geometry
 
-    ShapelyPoint = shapely.geometry.Point
-    ShapelyMultiPoint = shapely.geometry.MultiPoint
-    ShapelyLineString = shapely.geometry.LineString
-    ShapelyMultiLineString = shapely.geometry.MultiLineString
-    ShapelyLinearRing = shapely.geometry.LinearRing
-    ShapelyPolygon = shapely.geometry.Polygon
-    ShapelyMultiPolygon = shapely.geometry.MultiPolygon
-
-
-except ImportError:
-
-    class DummyClass(object):
-        pass
-
-    ShapelyPoint = DummyClass
-    ShapelyMultiPoint = DummyClass
-    ShapelyLineString = DummyClass
-    ShapelyMultiLineString = DummyClass
-    ShapelyLinearRing = DummyClass
-    ShapelyPolygon = DummyClass
-    ShapelyMultiPolygon = DummyClass
+def _shapely_geometry():
+    """
+    Return shapely.geometry if it has been imported, otherwise None.
+    shapely is not imported here, as importing it is slow and its instances
+    can only exist once it is imported.
+    """
+    return sys.modules.get("shapely.geometry")
 
 
 # --------------------------------------------------
@@ -41,30 +26,36 @@ except ImportError:
 # --------------------------------------------------
 
 
-def to_entity(shape):
+def to_entity(shape, simplify=None):
     """
     Convert shapely.geometry to corresponding entities.
     Result may be a list if geometry is consists from multiple instances.
+    Lines and polygons are simplified within simplify meters if specified.
     """
-    if isinstance(shape, ShapelyMultiPoint):
+    msg = "Unable to convert to cesiumpy entity: {shape}".format(shape=shape)
+
+    geometry = _shapely_geometry()
+    if geometry is None:
+        raise ValueError(msg)
+
+    if isinstance(shape, geometry.MultiPoint):
         return [cesiumpy.Point(position=e) for e in shape.geoms]
 
-    elif isinstance(shape, ShapelyPoint):
+    elif isinstance(shape, geometry.Point):
         return cesiumpy.Point(position=shape)
 
-    elif isinstance(shape, ShapelyMultiLineString):
-        return [cesiumpy.Polyline(positions=e) for e in shape.geoms]
+    elif isinstance(shape, geometry.MultiLineString):
+        return [cesiumpy.Polyline(positions=e, simplify=simplify) for e in shape.geoms]
 
-    elif isinstance(shape, (ShapelyLineString, ShapelyLinearRing)):
-        return cesiumpy.Polyline(positions=shape)
+    elif isinstance(shape, (geometry.LineString, geometry.LinearRing)):
+        return cesiumpy.Polyline(positions=shape, simplify=simplify)
 
-    elif isinstance(shape, ShapelyMultiPolygon):
-        return [cesiumpy.Polygon(hierarchy=e) for e in shape.geoms]
+    elif isinstance(shape, geometry.MultiPolygon):
+        return [cesiumpy.Polygon(hierarchy=e, simplify=simplify) for e in shape.geoms]
 
-    elif isinstance(shape, ShapelyPolygon):
-        return cesiumpy.Polygon(hierarchy=shape)
+    elif isinstance(shape, geometry.Polygon):
+        return cesiumpy.Polygon(hierarchy=shape, simplify=simplify)
 
-    msg = "Unable to convert to cesiumpy entity: {shape}".format(shape=shape)
     raise ValueError(msg)
 
 
@@ -74,29 +65,40 @@ def to_entity(shape):
 
 
 def _maybe_shapely_point(x):
-    if isinstance(x, ShapelyMultiPoint):
+    geometry = _shapely_geometry()
+    if geometry is None:
+        return x
+
+    if isinstance(x, geometry.MultiPoint):
         raise NotImplementedError(x)
-    elif isinstance(x, ShapelyPoint):
+    elif isinstance(x, geometry.Point):
         return list(x.coords[:][0])
     return x
 
 
 def _maybe_shapely_line(x):
-    if isinstance(x, ShapelyMultiLineString):
+    geometry = _shapely_geometry()
+    if geometry is None:
+        return x
+
+    if isinstance(x, geometry.MultiLineString):
         results = []
         for line in x:
             results.extend(list(itertools.chain(*[(*l, 0.0) for l in line.coords[:]])))
         return results
-    elif isinstance(x, (ShapelyLineString, ShapelyLinearRing)):
+    elif isinstance(x, (geometry.LineString, geometry.LinearRing)):
         return list(itertools.chain(*[(*l, 0.0) for l in x.coords[:]]))
     return x
 
 
 def _maybe_shapely_polygon(x):
-    if not isinstance(x, (ShapelyMultiPolygon, ShapelyPolygon)):
+    geometry = _shapely_geometry()
+    if geometry is None or not isinstance(
+        x, (geometry.MultiPolygon, geometry.Polygon)
+    ):
         return x
 
-    if isinstance(x, ShapelyPolygon):
+    if isinstance(x, geometry.Polygon):
         polygons = [x]
     else:
         polygons = x
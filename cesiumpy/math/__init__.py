@@ -1,3 +1,12 @@
 # Apache License 2.0
 
 from .converters import *  # noqa
+
+
+def __getattr__(name):
+    # these modules depend on numpy, which is slow to import
+    if name in ("geodesy", "interpolation", "simplify"):
+        import importlib
+
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,326 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from cesiumpy.math.converters import to_radians
+
+# positions are arrays whose last axis holds longitude, latitude and height,
+# or x, y and z in meters in the Earth-fixed frame of Cesium.Cartesian3
+
+# WGS84 ellipsoid, as Cesium.Ellipsoid.WGS84
+WGS84_A: float = 6378137.0
+WGS84_F: float = 1.0 / 298.257223563
+WGS84_B: float = WGS84_A * (1.0 - WGS84_F)
+WGS84_E2: float = WGS84_F * (2.0 - WGS84_F)
+
+# mean radius of WGS84, used by great circle distances
+MEAN_RADIUS: float = (2.0 * WGS84_A + WGS84_B) / 3.0
+
+
+def _angles(values, degrees: bool) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    return to_radians(values) if degrees else values
+
+
+# --------------------------------------------------
+# Geodetic and Earth-fixed coordinates
+# --------------------------------------------------
+
+
+def geodetic_to_ecef(lon, lat, height=0.0, degrees: bool = True) -> np.ndarray:
+    """
+    Convert geodetic positions to Earth-fixed coordinates, as
+    Cesium.Cartesian3.fromDegrees.
+
+    Parameters
+    ----------
+
+    lon: float or array-like
+        Longitudes.
+    lat: float or array-like
+        Latitudes.
+    height: float or array-like, default 0.0
+        Heights above the ellipsoid in meters.
+    degrees: bool, default True
+        Whether longitudes and latitudes are in degrees, otherwise radians.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Coordinates in meters, of the broadcast shape of inputs followed by 3.
+    """
+
+    lon = _angles(lon, degrees)
+    lat = _angles(lat, degrees)
+    height = np.asarray(height, dtype=np.float64)
+
+    sin_lat = np.sin(lat)
+    cos_lat = np.cos(lat)
+    # prime vertical radius of curvature
+    n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat**2)
+
+    x = (n + height) * cos_lat * np.cos(lon)
+    y = (n + height) * cos_lat * np.sin(lon)
+    z = (n * (1.0 - WGS84_E2) + height) * sin_lat
+    return np.stack(np.broadcast_arrays(x, y, z), axis=-1)
+
+
+def ecef_to_geodetic(xyz, degrees: bool = True) -> np.ndarray:
+    """
+    Convert Earth-fixed coordinates to geodetic positions, with the closed
+    form of Heikkinen which is accurate to the millimeter near the Earth.
+
+    Parameters
+    ----------
+
+    xyz: array-like
+        Coordinates in meters, whose last axis has length 3.
+    degrees: bool, default True
+        Whether to return longitudes and latitudes in degrees, otherwise
+        radians.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Longitudes, latitudes and heights in the last axis.
+    """
+
+    xyz = np.asarray(xyz, dtype=np.float64)
+    x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+
+    a2 = WGS84_A**2
+    b2 = WGS84_B**2
+    ep2 = (a2 - b2) / b2
+
+    p = np.hypot(x, y)
+    f = 54.0 * b2 * z**2
+    g = p**2 + (1.0 - WGS84_E2) * z**2 - WGS84_E2 * (a2 - b2)
+    c = WGS84_E2**2 * f * p**2 / g**3
+    s = np.cbrt(1.0 + c + np.sqrt(c**2 + 2.0 * c))
+    k = s + 1.0 + 1.0 / s
+    q_p = f / (3.0 * k**2 * g**2)
+    q = np.sqrt(1.0 + 2.0 * WGS84_E2**2 * q_p)
+    # the difference vanishes on the polar axis, where rounding may leave it
+    # slightly negative
+    r0 = -(q_p * WGS84_E2 * p) / (1.0 + q) + np.sqrt(
+        np.maximum(
+            0.5 * a2 * (1.0 + 1.0 / q)
+            - q_p * (1.0 - WGS84_E2) * z**2 / (q * (1.0 + q))
+            - 0.5 * q_p * p**2,
+            0.0,
+        )
+    )
+    u = np.hypot(p - WGS84_E2 * r0, z)
+    v = np.sqrt((p - WGS84_E2 * r0) ** 2 + (1.0 - WGS84_E2) * z**2)
+    z0 = b2 * z / (WGS84_A * v)
+
+    height = u * (1.0 - b2 / (WGS84_A * v))
+    lat = np.arctan2(z + ep2 * z0, p)
+    lon = np.arctan2(y, x)
+
+    if degrees:
+        lon, lat = np.degrees(lon), np.degrees(lat)
+    return np.stack([lon, lat, height], axis=-1)
+
+
+# --------------------------------------------------
+# Local frames
+# --------------------------------------------------
+
+
+def enu_rotation(lon, lat, degrees: bool = True) -> np.ndarray:
+    """
+    Return rotation matrices from east-north-up frames at the specified
+    positions to the Earth-fixed frame. Columns are east, north and up axes.
+
+    Parameters
+    ----------
+
+    lon: float or array-like
+        Longitudes of the origins.
+    lat: float or array-like
+        Latitudes of the origins.
+    degrees: bool, default True
+        Whether longitudes and latitudes are in degrees, otherwise radians.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Matrices of the broadcast shape of inputs followed by (3, 3).
+    """
+
+    lon = _angles(lon, degrees)
+    lat = _angles(lat, degrees)
+    lon, lat = np.broadcast_arrays(lon, lat)
+
+    sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    zero = np.zeros_like(lon)
+
+    east = np.stack([-sin_lon, cos_lon, zero], axis=-1)
+    north = np.stack([-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat], axis=-1)
+    up = np.stack([cos_lat * cos_lon, cos_lat * sin_lon, sin_lat], axis=-1)
+    return np.stack([east, north, up], axis=-1)
+
+
+def ned_rotation(lon, lat, degrees: bool = True) -> np.ndarray:
+    """
+    Return rotation matrices from north-east-down frames at the specified
+    positions to the Earth-fixed frame, see enu_rotation.
+    """
+
+    enu = enu_rotation(lon, lat, degrees=degrees)
+    return np.stack([enu[..., 1], enu[..., 0], -enu[..., 2]], axis=-1)
+
+
+def east_north_up_to_fixed_frame(
+    lon, lat, height=0.0, degrees: bool = True
+) -> np.ndarray:
+    """
+    Return 4x4 transformation matrices from east-north-up frames centered at
+    the specified positions to the Earth-fixed frame, as
+    Cesium.Transforms.eastNorthUpToFixedFrame.
+    """
+
+    rotation = enu_rotation(lon, lat, degrees=degrees)
+    origin = geodetic_to_ecef(lon, lat, height, degrees=degrees)
+    return _transformation(rotation, origin)
+
+
+def north_east_down_to_fixed_frame(
+    lon, lat, height=0.0, degrees: bool = True
+) -> np.ndarray:
+    """
+    Return 4x4 transformation matrices from north-east-down frames centered at
+    the specified positions to the Earth-fixed frame, as
+    Cesium.Transforms.northEastDownToFixedFrame.
+    """
+
+    rotation = ned_rotation(lon, lat, degrees=degrees)
+    origin = geodetic_to_ecef(lon, lat, height, degrees=degrees)
+    return _transformation(rotation, origin)
+
+
+def _transformation(rotation: np.ndarray, origin: np.ndarray) -> np.ndarray:
+    shape = np.broadcast_shapes(rotation.shape[:-2], origin.shape[:-1])
+    matrix = np.zeros(shape + (4, 4))
+    matrix[..., :3, :3] = rotation
+    matrix[..., :3, 3] = origin
+    matrix[..., 3, 3] = 1.0
+    return matrix
+
+
+def ecef_to_enu(xyz, lon, lat, height=0.0, degrees: bool = True) -> np.ndarray:
+    """
+    Convert Earth-fixed coordinates to east, north and up offsets in meters
+    from the specified origins.
+
+    Parameters
+    ----------
+
+    xyz: array-like
+        Coordinates in meters, whose last axis has length 3.
+    lon, lat, height: float or array-like
+        Geodetic positions of the origins, broadcast against xyz.
+    degrees: bool, default True
+        Whether longitudes and latitudes are in degrees, otherwise radians.
+    """
+
+    xyz = np.asarray(xyz, dtype=np.float64)
+    rotation = enu_rotation(lon, lat, degrees=degrees)
+    offset = xyz - geodetic_to_ecef(lon, lat, height, degrees=degrees)
+    # the inverse of a rotation is its transpose
+    return np.einsum("...ji,...j->...i", rotation, offset)
+
+
+def enu_to_ecef(enu, lon, lat, height=0.0, degrees: bool = True) -> np.ndarray:
+    """
+    Convert east, north and up offsets in meters from the specified origins
+    to Earth-fixed coordinates, see ecef_to_enu.
+    """
+
+    enu = np.asarray(enu, dtype=np.float64)
+    rotation = enu_rotation(lon, lat, degrees=degrees)
+    origin = geodetic_to_ecef(lon, lat, height, degrees=degrees)
+    return origin + np.einsum("...ij,...j->...i", rotation, enu)
+
+
+def ecef_to_ned(xyz, lon, lat, height=0.0, degrees: bool = True) -> np.ndarray:
+    """
+    Convert Earth-fixed coordinates to north, east and down offsets in meters
+    from the specified origins, see ecef_to_enu.
+    """
+
+    enu = ecef_to_enu(xyz, lon, lat, height, degrees=degrees)
+    return np.stack([enu[..., 1], enu[..., 0], -enu[..., 2]], axis=-1)
+
+
+def ned_to_ecef(ned, lon, lat, height=0.0, degrees: bool = True) -> np.ndarray:
+    """
+    Convert north, east and down offsets in meters from the specified origins
+    to Earth-fixed coordinates, see ecef_to_enu.
+    """
+
+    ned = np.asarray(ned, dtype=np.float64)
+    enu = np.stack([ned[..., 1], ned[..., 0], -ned[..., 2]], axis=-1)
+    return enu_to_ecef(enu, lon, lat, height, degrees=degrees)
+
+
+# --------------------------------------------------
+# Analytics
+# --------------------------------------------------
+
+
+def great_circle_distance(
+    lon1, lat1, lon2, lat2, degrees: bool = True, radius: float = MEAN_RADIUS
+) -> np.ndarray:
+    """
+    Return great circle distances in meters between positions on a sphere of
+    the specified radius, by the haversine formula.
+
+    Parameters
+    ----------
+
+    lon1, lat1: float or array-like
+        Longitudes and latitudes of the first positions.
+    lon2, lat2: float or array-like
+        Longitudes and latitudes of the second positions.
+    degrees: bool, default True
+        Whether longitudes and latitudes are in degrees, otherwise radians.
+    radius: float, default MEAN_RADIUS
+        Radius of the sphere in meters.
+    """
+
+    lon1, lat1 = _angles(lon1, degrees), _angles(lat1, degrees)
+    lon2, lat2 = _angles(lon2, degrees), _angles(lat2, degrees)
+
+    h = (
+        np.sin((lat2 - lat1) / 2.0) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2
+    )
+    return 2.0 * radius * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+
+
+def bounding_sphere(xyz) -> Tuple[np.ndarray, float]:
+    """
+    Return the center and the radius of a sphere enclosing Earth-fixed
+    coordinates, centered on their axis aligned bounding box.
+
+    Parameters
+    ----------
+
+    xyz: array-like
+        Coordinates in meters of shape (N, 3).
+    """
+
+    xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+    center = (xyz.min(axis=0) + xyz.max(axis=0)) / 2.0
+    radius = float(np.sqrt(((xyz - center) ** 2).sum(axis=1).max()))
+    return center, radius
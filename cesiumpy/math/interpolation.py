@@ -0,0 +1,288 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+import numpy as np
+
+# interpolations of Cesium.SampledProperty, by name. Without derivatives,
+# Hermite approximation is the polynomial through the same samples as
+# Lagrange approximation
+INTERPOLATIONS = {
+    "linear": "Cesium.LinearApproximation",
+    "lagrange": "Cesium.LagrangePolynomialApproximation",
+    "hermite": "Cesium.HermitePolynomialApproximation",
+}
+
+
+def validate_interpolation(interpolation: str, degree: int) -> int:
+    """
+    Return the degree of interpolation, which is always 1 for linear
+    interpolation.
+    """
+
+    if interpolation not in INTERPOLATIONS:
+        msg = "interpolation must be one of {names}: {interpolation}"
+        raise ValueError(
+            msg.format(names=list(INTERPOLATIONS), interpolation=interpolation)
+        )
+    if interpolation == "linear":
+        return 1
+    if degree < 1:
+        raise ValueError(f"degree must be positive: {degree}")
+    return degree
+
+
+def _window_starts(times: np.ndarray, query: np.ndarray, degree: int):
+    """Return first samples of windows and their length, see windows"""
+    n = len(times)
+    length = min(degree + 1, n)
+
+    # index of the first sample after each time
+    index = np.minimum(np.searchsorted(times, query, side="right"), n - 1)
+    return np.clip(index - degree // 2 - 1, 0, n - length), length
+
+
+def windows(times, query, degree: int) -> np.ndarray:
+    """
+    Return indices of the samples interpolated at each query time, the
+    degree + 1 samples around it, shifted inside the samples at both ends,
+    as Cesium.SampledProperty.getValue.
+
+    Parameters
+    ----------
+
+    times: array-like
+        Increasing times of samples, of shape (N,).
+    query: array-like
+        Times to interpolate at, of shape (M,).
+    degree: int
+        Degree of interpolation.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Indices of shape (M, min(degree + 1, N)).
+    """
+
+    times = np.asarray(times, dtype=np.float64)
+    query = np.asarray(query, dtype=np.float64)
+    starts, length = _window_starts(times, query, degree)
+    return starts[:, np.newaxis] + np.arange(length)
+
+
+def _lagrange_weights(times: np.ndarray, starts: np.ndarray, length: int, query):
+    """
+    Return weights of the samples of windows at query times, of shape
+    (length, M). Denominators only depend on the first sample of windows,
+    and numerators are products of prefixes and suffixes, so the cost per
+    query grows with length rather than its square.
+    """
+
+    # denominators of all the windows, by sample of windows
+    x = times[np.arange(len(times) - length + 1)[:, np.newaxis] + np.arange(length)]
+    diffs = x[:, :, np.newaxis] - x[:, np.newaxis, :]
+    diffs[:, np.arange(length), np.arange(length)] = 1.0
+    denominators = np.ascontiguousarray(np.prod(diffs, axis=2).T)
+
+    d = [query - times[starts + j] for j in range(length)]
+    prefixes = [np.ones_like(query)]
+    suffixes = [np.ones_like(query)]
+    for j in range(length - 1):
+        prefixes.append(prefixes[-1] * d[j])
+        suffixes.append(suffixes[-1] * d[length - 1 - j])
+    return np.stack(
+        [
+            prefixes[j] * suffixes[length - 1 - j] / denominators[j][starts]
+            for j in range(length)
+        ]
+    )
+
+
+def interpolate(times, values, query, degree: int = 1) -> np.ndarray:
+    """
+    Interpolate values at query times by the polynomial through the samples
+    of each window, see windows. Samples are returned as they are at their
+    own times. Values are accumulated by component, so that 1M queries take
+    a fraction of a second.
+
+    Parameters
+    ----------
+
+    times: array-like
+        Increasing times of samples, of shape (N,).
+    values: array-like
+        Values of samples, of shape (N, k).
+    query: array-like
+        Times to interpolate at, within times, of shape (M,).
+    degree: int, default 1
+        Degree of interpolation.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Values of shape (M, k).
+    """
+
+    times = np.asarray(times, dtype=np.float64)
+    columns = np.ascontiguousarray(np.asarray(values, dtype=np.float64).T)
+    query = np.asarray(query, dtype=np.float64)
+
+    starts, length = _window_starts(times, query, degree)
+    weights = _lagrange_weights(times, starts, length, query)
+
+    result = np.zeros((len(columns), len(query)))
+    for j in range(length):
+        indices = starts + j
+        for component, column in zip(result, columns):
+            component += weights[j] * column[indices]
+    return result.T
+
+
+# --------------------------------------------------
+# Quaternions
+# --------------------------------------------------
+
+
+# quaternions are handled by components x, y, z, w along the first axis
+
+
+def _multiply(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
+    """Return products of quaternions, as Cesium.Quaternion.multiply"""
+    x1, y1, z1, w1 = q1
+    x2, y2, z2, w2 = q2
+    return np.stack(
+        [
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        ]
+    )
+
+
+def _conjugate(q: np.ndarray) -> np.ndarray:
+    x, y, z, w = q
+    return np.stack([-x, -y, -z, w])
+
+
+def _to_rotation_vectors(q: np.ndarray) -> np.ndarray:
+    """Return axes multiplied by angles of rotations of unit quaternions"""
+    x, y, z, w = q
+    sin = np.sqrt(x * x + y * y + z * z)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = 2.0 * np.arctan2(sin, np.abs(w)) / sin
+    scale[sin == 0] = 0.0
+    # rotations by the opposite quaternion, whose w is positive
+    np.negative(scale, out=scale, where=w < 0)
+    return q[:3] * scale
+
+
+def _from_rotation_vectors(r: np.ndarray) -> np.ndarray:
+    angle = np.sqrt(r[0] ** 2 + r[1] ** 2 + r[2] ** 2)
+    scale = np.divide(
+        np.sin(angle / 2.0), angle, out=np.full_like(angle, 0.5), where=angle > 0
+    )
+    return np.concatenate([r * scale, [np.cos(angle / 2.0)]])
+
+
+def interpolate_quaternions(times, values, query, degree: int = 1) -> np.ndarray:
+    """
+    Interpolate unit quaternions x, y, z, w at query times, as Cesium: the
+    rotations from the last sample of each window are interpolated as
+    rotation vectors, see interpolate. Rotation vectors are computed once
+    per window rather than once per query.
+    """
+
+    times = np.asarray(times, dtype=np.float64)
+    columns = np.ascontiguousarray(np.asarray(values, dtype=np.float64).T)
+    query = np.asarray(query, dtype=np.float64)
+
+    starts, length = _window_starts(times, query, degree)
+    weights = _lagrange_weights(times, starts, length, query)
+
+    # rotation vectors of the samples of all the windows
+    first = np.arange(len(times) - length + 1)
+    last = columns[:, first + length - 1]
+    conjugate = _conjugate(last)
+
+    rotation = np.zeros((3, len(query)))
+    for j in range(length):
+        rotations = _to_rotation_vectors(_multiply(columns[:, first + j], conjugate))
+        for component, r in zip(rotation, rotations):
+            component += weights[j] * r[starts]
+
+    last = np.stack([component[starts] for component in last])
+    return _multiply(_from_rotation_vectors(rotation), last).T
+
+
+def quaternion_angles(q1, q2) -> np.ndarray:
+    """Return angles in radians of rotations between unit quaternions"""
+    dot = np.abs(np.einsum("...i,...i->...", q1, q2))
+    return 2.0 * np.arccos(np.clip(dot, 0.0, 1.0))
+
+
+# --------------------------------------------------
+# Decimation
+# --------------------------------------------------
+
+
+def decimate_mask(
+    times, values, max_error: float, degree: int = 1, quaternions: bool = False
+) -> np.ndarray:
+    """
+    Return the mask of samples to keep so that values interpolated from them
+    stay within max_error of all the samples. Starting from the first and
+    last samples, the sample with the largest error between each pair of
+    kept samples is kept until no error exceeds max_error, so the loop runs
+    once per refinement rather than once per sample.
+
+    Parameters
+    ----------
+
+    times: array-like
+        Increasing times of samples, of shape (N,).
+    values: array-like
+        Values of samples, of shape (N, k).
+    max_error: float
+        Largest distance between samples and interpolated values, or largest
+        angle in radians if quaternions.
+    degree: int, default 1
+        Degree of interpolation.
+    quaternions: bool, default False
+        Whether values are unit quaternions x, y, z, w.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Boolean mask of shape (N,).
+    """
+
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    n = len(times)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1] if n else []] = True
+
+    while True:
+        kept = np.flatnonzero(keep)
+        if quaternions:
+            estimates = interpolate_quaternions(
+                times[kept], values[kept], times, degree
+            )
+            errors = quaternion_angles(estimates, values)
+        else:
+            estimates = interpolate(times[kept], values[kept], times, degree)
+            errors = np.linalg.norm(estimates - values, axis=1)
+
+        exceeding = np.flatnonzero((errors > max_error) & ~keep)
+        if not len(exceeding):
+            return keep
+
+        # the worst sample between each pair of kept samples
+        gap = np.searchsorted(kept, exceeding)
+        order = np.lexsort((-errors[exceeding], gap))
+        first = np.concatenate([[True], gap[order][1:] != gap[order][:-1]])
+        keep[exceeding[order][first]] = True
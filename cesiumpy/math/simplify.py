@@ -0,0 +1,136 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+import numpy as np
+
+from cesiumpy.math.geodesy import geodetic_to_ecef
+
+
+def _segment_distance(points, start, end) -> np.ndarray:
+    """Return distances from points to the segments between start and end"""
+    chord = end - start
+    length2 = np.einsum("ij,ij->i", chord, chord)
+    offset = points - start
+    # position of the projection along the segment, 0 when it is a point
+    t = np.einsum("ij,ij->i", offset, chord) / np.where(length2 > 0, length2, 1.0)
+    t = np.clip(t, 0.0, 1.0)
+    return np.linalg.norm(offset - t[:, np.newaxis] * chord, axis=1)
+
+
+def _ring_anchors(xyz) -> np.ndarray:
+    """
+    Return three vertices of a closed ring which are far apart, so that the
+    simplified ring remains a polygon however large the tolerance is.
+    """
+    first = 0
+    second = int(np.argmax(np.linalg.norm(xyz - xyz[0], axis=1)))
+    start = np.broadcast_to(xyz[first], xyz.shape)
+    end = np.broadcast_to(xyz[second], xyz.shape)
+    third = int(np.argmax(_segment_distance(xyz, start, end)))
+    return np.unique([first, second, third, len(xyz) - 1])
+
+
+def douglas_peucker(xyz, tolerance: float, closed: bool = False) -> np.ndarray:
+    """
+    Return the mask of vertices kept by the Douglas-Peucker algorithm. All the
+    segments of a level are split at once, so the loop runs once per level
+    rather than once per kept vertex.
+
+    Parameters
+    ----------
+
+    xyz: array-like
+        Vertices of shape (N, 3), in a metric space.
+    tolerance: float
+        Largest distance between removed vertices and the simplified line.
+    closed: bool, default False
+        Whether the vertices form a ring, in which case at least three
+        distinct vertices are kept. Lines whose first and last vertices
+        coincide are always rings.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Boolean mask of shape (N,).
+    """
+
+    xyz = np.asarray(xyz, dtype=np.float64)
+    n = len(xyz)
+    keep = np.zeros(n, dtype=bool)
+    if n < 3:
+        keep[:] = True
+        return keep
+
+    closing = np.array_equal(xyz[0], xyz[-1])
+    if closed and not closing:
+        # rings of Cesium.PolygonHierarchy are closed implicitly
+        mask = douglas_peucker(np.concatenate([xyz, xyz[:1]]), tolerance, True)
+        return mask[:-1]
+
+    anchors = _ring_anchors(xyz) if closing else np.array([0, n - 1])
+    keep[anchors] = True
+    start, end = anchors[:-1], anchors[1:]
+
+    while len(start):
+        lengths = end - start - 1
+        pending = lengths > 0
+        start, end, lengths = start[pending], end[pending], lengths[pending]
+        if not len(start):
+            break
+
+        # interior vertices of all the pending segments, grouped by segment
+        bounds = np.cumsum(lengths) - lengths
+        segment = np.repeat(np.arange(len(start)), lengths)
+        index = np.arange(lengths.sum()) - bounds[segment] + start[segment] + 1
+
+        distance = _segment_distance(xyz[index], xyz[start[segment]], xyz[end[segment]])
+        farthest = index[np.lexsort((-distance, segment))[bounds]]
+        split = np.maximum.reduceat(distance, bounds) > tolerance
+
+        farthest = farthest[split]
+        keep[farthest] = True
+        start, end = (
+            np.concatenate([start[split], farthest]),
+            np.concatenate([farthest, end[split]]),
+        )
+
+    return keep
+
+
+def simplify_mask(positions, tolerance: float, closed: bool = False) -> np.ndarray:
+    """
+    Return the mask of positions kept by the Douglas-Peucker algorithm,
+    measuring distances in meters in the Earth-fixed frame.
+
+    Parameters
+    ----------
+
+    positions: array-like
+        Longitudes, latitudes in degrees and heights in meters, of shape (N, 3).
+    tolerance: float
+        Largest distance in meters between removed positions and the
+        simplified line.
+    closed: bool, default False
+        Whether positions form a ring, see douglas_peucker.
+    """
+
+    positions = np.asarray(positions, dtype=np.float64)
+    xyz = geodetic_to_ecef(positions[:, 0], positions[:, 1], positions[:, 2])
+    return douglas_peucker(xyz, tolerance, closed=closed)
+
+
+def simplify_positions(positions, tolerance: float, closed: bool = False) -> np.ndarray:
+    """
+    Simplify positions with the Douglas-Peucker algorithm, see simplify_mask.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Kept positions, in their original order.
+    """
+
+    positions = np.asarray(positions, dtype=np.float64)
+    return positions[simplify_mask(positions, tolerance, closed=closed)]
@@ -0,0 +1,6 @@
+# Apache License 2.0
+
+from cesiumpy.orbit.elements import KeplerianElements, solve_kepler  # noqa
+from cesiumpy.orbit.frames import gmst, inertial_to_fixed  # noqa
+from cesiumpy.orbit.propagation import Ephemeris, nadir_pointing, propagate  # noqa
+from cesiumpy.orbit.tle import TLE, read_tle  # noqa
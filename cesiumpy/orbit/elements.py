@@ -0,0 +1,288 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from cesiumpy.math.geodesy import WGS84_A
+from cesiumpy.orbit.frames import as_datetime64
+
+# gravitational parameter of the Earth in m³/s², and its second zonal
+# harmonic, as EGM2008
+MU_EARTH: float = 3.986004418e14
+J2: float = 1.08262668e-3
+
+
+class _Elements:
+    """
+    Orbital elements of satellites, stored as one array per element, which
+    are indexed and sliced together.
+    """
+
+    # Definitions
+
+    # arrays of shape (N,)
+    _fields: Tuple[str, ...] = ()
+
+    names: Optional[np.ndarray] = None
+
+    # Methods
+
+    def __len__(self) -> int:
+        return len(getattr(self, self._fields[0]))
+
+    def __getitem__(self, index) -> _Elements:
+        # slices and masks select satellites, as chunks sent to workers
+        elements = object.__new__(type(self))
+        elements.__dict__.update(self.__dict__)
+        for name in self._fields + ("names",):
+            values = getattr(self, name)
+            if values is not None:
+                setattr(elements, name, np.atleast_1d(values[index]))
+        return elements
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} satellites)"
+
+    def propagate_inertial(self, times) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return positions in meters and velocities in m/s of satellites in
+        the inertial frame of the elements.
+
+        Parameters
+        ----------
+
+        times: array-like
+            Times of shape (M,), as numpy.datetime64 in UTC or datetime.
+
+        Returns
+        -------
+
+        tuple of numpy.ndarray
+            Positions and velocities of shape (N, M, 3).
+        """
+        raise NotImplementedError
+
+    # Private methods
+
+    def _seconds(self, times) -> np.ndarray:
+        """Return seconds of times from the epoch of each satellite, (N, M)"""
+        times = as_datetime64(times)
+        delta = times[np.newaxis, :] - self.epoch[:, np.newaxis]
+        return delta / np.timedelta64(1, "s")
+
+
+def _names(names, n: int) -> Optional[np.ndarray]:
+    if names is None:
+        return None
+    names = np.array(names, dtype=object)
+    if names.shape != (n,):
+        msg = "names must be a list of {n} names: {shape}"
+        raise ValueError(msg.format(n=n, shape=names.shape))
+    return names
+
+
+class KeplerianElements(_Elements):
+    """
+    Keplerian elements of satellites, propagated as two-body orbits with the
+    secular drifts of the node, perigee and mean anomaly caused by J2.
+    Elements are relative to the true equator and mean equinox of date, as
+    the TEME frame of two-line elements.
+
+    Each parameter is either one value shared by all satellites, or an
+    array of one value per satellite.
+
+    Parameters
+    ----------
+
+    semi_major_axis: float or array-like
+        Semi-major axes in meters.
+    eccentricity: float or array-like
+        Eccentricities of elliptical orbits, in [0, 1).
+    inclination: float or array-like
+        Inclinations.
+    raan: float or array-like
+        Right ascensions of the ascending node.
+    argument_of_perigee: float or array-like
+        Arguments of perigee.
+    mean_anomaly: float or array-like
+        Mean anomalies at epoch.
+    epoch: datetime or array-like
+        Epochs of the elements, as datetime or numpy.datetime64 in UTC.
+    degrees: bool, default False
+        Whether angles are in degrees, radians otherwise.
+    j2: bool, default True
+        Whether to apply the secular effects of J2, two-body orbits otherwise.
+    names: list of str, optional
+        Names of satellites.
+    """
+
+    # Definitions
+
+    _fields = (
+        "semi_major_axis",
+        "eccentricity",
+        "inclination",
+        "raan",
+        "argument_of_perigee",
+        "mean_anomaly",
+        "epoch",
+    )
+
+    # Constructor
+
+    def __init__(
+        self,
+        semi_major_axis,
+        eccentricity,
+        inclination,
+        raan,
+        argument_of_perigee,
+        mean_anomaly,
+        epoch: Union[datetime, np.ndarray],
+        degrees: bool = False,
+        j2: bool = True,
+        names: Optional[list[str]] = None,
+    ) -> None:
+        angles = [inclination, raan, argument_of_perigee, mean_anomaly]
+        if degrees:
+            angles = [np.radians(a) for a in angles]
+
+        columns = np.broadcast_arrays(
+            *[np.asarray(c, dtype=np.float64) for c in [semi_major_axis, eccentricity]],
+            *[np.asarray(a, dtype=np.float64) for a in angles],
+            as_datetime64(epoch),
+        )
+        for name, column in zip(self._fields, columns):
+            setattr(self, name, np.atleast_1d(column).copy())
+
+        if (self.semi_major_axis <= 0.0).any():
+            raise ValueError("semi_major_axis must be positive")
+        if ((self.eccentricity < 0.0) | (self.eccentricity >= 1.0)).any():
+            raise ValueError("eccentricity must be in [0, 1)")
+
+        self.j2: bool = j2
+        self.names = _names(names, len(self))
+
+    # Properties
+
+    @property
+    def mean_motion(self) -> np.ndarray:
+        """Mean motions of two-body orbits, in rad/s"""
+        return np.sqrt(MU_EARTH / self.semi_major_axis**3)
+
+    @property
+    def period(self) -> np.ndarray:
+        """Periods of two-body orbits, in seconds"""
+        return 2.0 * np.pi / self.mean_motion
+
+    # Methods
+
+    def rates(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return rates in rad/s of the ascending node, the argument of perigee
+        and the mean anomaly, including the secular effects of J2.
+        """
+
+        n = self.mean_motion
+        if not self.j2:
+            zeros = np.zeros(len(self))
+            return zeros, zeros, n
+
+        e2 = self.eccentricity**2
+        p = self.semi_major_axis * (1.0 - e2)
+        k = 1.5 * J2 * (WGS84_A / p) ** 2 * n
+        sin2 = np.sin(self.inclination) ** 2
+        raan = -k * np.cos(self.inclination)
+        argument_of_perigee = k * (2.0 - 2.5 * sin2)
+        mean_anomaly = n + k * np.sqrt(1.0 - e2) * (1.0 - 1.5 * sin2)
+        return raan, argument_of_perigee, mean_anomaly
+
+    def propagate_inertial(self, times) -> Tuple[np.ndarray, np.ndarray]:
+        seconds = self._seconds(times)
+
+        raan_rate, perigee_rate, anomaly_rate = (r[:, np.newaxis] for r in self.rates())
+        raan = self.raan[:, np.newaxis] + raan_rate * seconds
+        omega = self.argument_of_perigee[:, np.newaxis] + perigee_rate * seconds
+        mean_anomaly = self.mean_anomaly[:, np.newaxis] + anomaly_rate * seconds
+
+        a = self.semi_major_axis[:, np.newaxis]
+        e = self.eccentricity[:, np.newaxis]
+        anomaly = solve_kepler(mean_anomaly, e)
+        cos_e, sin_e = np.cos(anomaly), np.sin(anomaly)
+        root = np.sqrt(1.0 - e * e)
+
+        # perifocal coordinates, x towards perigee
+        x, y = a * (cos_e - e), a * root * sin_e
+        speed = np.sqrt(MU_EARTH * a) / (a * (1.0 - e * cos_e))
+        vx, vy = -speed * sin_e, speed * root * cos_e
+
+        p, q = _perifocal_axes(raan, self.inclination[:, np.newaxis], omega)
+        positions = x[..., np.newaxis] * p + y[..., np.newaxis] * q
+        velocities = vx[..., np.newaxis] * p + vy[..., np.newaxis] * q
+        return positions, velocities
+
+
+def _perifocal_axes(raan, inclination, omega) -> Tuple[np.ndarray, np.ndarray]:
+    """Return axes towards perigee and 90° ahead in the inertial frame"""
+    cos_o, sin_o = np.cos(raan), np.sin(raan)
+    cos_w, sin_w = np.cos(omega), np.sin(omega)
+    cos_i, sin_i = np.cos(inclination), np.sin(inclination)
+    p = np.stack(
+        [
+            cos_o * cos_w - sin_o * sin_w * cos_i,
+            sin_o * cos_w + cos_o * sin_w * cos_i,
+            np.broadcast_to(sin_w * sin_i, raan.shape),
+        ],
+        axis=-1,
+    )
+    q = np.stack(
+        [
+            -cos_o * sin_w - sin_o * cos_w * cos_i,
+            -sin_o * sin_w + cos_o * cos_w * cos_i,
+            np.broadcast_to(cos_w * sin_i, raan.shape),
+        ],
+        axis=-1,
+    )
+    return p, q
+
+
+def solve_kepler(
+    mean_anomaly, eccentricity, tolerance: float = 1e-12, max_iterations: int = 20
+) -> np.ndarray:
+    """
+    Return eccentric anomalies solving Kepler's equation M = E - e sin(E)
+    by Newton's method, for all anomalies at once.
+
+    Parameters
+    ----------
+
+    mean_anomaly: array-like
+        Mean anomalies in radians.
+    eccentricity: float or array-like
+        Eccentricities in [0, 1), broadcast against mean anomalies.
+    tolerance: float, default 1e-12
+        Largest correction of the last iteration, in radians.
+    max_iterations: int, default 20
+        Iterations after which anomalies are returned as they are.
+    """
+
+    mean_anomaly = np.asarray(mean_anomaly, dtype=np.float64)
+    mean_anomaly, e = np.broadcast_arrays(
+        np.remainder(mean_anomaly, 2.0 * np.pi), eccentricity
+    )
+
+    # starting from pi converges for any eccentricity, and the first order
+    # solution is closer for small eccentricities
+    anomaly = np.where(e < 0.8, mean_anomaly + e * np.sin(mean_anomaly), np.pi)
+    for _ in range(max_iterations):
+        step = (anomaly - e * np.sin(anomaly) - mean_anomaly) / (
+            1.0 - e * np.cos(anomaly)
+        )
+        anomaly = anomaly - step
+        if np.all(np.abs(step) < tolerance):
+            break
+    return anomaly
@@ -0,0 +1,92 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+# rotation rate of the Earth in rad/s, as WGS84
+EARTH_ROTATION_RATE: float = 7.292115146706979e-5
+
+_MICROSECOND = timedelta(microseconds=1)
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_J2000 = np.datetime64("2000-01-01T12:00:00", "us")
+
+
+def as_datetime64(times) -> np.ndarray:
+    """
+    Return times as numpy.datetime64 in microseconds of UTC. Naive datetimes
+    are in UTC, as the times of SampledProperty.
+    """
+
+    times = np.asarray(times)
+    if times.dtype.kind == "M":
+        return times.astype("datetime64[us]")
+
+    microseconds = []
+    for time in times.reshape(-1):
+        if time.tzinfo is None:
+            time = time.replace(tzinfo=timezone.utc)
+        microseconds.append((time - _UNIX_EPOCH) // _MICROSECOND)
+    return np.array(microseconds, dtype="datetime64[us]").reshape(times.shape)
+
+
+def gmst(times) -> np.ndarray:
+    """
+    Return Greenwich mean sidereal times in radians, as IAU 1982 with UT1
+    approximated by UTC.
+
+    Parameters
+    ----------
+
+    times: array-like
+        Times as numpy.datetime64 in UTC or datetime.
+    """
+
+    days = (as_datetime64(times) - _J2000) / np.timedelta64(86400, "s")
+    centuries = days / 36525.0
+    seconds = (
+        67310.54841
+        + (876600.0 * 3600.0 + 8640184.812866) * centuries
+        + 0.093104 * centuries**2
+        - 6.2e-6 * centuries**3
+    )
+    return np.radians(seconds / 240.0) % (2.0 * np.pi)
+
+
+def inertial_to_fixed(positions, velocities, times):
+    """
+    Return positions and velocities in the Earth-fixed frame of Cesium, from
+    a true-of-date inertial frame such as the TEME frame of SGP4, rotated by
+    the sidereal time. Polar motion is neglected.
+
+    Parameters
+    ----------
+
+    positions: array-like
+        Positions of shape (..., M, 3).
+    velocities: array-like
+        Velocities of shape (..., M, 3), per second.
+    times: array-like
+        Times of shape (M,), as numpy.datetime64 in UTC or datetime.
+
+    Returns
+    -------
+
+    tuple of numpy.ndarray
+        Positions and velocities of shape (..., M, 3).
+    """
+
+    theta = gmst(times)
+    cos, sin = np.cos(theta), np.sin(theta)
+
+    x, y, z = np.moveaxis(np.asarray(positions, dtype=np.float64), -1, 0)
+    vx, vy, vz = np.moveaxis(np.asarray(velocities, dtype=np.float64), -1, 0)
+
+    xf = cos * x + sin * y
+    yf = -sin * x + cos * y
+    # velocities relative to the rotating frame
+    vxf = cos * vx + sin * vy + EARTH_ROTATION_RATE * yf
+    vyf = -sin * vx + cos * vy - EARTH_ROTATION_RATE * xf
+    return np.stack([xf, yf, z], axis=-1), np.stack([vxf, vyf, vz], axis=-1)
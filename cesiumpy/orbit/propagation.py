@@ -0,0 +1,254 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+import cesiumpy
+from cesiumpy.orbit.elements import _Elements
+from cesiumpy.orbit.frames import as_datetime64, inertial_to_fixed
+
+# constellations smaller than this are propagated serially, as starting
+# workers dominates
+MIN_PARALLEL_SATELLITES: int = 1000
+
+
+class Ephemeris:
+    """
+    Positions and velocities of satellites at the same times, in meters and
+    m/s in the Earth-fixed frame of Cesium, one row per satellite.
+
+    Parameters
+    ----------
+
+    times: numpy.ndarray
+        Times of shape (M,), as numpy.datetime64 in UTC.
+    positions: numpy.ndarray
+        Positions of shape (N, M, 3), NaN where propagation failed.
+    velocities: numpy.ndarray
+        Velocities of shape (N, M, 3).
+    names: numpy.ndarray, optional
+        Names of satellites, of shape (N,).
+    """
+
+    # Constructor
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        names: Optional[np.ndarray] = None,
+    ) -> None:
+        self.times: np.ndarray = as_datetime64(times)
+        self.positions: np.ndarray = positions
+        self.velocities: np.ndarray = velocities
+        self.names: Optional[np.ndarray] = names
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __repr__(self) -> str:
+        return f"Ephemeris({len(self)} satellites, {len(self.times)} times)"
+
+    # Methods
+
+    def orientations(self) -> np.ndarray:
+        """
+        Return nadir pointing orientations of satellites, see nadir_pointing.
+
+        Returns
+        -------
+
+        numpy.ndarray
+            Quaternions of shape (N, M, 4).
+        """
+        return nadir_pointing(self.positions, self.velocities)
+
+    def position_property(
+        self, index: int, interpolation: str = "lagrange", degree: int = 5
+    ) -> cesiumpy.SampledPositionProperty:
+        """
+        Return samples of the positions of a satellite, without the ones
+        where propagation failed.
+
+        Parameters
+        ----------
+
+        index: int
+            Row of the satellite.
+        interpolation: str, default "lagrange"
+            Interpolation used by Cesium between samples, which follows
+            orbits closely at a few samples per minute.
+        degree: int, default 5
+            Degree of interpolation.
+        """
+
+        positions = self.positions[index]
+        valid = ~np.isnan(positions).any(axis=1)
+
+        position = cesiumpy.SampledPositionProperty()
+        position.set_interpolation_options(interpolation, degree)
+        position.add_samples(self.times[valid], positions[valid])
+        return position
+
+    def orientation_property(
+        self, index: int, orientations: Optional[np.ndarray] = None
+    ) -> cesiumpy.SampledProperty:
+        """
+        Return samples of the orientation of a satellite.
+
+        Parameters
+        ----------
+
+        index: int
+            Row of the satellite.
+        orientations: numpy.ndarray, optional
+            Quaternions of shape (N, M, 4) of all satellites, nadir pointing
+            by default.
+        """
+
+        if orientations is None:
+            orientations = nadir_pointing(self.positions[index], self.velocities[index])
+        else:
+            orientations = orientations[index]
+        valid = ~np.isnan(orientations).any(axis=1)
+
+        orientation = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+        orientation.add_samples(self.times[valid], orientations[valid])
+        return orientation
+
+    def satellites(
+        self,
+        orientation: bool = True,
+        interpolation: str = "lagrange",
+        degree: int = 5,
+        **kwargs,
+    ) -> List[cesiumpy.Satellite]:
+        """
+        Return one Satellite per row, whose samples are added from columns.
+
+        Parameters
+        ----------
+
+        orientation: bool, default True
+            Whether satellites are nadir pointing, see nadir_pointing.
+        interpolation, degree:
+            Interpolation of positions, see position_property.
+        kwargs:
+            Passed to every Satellite, such as model.
+        """
+
+        orientations = self.orientations() if orientation else None
+        return [
+            cesiumpy.Satellite(
+                position=self.position_property(i, interpolation, degree),
+                orientation=(
+                    self.orientation_property(i, orientations) if orientation else None
+                ),
+                **kwargs,
+            )
+            for i in range(len(self))
+        ]
+
+
+def nadir_pointing(positions, velocities) -> np.ndarray:
+    """
+    Return orientations whose z axis points to the center of the Earth and
+    x axis along the velocity, y axis being opposite to the orbit normal, as
+    quaternions from the body frame to the frame of positions.
+
+    Sensors, which look along the z axis of satellites, look down.
+
+    Parameters
+    ----------
+
+    positions: array-like
+        Positions of shape (..., 3).
+    velocities: array-like
+        Velocities of shape (..., 3).
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Quaternions of shape (..., 4).
+    """
+    from cesiumpy.orientation import from_rotation_matrix
+
+    positions = np.asarray(positions, dtype=np.float64)
+    velocities = np.asarray(velocities, dtype=np.float64)
+
+    z = -positions / np.linalg.norm(positions, axis=-1, keepdims=True)
+    y = -np.cross(positions, velocities)
+    y /= np.linalg.norm(y, axis=-1, keepdims=True)
+    x = np.cross(y, z)
+    return from_rotation_matrix(np.stack([x, y, z], axis=-1))
+
+
+def _propagate_fixed(
+    orbits: _Elements, times: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    positions, velocities = orbits.propagate_inertial(times)
+    return inertial_to_fixed(positions, velocities, times)
+
+
+def propagate(
+    orbits: _Elements,
+    times,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> Ephemeris:
+    """
+    Propagate satellites at times, all at once as arrays.
+
+    Parameters
+    ----------
+
+    orbits: KeplerianElements or TLE
+        Elements of N satellites.
+    times: array-like
+        Times of shape (M,), as numpy.datetime64 in UTC or datetime.
+    workers: int, optional
+        Number of processes propagating chunks of satellites. Constellations
+        smaller than MIN_PARALLEL_SATELLITES are propagated serially.
+    chunk_size: int, optional
+        Number of satellites sent to a worker at once, by default splits
+        satellites in 4 chunks per worker.
+
+    Returns
+    -------
+
+    Ephemeris
+        Positions and velocities in the Earth-fixed frame.
+    """
+
+    times = as_datetime64(times).reshape(-1)
+
+    if workers is None or workers <= 1 or len(orbits) < MIN_PARALLEL_SATELLITES:
+        positions, velocities = _propagate_fixed(orbits, times)
+        return Ephemeris(times, positions, velocities, names=orbits.names)
+
+    # imported here, as it is slow to import and rarely needed
+    import concurrent.futures
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(orbits) // (4 * workers)))
+
+    positions = np.empty((len(orbits), len(times), 3))
+    velocities = np.empty((len(orbits), len(times), 3))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for start in range(0, len(orbits), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            futures[executor.submit(_propagate_fixed, orbits[chunk], times)] = chunk
+        # chunks are written in place as they complete
+        for future in concurrent.futures.as_completed(futures):
+            chunk = futures.pop(future)
+            chunk_positions, chunk_velocities = future.result()
+            positions[chunk] = chunk_positions
+            velocities[chunk] = chunk_velocities
+
+    return Ephemeris(times, positions, velocities, names=orbits.names)
@@ -0,0 +1,370 @@
+# Apache License 2.0
+
+"""
+SGP4 propagation of two-line elements, for all satellites and times at once.
+
+Written after the revised SGP4 of Vallado et al., "Revisiting Spacetrack
+Report #3" (2006), with WGS72 constants as two-line elements are fitted with
+them. Deep-space satellites, whose period is 225 minutes or more, require
+the SDP4 extension which is not implemented.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+# WGS72 constants
+RADIUS_EARTH_KM: float = 6378.135
+MU_EARTH_KM: float = 398600.8
+XKE: float = 60.0 / np.sqrt(RADIUS_EARTH_KM**3 / MU_EARTH_KM)
+J2: float = 0.001082616
+J3: float = -0.00000253881
+J4: float = -0.00000165597
+J3OJ2: float = J3 / J2
+
+# periods in minutes from which satellites are propagated by SDP4
+DEEP_SPACE_PERIOD: float = 225.0
+
+_X2O3 = 2.0 / 3.0
+_TEMP4 = 1.5e-12
+
+
+def unkozai_mean_motion(mean_motion, eccentricity, inclination) -> np.ndarray:
+    """
+    Return Brouwer mean motions in rad/min, from the Kozai mean motions of
+    two-line elements.
+    """
+
+    ak = (XKE / mean_motion) ** _X2O3
+    omeosq = 1.0 - eccentricity**2
+    cosio2 = np.cos(inclination) ** 2
+    d1 = 0.75 * J2 * (3.0 * cosio2 - 1.0) / (np.sqrt(omeosq) * omeosq)
+    delta = d1 / (ak * ak)
+    adel = ak * (1.0 - delta * delta - delta * (1.0 / 3.0 + 134.0 * delta**2 / 81.0))
+    delta = d1 / (adel * adel)
+    return mean_motion / (1.0 + delta)
+
+
+def initialize(tle) -> Dict[str, np.ndarray]:
+    """
+    Return the coefficients of SGP4 of satellites, as sgp4init, each of
+    shape (N, 1) to be broadcast against times.
+    """
+
+    ecco = tle.eccentricity
+    inclo = tle.inclination
+    argpo = tle.argument_of_perigee
+    mo = tle.mean_anomaly
+    bstar = tle.bstar
+
+    no = unkozai_mean_motion(tle.mean_motion, ecco, inclo)
+    deep_space = 2.0 * np.pi / no >= DEEP_SPACE_PERIOD
+    if deep_space.any():
+        msg = "deep-space satellites are not supported by SGP4: {numbers}"
+        raise ValueError(msg.format(numbers=tle.satellite_number[deep_space].tolist()))
+
+    ss = 78.0 / RADIUS_EARTH_KM + 1.0
+    qzms2t = ((120.0 - 78.0) / RADIUS_EARTH_KM) ** 4
+
+    eccsq = ecco * ecco
+    omeosq = 1.0 - eccsq
+    rteosq = np.sqrt(omeosq)
+    cosio = np.cos(inclo)
+    cosio2 = cosio * cosio
+    sinio = np.sin(inclo)
+    ao = (XKE / no) ** _X2O3
+    po = ao * omeosq
+    con42 = 1.0 - 5.0 * cosio2
+    con41 = -con42 - cosio2 - cosio2
+    posq = po * po
+    rp = ao * (1.0 - ecco)
+
+    # simplified equations for perigees below 220 km
+    isimp = rp < 220.0 / RADIUS_EARTH_KM + 1.0
+
+    # atmospheric density parameter for perigees below 156 km
+    perige = (rp - 1.0) * RADIUS_EARTH_KM
+    sfour = np.where(perige < 98.0, 20.0, perige - 78.0)
+    qzms24 = np.where(perige < 156.0, ((120.0 - sfour) / RADIUS_EARTH_KM) ** 4, qzms2t)
+    sfour = np.where(perige < 156.0, sfour / RADIUS_EARTH_KM + 1.0, ss)
+
+    pinvsq = 1.0 / posq
+    tsi = 1.0 / (ao - sfour)
+    eta = ao * ecco * tsi
+    etasq = eta * eta
+    eeta = ecco * eta
+    psisq = np.abs(1.0 - etasq)
+    coef = qzms24 * tsi**4
+    coef1 = coef / psisq**3.5
+    cc2 = (
+        coef1
+        * no
+        * (
+            ao * (1.0 + 1.5 * etasq + eeta * (4.0 + etasq))
+            + 0.375 * J2 * tsi / psisq * con41 * (8.0 + 3.0 * etasq * (8.0 + etasq))
+        )
+    )
+    cc1 = bstar * cc2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cc3 = np.where(
+            ecco > 1.0e-4, -2.0 * coef * tsi * J3OJ2 * no * sinio / ecco, 0.0
+        )
+        xmcof = np.where(ecco > 1.0e-4, -_X2O3 * coef * bstar / eeta, 0.0)
+    x1mth2 = 1.0 - cosio2
+    cc4 = (
+        2.0
+        * no
+        * coef1
+        * ao
+        * omeosq
+        * (
+            eta * (2.0 + 0.5 * etasq)
+            + ecco * (0.5 + 2.0 * etasq)
+            - J2
+            * tsi
+            / (ao * psisq)
+            * (
+                -3.0 * con41 * (1.0 - 2.0 * eeta + etasq * (1.5 - 0.5 * eeta))
+                + 0.75
+                * x1mth2
+                * (2.0 * etasq - eeta * (1.0 + etasq))
+                * np.cos(2.0 * argpo)
+            )
+        )
+    )
+    cc5 = 2.0 * coef1 * ao * omeosq * (1.0 + 2.75 * (etasq + eeta) + eeta * etasq)
+    cosio4 = cosio2 * cosio2
+    temp1 = 1.5 * J2 * pinvsq * no
+    temp2 = 0.5 * temp1 * J2 * pinvsq
+    temp3 = -0.46875 * J4 * pinvsq * pinvsq * no
+    mdot = (
+        no
+        + 0.5 * temp1 * rteosq * con41
+        + 0.0625 * temp2 * rteosq * (13.0 - 78.0 * cosio2 + 137.0 * cosio4)
+    )
+    argpdot = (
+        -0.5 * temp1 * con42
+        + 0.0625 * temp2 * (7.0 - 114.0 * cosio2 + 395.0 * cosio4)
+        + temp3 * (3.0 - 36.0 * cosio2 + 49.0 * cosio4)
+    )
+    xhdot1 = -temp1 * cosio
+    nodedot = (
+        xhdot1
+        + (0.5 * temp2 * (4.0 - 19.0 * cosio2) + 2.0 * temp3 * (3.0 - 7.0 * cosio2))
+        * cosio
+    )
+    omgcof = bstar * cc3 * np.cos(argpo)
+    nodecf = 3.5 * omeosq * xhdot1 * cc1
+    t2cof = 1.5 * cc1
+    # avoids division by zero for inclinations of 180 degrees
+    xlcof = (
+        -0.25
+        * J3OJ2
+        * sinio
+        * (3.0 + 5.0 * cosio)
+        / np.where(np.abs(cosio + 1.0) > 1.5e-12, 1.0 + cosio, _TEMP4)
+    )
+    aycof = -0.5 * J3OJ2 * sinio
+    delmo = (1.0 + eta * np.cos(mo)) ** 3
+    sinmao = np.sin(mo)
+    x7thm1 = 7.0 * cosio2 - 1.0
+
+    # higher order drag terms, unless simplified
+    cc1sq = cc1 * cc1
+    d2 = np.where(isimp, 0.0, 4.0 * ao * tsi * cc1sq)
+    temp = d2 * tsi * cc1 / 3.0
+    d3 = (17.0 * ao + sfour) * temp
+    d4 = 0.5 * temp * ao * tsi * (221.0 * ao + 31.0 * sfour) * cc1
+    t3cof = np.where(isimp, 0.0, d2 + 2.0 * cc1sq)
+    t4cof = np.where(isimp, 0.0, 0.25 * (3.0 * d3 + cc1 * (12.0 * d2 + 10.0 * cc1sq)))
+    t5cof = np.where(
+        isimp,
+        0.0,
+        0.2
+        * (
+            3.0 * d4
+            + 12.0 * cc1 * d3
+            + 6.0 * d2 * d2
+            + 15.0 * cc1sq * (2.0 * d2 + cc1sq)
+        ),
+    )
+
+    coefficients = dict(
+        isimp=isimp,
+        no=no,
+        ecco=ecco,
+        inclo=inclo,
+        nodeo=tle.raan,
+        argpo=argpo,
+        mo=mo,
+        bstar=bstar,
+        eta=eta,
+        con41=con41,
+        x1mth2=x1mth2,
+        x7thm1=x7thm1,
+        cc1=cc1,
+        cc4=cc4,
+        cc5=cc5,
+        d2=d2,
+        d3=d3,
+        d4=d4,
+        delmo=delmo,
+        sinmao=sinmao,
+        mdot=mdot,
+        argpdot=argpdot,
+        nodedot=nodedot,
+        omgcof=omgcof,
+        xmcof=xmcof,
+        nodecf=nodecf,
+        t2cof=t2cof,
+        t3cof=t3cof,
+        t4cof=t4cof,
+        t5cof=t5cof,
+        xlcof=xlcof,
+        aycof=aycof,
+    )
+    return {k: np.asarray(v)[:, np.newaxis] for k, v in coefficients.items()}
+
+
+def sgp4(tle, minutes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return positions in km and velocities in km/s of satellites in the TEME
+    frame, as sgp4. Samples of satellites which decayed, or whose elements
+    became invalid, are NaN.
+
+    Parameters
+    ----------
+
+    tle: TLE
+        Two-line elements of N satellites.
+    minutes: array-like
+        Minutes since the epoch of each satellite, of shape (N, M).
+
+    Returns
+    -------
+
+    tuple of numpy.ndarray
+        Positions and velocities of shape (N, M, 3).
+    """
+
+    c = initialize(tle)
+    t = np.asarray(minutes, dtype=np.float64)
+    two_pi = 2.0 * np.pi
+
+    # secular gravity and atmospheric drag
+    xmdf = c["mo"] + c["mdot"] * t
+    argpdf = c["argpo"] + c["argpdot"] * t
+    nodedf = c["nodeo"] + c["nodedot"] * t
+    t2 = t * t
+    nodem = nodedf + c["nodecf"] * t2
+    tempa = 1.0 - c["cc1"] * t
+    tempe = c["bstar"] * c["cc4"] * t
+    templ = c["t2cof"] * t2
+
+    # higher order terms are zero for simplified satellites, except these
+    full = ~c["isimp"]
+    delomg = c["omgcof"] * t
+    delm = c["xmcof"] * ((1.0 + c["eta"] * np.cos(xmdf)) ** 3 - c["delmo"])
+    temp = np.where(full, delomg + delm, 0.0)
+    mm = xmdf + temp
+    argpm = argpdf - temp
+    t3 = t2 * t
+    t4 = t3 * t
+    tempa = tempa - c["d2"] * t2 - c["d3"] * t3 - c["d4"] * t4
+    tempe = tempe + np.where(
+        full, c["bstar"] * c["cc5"] * (np.sin(mm) - c["sinmao"]), 0.0
+    )
+    templ = templ + c["t3cof"] * t3 + t4 * (c["t4cof"] + t * c["t5cof"])
+
+    am = (XKE / c["no"]) ** _X2O3 * tempa * tempa
+    nm = XKE / am**1.5
+    em = c["ecco"] - tempe
+    invalid = (em >= 1.0) | (em < -0.001) | (am < 0.95)
+    em = np.maximum(em, 1.0e-6)
+
+    mm = mm + c["no"] * templ
+    xlm = mm + argpm + nodem
+    nodem = np.fmod(nodem, two_pi)
+    argpm = np.fmod(argpm, two_pi)
+    xlm = np.fmod(xlm, two_pi)
+    mm = np.fmod(xlm - argpm - nodem, two_pi)
+
+    # long period periodics
+    sinip = np.sin(c["inclo"])
+    cosip = np.cos(c["inclo"])
+    axnl = em * np.cos(argpm)
+    temp = 1.0 / (am * (1.0 - em * em))
+    aynl = em * np.sin(argpm) + temp * c["aycof"]
+    xl = mm + argpm + nodem + temp * c["xlcof"] * axnl
+
+    # Kepler's equation, with steps bounded as sgp4
+    u = np.fmod(xl - nodem, two_pi)
+    eo1 = u.copy()
+    for _ in range(10):
+        sineo1, coseo1 = np.sin(eo1), np.cos(eo1)
+        tem5 = (u - aynl * coseo1 + axnl * sineo1 - eo1) / (
+            1.0 - coseo1 * axnl - sineo1 * aynl
+        )
+        tem5 = np.clip(tem5, -0.95, 0.95)
+        eo1 = eo1 + tem5
+        if np.all(np.abs(tem5) < 1.0e-12):
+            break
+    sineo1, coseo1 = np.sin(eo1), np.cos(eo1)
+
+    # short period preliminary quantities
+    ecose = axnl * coseo1 + aynl * sineo1
+    esine = axnl * sineo1 - aynl * coseo1
+    el2 = axnl * axnl + aynl * aynl
+    pl = am * (1.0 - el2)
+    invalid |= pl < 0.0
+    with np.errstate(invalid="ignore"):
+        rl = am * (1.0 - ecose)
+        rdotl = np.sqrt(am) * esine / rl
+        rvdotl = np.sqrt(pl) / rl
+        betal = np.sqrt(1.0 - el2)
+    temp = esine / (1.0 + betal)
+    sinu = am / rl * (sineo1 - aynl - axnl * temp)
+    cosu = am / rl * (coseo1 - axnl + aynl * temp)
+    su = np.arctan2(sinu, cosu)
+    sin2u = (cosu + cosu) * sinu
+    cos2u = 1.0 - 2.0 * sinu * sinu
+    temp = 1.0 / pl
+    temp1 = 0.5 * J2 * temp
+    temp2 = temp1 * temp
+
+    # short period periodics
+    mrt = (
+        rl * (1.0 - 1.5 * temp2 * betal * c["con41"])
+        + 0.5 * temp1 * c["x1mth2"] * cos2u
+    )
+    su = su - 0.25 * temp2 * c["x7thm1"] * sin2u
+    xnode = nodem + 1.5 * temp2 * cosip * sin2u
+    xinc = c["inclo"] + 1.5 * temp2 * cosip * sinip * cos2u
+    mvt = rdotl - nm * temp1 * c["x1mth2"] * sin2u / XKE
+    rvdot = rvdotl + nm * temp1 * (c["x1mth2"] * cos2u + 1.5 * c["con41"]) / XKE
+
+    # orientation vectors
+    sinsu, cossu = np.sin(su), np.cos(su)
+    snod, cnod = np.sin(xnode), np.cos(xnode)
+    sini, cosi = np.sin(xinc), np.cos(xinc)
+    xmx = -snod * cosi
+    xmy = cnod * cosi
+    u = np.stack(
+        [xmx * sinsu + cnod * cossu, xmy * sinsu + snod * cossu, sini * sinsu], axis=-1
+    )
+    v = np.stack(
+        [xmx * cossu - cnod * sinsu, xmy * cossu - snod * sinsu, sini * cossu], axis=-1
+    )
+
+    positions = (mrt * RADIUS_EARTH_KM)[..., np.newaxis] * u
+    velocities = (RADIUS_EARTH_KM * XKE / 60.0) * (
+        mvt[..., np.newaxis] * u + rvdot[..., np.newaxis] * v
+    )
+
+    # satellites below the surface of the Earth decayed
+    invalid |= ~(mrt >= 1.0)
+    positions[invalid] = np.nan
+    velocities[invalid] = np.nan
+    return positions, velocities
@@ -0,0 +1,171 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+from typing import IO, Iterable, Tuple, Union
+
+import numpy as np
+
+from cesiumpy.orbit.elements import _Elements, _names
+
+
+def _checksum(line: str) -> int:
+    # digits count as their value and minus signs as 1, modulo 10
+    return sum(int(c) if c.isdigit() else c == "-" for c in line[:68]) % 10
+
+
+def _exponent(field: str) -> float:
+    """Return value of a field such as " 28098-4", which is 0.28098e-4"""
+    field = field.replace(" ", "") or "0"
+    mantissa, exponent = field[:-2], field[-2:]
+    sign = "-" if mantissa.startswith("-") else ""
+    return float(f"{sign}0.{mantissa.lstrip('+-')}e{exponent}")
+
+
+def _epoch(field: str) -> np.datetime64:
+    year = int(field[:2])
+    year += 1900 if year >= 57 else 2000
+    day = float(field[2:])
+    microseconds = round((day - 1.0) * 86400e6)
+    return np.datetime64(f"{year}-01-01", "us") + np.timedelta64(microseconds, "us")
+
+
+class TLE(_Elements):
+    """
+    Two-line elements of satellites, propagated by SGP4.
+
+    Angles are in radians, and mean motions in radians per minute, as SGP4.
+    Satellites without name line are named after their number.
+
+    Parameters
+    ----------
+
+    lines: iterable of str
+        Lines of two-line elements, each optionally preceded by a line
+        holding the name of the satellite.
+    """
+
+    # Definitions
+
+    _fields = (
+        "satellite_number",
+        "epoch",
+        "bstar",
+        "inclination",
+        "raan",
+        "eccentricity",
+        "argument_of_perigee",
+        "mean_anomaly",
+        "mean_motion",
+    )
+
+    # Constructor
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        rows = []
+        names = []
+        first = name = None
+        for line in lines:
+            line = line.rstrip()
+            if not line:
+                continue
+            if line.startswith("1 ") and len(line) >= 68:
+                first = line
+            elif line.startswith("2 ") and len(line) >= 68:
+                if first is None:
+                    raise ValueError(f"line 1 of two-line elements missing: {line}")
+                rows.append(self._parse(first, line))
+                first = None
+                names.append(name)
+                name = None
+            else:
+                # three-line elements have names such as "0 ISS (ZARYA)"
+                name = line[2:] if line.startswith("0 ") else line
+
+        columns = list(zip(*rows)) or [[]] * len(self._fields)
+        dtypes = [np.int64, "datetime64[us]"] + [np.float64] * 7
+        for field, column, dtype in zip(self._fields, columns, dtypes):
+            setattr(self, field, np.array(column, dtype=dtype))
+
+        if any(n is None for n in names):
+            names = [
+                str(number) if n is None else n
+                for n, number in zip(names, self.satellite_number)
+            ]
+        self.names = _names(names, len(self))
+
+    # Properties
+
+    @property
+    def period(self) -> np.ndarray:
+        """Periods in minutes, as SGP4"""
+        from cesiumpy.orbit.sgp4 import unkozai_mean_motion
+
+        no = unkozai_mean_motion(self.mean_motion, self.eccentricity, self.inclination)
+        return 2.0 * np.pi / no
+
+    @property
+    def deep_space(self) -> np.ndarray:
+        """Mask of satellites requiring deep-space propagation"""
+        from cesiumpy.orbit.sgp4 import DEEP_SPACE_PERIOD
+
+        return self.period >= DEEP_SPACE_PERIOD
+
+    # Methods
+
+    def propagate_inertial(self, times) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return positions in meters and velocities in m/s of satellites in
+        the TEME frame, NaN where SGP4 fails, such as after decay.
+        """
+        from cesiumpy.orbit.sgp4 import sgp4
+
+        positions, velocities = sgp4(self, self._seconds(times) / 60.0)
+        return positions * 1e3, velocities * 1e3
+
+    # Private methods
+
+    @staticmethod
+    def _parse(first: str, second: str) -> tuple:
+        for line in (first, second):
+            if line[68:69].isdigit() and int(line[68]) != _checksum(line):
+                raise ValueError(f"invalid checksum of two-line elements: {line}")
+        if first[2:7] != second[2:7]:
+            msg = "satellite numbers of two-line elements differ: {0}, {1}"
+            raise ValueError(msg.format(first[2:7], second[2:7]))
+
+        radians = [np.radians(float(second[a:b])) for a, b in _ANGLES]
+        return (
+            int(first[2:7]),
+            _epoch(first[18:32]),
+            _exponent(first[53:61]),
+            radians[0],
+            radians[1],
+            float("0." + second[26:33].strip()),
+            radians[2],
+            radians[3],
+            float(second[52:63]) * 2.0 * np.pi / 1440.0,
+        )
+
+
+# columns of inclination, right ascension of the node, argument of perigee
+# and mean anomaly in degrees
+_ANGLES = ((8, 16), (17, 25), (34, 42), (43, 51))
+
+
+def read_tle(fp: Union[str, IO[str]]) -> TLE:
+    """
+    Read two-line elements from a path or a file-like object, such as a
+    catalog of a constellation.
+
+    Parameters
+    ----------
+
+    fp: str or file-like object
+        Path, or file-like object having ``read`` method.
+    """
+
+    if isinstance(fp, str):
+        with open(fp) as f:
+            return TLE(f.read().splitlines())
+    return TLE(fp.read().splitlines())
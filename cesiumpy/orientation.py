@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+
 import traitlets
 
 import cesiumpy
@@ -24,6 +26,10 @@ class Quaternion(_CesiumObject):
 
     _props = ["x", "y", "z", "w"]
 
+    # components stored by SampledProperty, and their quantized units
+    _components = ("x", "y", "z", "w")
+    _quantization_scales = (1e9, 1e9, 1e9, 1e9)
+
     x = traitlets.Float(allow_none=False)
     y = traitlets.Float(allow_none=False)
     z = traitlets.Float(allow_none=False)
@@ -49,14 +55,31 @@ class Quaternion(_CesiumObject):
         return f"new Cesium.Quaternion({self.x}, {self.y}, {self.z}, {self.w})"
 
     def __mul__(self, quaternion: Quaternion) -> Quaternion:
-        return _QuaternionFromProduct(
-            quaternion_1=self,
-            quaternion_2=quaternion,
-        )
+        """
+        Return the product of quaternions, which is written as
+        Cesium.Quaternion.multiply(quaternion, self) by Cesium.
+        """
+
+        if not (_is_concrete(self) and _is_concrete(quaternion)):
+            return _QuaternionFromProduct(
+                quaternion_1=self,
+                quaternion_2=quaternion,
+            )
+        return Quaternion(*multiply(quaternion.to_list(), self.to_list()).tolist())
 
     def __repr__(self) -> str:
         return f"Cesium.Quaternion({self.x}, {self.y}, {self.z}, {self.w})"
 
+    def to_list(self) -> list[float]:
+        return [self.x, self.y, self.z, self.w]
+
+    def normalized(self) -> Quaternion:
+        """
+        Return normalized quaternion.
+        """
+
+        return Quaternion(*normalize(self.to_list()).tolist())
+
     # Static methods
 
     @staticmethod
@@ -73,19 +96,31 @@ class Quaternion(_CesiumObject):
         axis: cesiumpy.Cartesian3,
         angle: float,
     ) -> Quaternion:
-        return _QuaternionFromAxisAngle(
-            axis=axis,
-            angle=angle,
-        )
+        # positions in degrees are converted as Cesium does
+        axis = axis.to_fixed_frame()
+        return Quaternion(*from_axis_angle([axis.x, axis.y, axis.z], angle).tolist())
 
     @staticmethod
     def from_heading_pitch_roll(
         heading_pitch_roll: HeadingPitchRoll,
     ) -> Quaternion:
-        return _QuaternionFromHeadingPitchRoll(
-            heading_pitch_roll=heading_pitch_roll,
+        if not _is_concrete(heading_pitch_roll):
+            return _QuaternionFromHeadingPitchRoll(
+                heading_pitch_roll=heading_pitch_roll,
+            )
+        hpr = heading_pitch_roll
+        return Quaternion(
+            *from_heading_pitch_roll(hpr.heading, hpr.pitch, hpr.roll).tolist()
         )
 
+    @staticmethod
+    def slerp(start: Quaternion, end: Quaternion, t: float) -> Quaternion:
+        """
+        Return the spherical linear interpolation of quaternions, see slerp.
+        """
+
+        return Quaternion(*slerp(start.to_list(), end.to_list(), t).tolist())
+
 
 class HeadingPitchRoll(_CesiumObject):
     """
@@ -129,19 +164,29 @@ class HeadingPitchRoll(_CesiumObject):
         pitch: float,
         roll: float,
     ) -> HeadingPitchRoll:
-        return _HeadingPitchRollFromDegrees(
-            heading=heading,
-            pitch=pitch,
-            roll=roll,
+        return HeadingPitchRoll(
+            heading=math.radians(heading),
+            pitch=math.radians(pitch),
+            roll=math.radians(roll),
         )
 
     @staticmethod
     def from_quaternion(
         quaternion: Quaternion,
     ) -> HeadingPitchRoll:
-        return _HeadingPitchRollFromQuaternion(
-            quaternion=quaternion,
-        )
+        if not _is_concrete(quaternion):
+            return _HeadingPitchRollFromQuaternion(
+                quaternion=quaternion,
+            )
+        return HeadingPitchRoll(*to_heading_pitch_roll(quaternion.to_list()).tolist())
+
+
+# Deferred values, computed by Cesium from values which are only known in the
+# browser
+
+
+def _is_concrete(value) -> bool:
+    return type(value) in (Quaternion, HeadingPitchRoll)
 
 
 class _QuaternionFromProduct(Quaternion):
@@ -168,30 +213,6 @@ class _QuaternionFromProduct(Quaternion):
         return f"Cesium.Quaternion.multiply({self.quaternion_2.generate_script(widget=widget)}, {self.quaternion_1.generate_script(widget=widget)}, {Quaternion.unit().generate_script(widget=widget)})"
 
 
-class _QuaternionFromAxisAngle(Quaternion):
-    # Constructor
-
-    def __init__(
-        self,
-        axis: cesiumpy.Cartesian3,
-        angle: float,
-    ) -> None:
-        super().__init__(
-            x=0.0,
-            y=0.0,
-            z=0.0,
-            w=0.0,
-        )
-
-        self.axis = axis
-        self.angle = angle
-
-    # Methods
-
-    def generate_script(self, widget=None) -> str:
-        return f"Cesium.Quaternion.fromAxisAngle({self.axis.generate_script(widget=widget)}, {self.angle})"
-
-
 class _QuaternionFromHeadingPitchRoll(Quaternion):
     # Constructor
 
@@ -214,27 +235,6 @@ class _QuaternionFromHeadingPitchRoll(Quaternion):
         return f"Cesium.Quaternion.fromHeadingPitchRoll({self.heading_pitch_roll.generate_script(widget=widget)})"
 
 
-class _HeadingPitchRollFromDegrees(HeadingPitchRoll):
-    # Constructor
-
-    def __init__(
-        self,
-        heading: float,
-        pitch: float,
-        roll: float,
-    ) -> None:
-        super().__init__(
-            heading=heading,
-            pitch=pitch,
-            roll=roll,
-        )
-
-    # Methods
-
-    def generate_script(self, widget=None) -> str:
-        return f"Cesium.HeadingPitchRoll.fromDegrees({self.heading}, {self.pitch}, {self.roll})"
-
-
 class _HeadingPitchRollFromQuaternion(HeadingPitchRoll):
     # Constructor
 
@@ -254,3 +254,216 @@ class _HeadingPitchRollFromQuaternion(HeadingPitchRoll):
 
     def generate_script(self, widget=None) -> str:
         return f"Cesium.HeadingPitchRoll.fromQuaternion({self.quaternion.generate_script(widget=widget)})"
+
+
+# --------------------------------------------------
+# Vectorized algebra
+# --------------------------------------------------
+
+# quaternions are arrays of components x, y, z and w along their last axis,
+# computed as Cesium.Quaternion does
+
+
+def multiply(left, right):
+    """
+    Return products of quaternions, as Cesium.Quaternion.multiply.
+
+    Parameters
+    ----------
+
+    left: array-like
+        Quaternions of shape (..., 4).
+    right: array-like
+        Quaternions of shape (..., 4), broadcast against left.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Products of shape (..., 4).
+    """
+    import numpy as np
+
+    x1, y1, z1, w1 = np.moveaxis(np.asarray(left, dtype=np.float64), -1, 0)
+    x2, y2, z2, w2 = np.moveaxis(np.asarray(right, dtype=np.float64), -1, 0)
+    return np.stack(
+        [
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        ],
+        axis=-1,
+    )
+
+
+def normalize(quaternions):
+    """
+    Return quaternions of shape (..., 4) divided by their magnitudes.
+    """
+    import numpy as np
+
+    quaternions = np.asarray(quaternions, dtype=np.float64)
+    return quaternions / np.linalg.norm(quaternions, axis=-1, keepdims=True)
+
+
+def slerp(start, end, t):
+    """
+    Return the spherical linear interpolation of quaternions at t, as
+    Cesium.Quaternion.slerp: the shortest of the two rotations is
+    interpolated, linearly when quaternions are nearly equal.
+
+    Parameters
+    ----------
+
+    start: array-like
+        Quaternions at t = 0, of shape (..., 4).
+    end: array-like
+        Quaternions at t = 1, of shape (..., 4).
+    t: float or array-like
+        Interpolation parameters, of shape (...).
+    """
+    import numpy as np
+
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)[..., np.newaxis]
+
+    dot = np.einsum("...i,...i->...", start, end)[..., np.newaxis]
+    end = np.where(dot < 0.0, -end, end)
+    dot = np.abs(dot)
+
+    theta = np.arccos(np.minimum(dot, 1.0))
+    linear = 1.0 - dot < 1e-6
+    sin = np.where(linear, 1.0, np.sin(theta))
+    return np.where(
+        linear,
+        start + t * (end - start),
+        (start * np.sin((1.0 - t) * theta) + end * np.sin(t * theta)) / sin,
+    )
+
+
+def from_axis_angle(axes, angles):
+    """
+    Return quaternions of rotations by angles in radians about axes, as
+    Cesium.Quaternion.fromAxisAngle.
+
+    Parameters
+    ----------
+
+    axes: array-like
+        Axes of shape (..., 3), which are normalized.
+    angles: float or array-like
+        Angles of shape (...).
+    """
+    import numpy as np
+
+    axes = np.asarray(axes, dtype=np.float64)
+    axes = axes / np.linalg.norm(axes, axis=-1, keepdims=True)
+    half = np.asarray(angles, dtype=np.float64)[..., np.newaxis] / 2.0
+
+    vectors, w = axes * np.sin(half), np.cos(half)
+    shape = np.broadcast_shapes(vectors.shape[:-1], w.shape[:-1])
+    return np.concatenate(
+        [np.broadcast_to(vectors, shape + (3,)), np.broadcast_to(w, shape + (1,))],
+        axis=-1,
+    )
+
+
+def from_heading_pitch_roll(heading, pitch, roll):
+    """
+    Return quaternions of headings, pitches and rolls in radians, as
+    Cesium.Quaternion.fromHeadingPitchRoll.
+    """
+    import numpy as np
+
+    heading, pitch, roll = np.broadcast_arrays(heading, pitch, roll)
+    rotation = multiply(
+        from_axis_angle([0.0, 1.0, 0.0], -pitch),
+        from_axis_angle([1.0, 0.0, 0.0], roll),
+    )
+    return multiply(from_axis_angle([0.0, 0.0, 1.0], -heading), rotation)
+
+
+def to_heading_pitch_roll(quaternions):
+    """
+    Return headings, pitches and rolls in radians of quaternions, as
+    Cesium.HeadingPitchRoll.fromQuaternion.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Headings, pitches and rolls of shape (..., 3).
+    """
+    import numpy as np
+
+    x, y, z, w = np.moveaxis(np.asarray(quaternions, dtype=np.float64), -1, 0)
+    heading = -np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    pitch = -np.arcsin(np.clip(2.0 * (w * y - z * x), -1.0, 1.0))
+    roll = np.arctan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    return np.stack([heading, pitch, roll], axis=-1)
+
+
+def from_rotation_matrix(matrices):
+    """
+    Return quaternions of rotation matrices, as
+    Cesium.Quaternion.fromRotationMatrix.
+
+    Parameters
+    ----------
+
+    matrices: array-like
+        Rotation matrices of shape (..., 3, 3), whose columns are the axes
+        of the rotated frame.
+
+    Returns
+    -------
+
+    numpy.ndarray
+        Quaternions of shape (..., 4), whose w is not negative.
+    """
+    import numpy as np
+
+    m = np.asarray(matrices, dtype=np.float64)
+    m00, m11, m22 = m[..., 0, 0], m[..., 1, 1], m[..., 2, 2]
+    trace = m00 + m11 + m22
+
+    # 4 x², 4 y², 4 z² and 4 w², the other components are divided by the
+    # largest one so that they are accurate
+    squares = np.stack(
+        [
+            1.0 + m00 - m11 - m22,
+            1.0 - m00 + m11 - m22,
+            1.0 - m00 - m11 + m22,
+            1.0 + trace,
+        ],
+        axis=-1,
+    )
+    largest = np.argmax(squares, axis=-1)
+    square = np.take_along_axis(squares, largest[..., np.newaxis], -1)[..., 0]
+    s = 2.0 * np.sqrt(square)
+
+    xy = m[..., 0, 1] + m[..., 1, 0]
+    xz = m[..., 0, 2] + m[..., 2, 0]
+    yz = m[..., 1, 2] + m[..., 2, 1]
+    wx = m[..., 2, 1] - m[..., 1, 2]
+    wy = m[..., 0, 2] - m[..., 2, 0]
+    wz = m[..., 1, 0] - m[..., 0, 1]
+    candidates = np.stack(
+        [
+            np.stack([square, xy, xz, wx], axis=-1),
+            np.stack([xy, square, yz, wy], axis=-1),
+            np.stack([xz, yz, square, wz], axis=-1),
+            np.stack([wx, wy, wz, square], axis=-1),
+        ],
+        axis=-2,
+    )
+    quaternions = (
+        np.take_along_axis(candidates, largest[..., np.newaxis, np.newaxis], -2)[
+            ..., 0, :
+        ]
+        / s[..., np.newaxis]
+    )
+    # the quaternion and its opposite are the same rotation
+    return np.where(quaternions[..., 3:] < 0.0, -quaternions, quaternions)
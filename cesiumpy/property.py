@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any, Type, Optional
 
 from cesiumpy.base import _CesiumEnum
 from cesiumpy.base import _CesiumObject
 from cesiumpy.util.name import generate_name
+from cesiumpy.util.serializer import _as_utc, encode_array, encode_time
+from cesiumpy.util.trait import trusted
+
+_MICROSECOND = timedelta(microseconds=1)
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
 class ReferenceFrame(_CesiumEnum):
@@ -39,6 +44,24 @@ class Property(_CesiumObject):
 
 
 class SampledProperty(Property):
+    """
+    Property interpolated from samples, stored by columns: times as integer
+    microseconds from the first sample and values as float64 array of
+    shape (N, k) of the components of type, such as x, y and z of
+    Cartesian3. Values which have no components, such as quaternions
+    computed by Cesium, are kept as objects.
+
+    Parameters
+    ----------
+
+    type: type
+        Class of values, such as Cartesian3 or Quaternion.
+    name: str, optional
+        Name of the property in the page.
+    samples: list of tuples, optional
+        Time, value and derivatives of samples.
+    """
+
     # Constructor
 
     def __init__(
@@ -55,24 +78,274 @@ class SampledProperty(Property):
         )
 
         self._type = type
-        self._samples: list[tuple[datetime, Any, Optional[list[Any]]]] = samples or []
         self._derivative_types = derivative_types
 
+        # components of values, empty when values are only kept as objects
+        self._components: tuple[str, ...] = getattr(type, "_components", ())
+        # whether values are in degrees, set by the first sample
+        self._degrees: Optional[bool] = None
+
+        self._epoch: Optional[datetime] = None
+        self._offsets = None
+        self._values = None
+        # samples added one by one, appended to columns when they are read
+        self._pending: list[tuple[int, tuple[float, ...]]] = []
+
+        self._objects: dict[int, Any] = {}
+        self._derivatives: dict[int, list[Any]] = {}
+
+        # interpolation options, Cesium defaults to linear interpolation
+        self._interpolation: Optional[str] = None
+        self._interpolation_degree: int = 1
+
+        for sample in samples or []:
+            self.add_sample(*sample)
+
     # Properties
 
     @property
     def samples(self) -> list[tuple[datetime, Any, Optional[list[Any]]]]:
-        return self._samples
+        """Time, value and derivatives of samples, built from columns"""
+        return list(self._iter_samples())
+
+    @property
+    def epoch(self) -> Optional[datetime]:
+        """Time of the first sample added, from which times are counted"""
+        return self._epoch
+
+    @property
+    def times(self):
+        """Times of samples, as numpy.datetime64 array in microseconds"""
+        offsets, _ = self._columns()
+        epoch = self._epoch_microseconds()
+        return (offsets + epoch).astype("datetime64[us]")
+
+    @property
+    def values(self):
+        """Values of samples, as float64 array of shape (N, k)"""
+        _, values = self._columns()
+        return values
+
+    @property
+    def interpolation(self) -> str:
+        """Name of interpolation, see set_interpolation_options"""
+        return self._interpolation or "linear"
+
+    @property
+    def interpolation_degree(self) -> int:
+        return self._interpolation_degree
 
     # Methods
 
+    def __len__(self) -> int:
+        return (0 if self._offsets is None else len(self._offsets)) + len(self._pending)
+
     def add_sample(
         self,
         time: datetime,
         value: Any,
         derivatives: Optional[list[Any]] = None,
     ) -> None:
-        self._samples.append((time, value, derivatives))
+        index = len(self)
+        if self._epoch is None:
+            self._epoch = time
+
+        row = self._row(value)
+        if row is None:
+            self._objects[index] = value
+            row = (float("nan"),) * len(self._components)
+
+        if derivatives is not None:
+            self._derivatives[index] = derivatives
+        self._pending.append((self._offset(time), row))
+
+    def add_samples(
+        self,
+        times,
+        values,
+        epoch: Optional[datetime] = None,
+        degrees: bool = False,
+    ) -> None:
+        """
+        Add samples from arrays at once, without creating value objects.
+
+        Parameters
+        ----------
+
+        times: array-like
+            Times as numpy.datetime64 in UTC or datetime, or seconds from epoch.
+        values: array-like
+            Components of values of shape (N, k), such as x, y and z of
+            Cartesian3, or longitude, latitude and height if degrees.
+        epoch: datetime, optional
+            Origin of times given in seconds, the first sample by default.
+        degrees: bool, default False
+            Whether values are positions in degrees.
+        """
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64)
+        times = np.asarray(times)
+        if values.shape != (len(times), len(self._components)):
+            msg = "values must be an array of shape (N, {k}): {shape}"
+            raise ValueError(msg.format(k=len(self._components), shape=values.shape))
+
+        if self._degrees is None:
+            self._degrees = degrees
+        elif self._degrees != degrees:
+            msg = "degrees must be consistent with samples: {degrees}"
+            raise ValueError(msg.format(degrees=degrees))
+
+        if self._epoch is None:
+            if times.dtype.kind in "iuf":
+                if epoch is None:
+                    raise ValueError("epoch is required for times in seconds")
+                self._epoch = epoch
+            elif times.dtype.kind == "M" and len(times):
+                microseconds = int(times[0].astype("datetime64[us]").astype(np.int64))
+                self._epoch = _UNIX_EPOCH + timedelta(microseconds=microseconds)
+            elif len(times):
+                self._epoch = times[0]
+        offsets = self._time_offsets(times, epoch=epoch)
+
+        current_offsets, current_values = self._columns()
+        self._offsets = np.concatenate([current_offsets, offsets])
+        self._values = np.concatenate([current_values, values])
+        self._sort()
+
+    def set_interpolation_options(
+        self,
+        interpolation: str = "linear",
+        degree: int = 1,
+    ) -> None:
+        """
+        Set the interpolation used by Cesium between samples.
+
+        Parameters
+        ----------
+
+        interpolation: str, default "linear"
+            One of "linear", "lagrange" or "hermite". Without derivatives,
+            Hermite interpolation is the same as Lagrange interpolation.
+        degree: int, default 1
+            Degree of interpolation, always 1 for linear interpolation.
+        """
+        from cesiumpy.math.interpolation import validate_interpolation
+
+        self._interpolation_degree = validate_interpolation(interpolation, degree)
+        self._interpolation = interpolation
+
+    def decimate(
+        self,
+        max_error: float,
+        interpolation: Optional[str] = None,
+        degree: Optional[int] = None,
+    ) -> SampledProperty:
+        """
+        Remove samples which are interpolated by Cesium within max_error from
+        the remaining samples, see cesiumpy.math.interpolation.decimate_mask.
+        Positions are compared in the Earth-fixed frame, as Cesium
+        interpolates them.
+
+        Parameters
+        ----------
+
+        max_error: float
+            Largest error in meters of interpolated positions, or in radians
+            of interpolated quaternions.
+        interpolation: str, optional
+            Interpolation to set, see set_interpolation_options. The current
+            interpolation by default.
+        degree: int, optional
+            Degree of interpolation to set, 5 for Lagrange and Hermite
+            interpolations by default.
+
+        Returns
+        -------
+
+        SampledProperty
+            The property itself.
+        """
+        import numpy as np
+
+        from cesiumpy.math.interpolation import decimate_mask
+        from cesiumpy.orientation import Quaternion
+
+        if interpolation is not None or degree is not None:
+            interpolation = interpolation or self.interpolation
+            if degree is None:
+                degree = 1 if interpolation == "linear" else 5
+            self.set_interpolation_options(interpolation, degree)
+
+        packed = self._known_samples("decimate")
+        if packed is None or len(packed) < 3:
+            return self
+
+        offsets, values = self._columns()
+        keep = decimate_mask(
+            packed[:, 0],
+            packed[:, 1:],
+            max_error,
+            degree=self._interpolation_degree,
+            quaternions=issubclass(self._type, Quaternion),
+        )
+
+        kept = np.flatnonzero(keep)
+        reindex = {old: new for new, old in enumerate(kept.tolist())}
+        self._derivatives = {
+            reindex[index]: derivatives
+            for index, derivatives in self._derivatives.items()
+            if index in reindex
+        }
+        self._offsets, self._values = offsets[keep], values[keep]
+        return self
+
+    def get_value(self, time):
+        """
+        Return values interpolated at times as Cesium does, see
+        set_interpolation_options. Positions are interpolated in the
+        Earth-fixed frame, and times outside the samples have no value.
+
+        Parameters
+        ----------
+
+        time: datetime or array-like
+            Time, or times as numpy.datetime64 in UTC, datetime, or seconds
+            from epoch.
+
+        Returns
+        -------
+
+        value or numpy.ndarray
+            Value of type at time, None outside the samples, or float64 array
+            of shape (M, k) of values at times, NaN outside the samples.
+        """
+        import numpy as np
+
+        from cesiumpy.math.interpolation import interpolate, interpolate_quaternions
+        from cesiumpy.orientation import Quaternion
+
+        packed = self._known_samples("interpolate")
+        if packed is None:
+            raise ValueError(f"Unable to interpolate without samples: {self.name}")
+
+        times = np.asarray(time)
+        query = self._time_offsets(times.reshape(-1)) / 1e6
+
+        seconds = packed[:, 0]
+        if issubclass(self._type, Quaternion):
+            func = interpolate_quaternions
+        else:
+            func = interpolate
+        values = func(seconds, packed[:, 1:], query, self._interpolation_degree)
+        values[(query < seconds[0]) | (query > seconds[-1])] = np.nan
+
+        if times.ndim:
+            return values
+        if np.isnan(values[0]).any():
+            return None
+        with trusted():
+            return self._type(*values[0].tolist())
 
     def generate_script(self, widget=None):
         # TBI: derivatives not supported
@@ -89,11 +362,37 @@ class SampledProperty(Property):
             )
         )
 
-        for time, value, _ in self._samples:
+        if self._interpolation is not None:
+            property_scripts.append(
+                "{widget}.{name}.setInterpolationOptions({options});".format(
+                    widget=widget._varname,
+                    name=self.name,
+                    options=self._interpolation_options(),
+                )
+            )
+
+        packed = self._packed_samples()
+        if packed is not None:
+            property_scripts.append(
+                "{widget}.{name}.addSamplesPackedArray({data}, {epoch});".format(
+                    widget=widget._varname,
+                    name=self.name,
+                    data=self._encode_packed(packed, widget),
+                    epoch=encode_time(self._epoch, widget=widget),
+                )
+            )
+
+        # values computed by Cesium are added one by one
+        relative = getattr(widget, "_time_epoch", None) is not None
+        for time, value, _ in self._iter_samples(objects=True):
             pre_script: str = "{widget}.{name}.addSample({time}, {value});".format(
                 widget=widget._varname,
                 name=self.name,
-                time=f'"{time.isoformat()}"',
+                time=(
+                    encode_time(time, widget=widget)
+                    if relative
+                    else f'"{time.isoformat()}"'
+                ),
                 value=value.generate_script(widget=widget),
             )
 
@@ -102,3 +401,147 @@ class SampledProperty(Property):
         widget.register_property(self.name, property_scripts)
 
         return f"{widget._varname}.{self.name}"
+
+    # Private methods
+
+    def _interpolation_options(self) -> str:
+        from cesiumpy.math.interpolation import INTERPOLATIONS
+
+        algorithm = INTERPOLATIONS[self._interpolation]
+        degree = self._interpolation_degree
+        return f"{{interpolationAlgorithm: {algorithm}, interpolationDegree: {degree}}}"
+
+    def _row(self, value) -> Optional[tuple[float, ...]]:
+        """Return components of value, or None if it must be kept as object"""
+
+        # subclasses are computed by Cesium, such as products of quaternions
+        if not self._components or type(value) is not self._type:
+            return None
+
+        degrees = getattr(value, "_is_degrees", False)
+        if self._degrees is None:
+            self._degrees = degrees
+        elif self._degrees != degrees:
+            return None
+
+        return tuple(getattr(value, c) for c in self._components)
+
+    def _columns(self):
+        """Return offsets and values, after appending pending samples"""
+        import numpy as np
+
+        if self._offsets is None:
+            self._offsets = np.zeros(0, dtype=np.int64)
+            self._values = np.zeros((0, len(self._components)), dtype=np.float64)
+
+        if self._pending:
+            offsets, rows = zip(*self._pending)
+            self._pending = []
+            self._offsets = np.concatenate([self._offsets, offsets])
+            self._values = np.concatenate(
+                [self._values, np.array(rows, dtype=np.float64)]
+            )
+            self._sort()
+
+        return self._offsets, self._values
+
+    def _sort(self) -> None:
+        """Sort samples by time, as Cesium merges them"""
+        import numpy as np
+
+        offsets = self._offsets
+        if (offsets[1:] >= offsets[:-1]).all():
+            return
+
+        # samples at the same time are kept in the order they were added
+        order = np.argsort(offsets, kind="stable")
+        reindex = np.empty_like(order)
+        reindex[order] = np.arange(len(order))
+        self._objects = {int(reindex[i]): v for i, v in self._objects.items()}
+        self._derivatives = {int(reindex[i]): v for i, v in self._derivatives.items()}
+        self._offsets, self._values = offsets[order], self._values[order]
+
+    def _known_samples(self, action: str):
+        """Return packed samples, whose values must all be known"""
+        if self._objects or not self._components:
+            # values computed by Cesium are not known
+            msg = "Unable to {action} samples computed in the browser: {name}"
+            raise ValueError(msg.format(action=action, name=self.name))
+        return self._packed_samples()
+
+    def _time_offsets(self, times, epoch: Optional[datetime] = None):
+        """Return microseconds of times from the epoch of samples"""
+        import numpy as np
+
+        if not len(times):
+            # no epoch is known before the first sample
+            return np.zeros(0, dtype=np.int64)
+        if times.dtype.kind == "M":
+            microseconds = times.astype("datetime64[us]").astype(np.int64)
+            return microseconds - self._epoch_microseconds()
+        if times.dtype.kind in "iuf":
+            shift = 0 if epoch is None else self._offset(epoch)
+            return np.round(times * 1e6).astype(np.int64) + shift
+        return np.array([self._offset(t) for t in times], dtype=np.int64)
+
+    def _offset(self, time: datetime) -> int:
+        """Return microseconds of time from the epoch of samples"""
+        epoch = self._epoch
+        if (time.tzinfo is None) != (epoch.tzinfo is None):
+            # naive datetimes are in UTC, as numpy.datetime64
+            time, epoch = _as_utc(time), _as_utc(epoch)
+        return (time - epoch) // _MICROSECOND
+
+    def _epoch_microseconds(self) -> int:
+        return (_as_utc(self._epoch) - _UNIX_EPOCH) // _MICROSECOND
+
+    def _iter_samples(self, objects: bool = False):
+        """Yield samples, or only the ones kept as objects if objects"""
+        offsets, values = self._columns()
+        if objects:
+            indices = sorted(self._objects)
+        else:
+            indices = range(len(offsets))
+
+        kwargs = {"degrees": True} if self._degrees else {}
+        with trusted():
+            # values were validated when they were added
+            for index in indices:
+                time = self._epoch + timedelta(microseconds=int(offsets[index]))
+                value = self._objects.get(index)
+                if value is None:
+                    value = self._type(*values[index].tolist(), **kwargs)
+                yield time, value, self._derivatives.get(index)
+
+    def _packed_samples(self):
+        """
+        Return rows of seconds from epoch followed by packed values, as
+        Cesium packs them, of samples which are not kept as objects.
+        """
+        import numpy as np
+
+        offsets, values = self._columns()
+        mask = np.ones(len(offsets), dtype=bool)
+        mask[list(self._objects)] = False
+        if not self._components or not mask.any():
+            return None
+
+        values = values[mask]
+        if self._degrees:
+            from cesiumpy.math.geodesy import geodetic_to_ecef
+
+            # Cartesian3 are packed in the Earth-fixed frame
+            values = geodetic_to_ecef(values[:, 0], values[:, 1], values[:, 2])
+        return np.column_stack([offsets[mask] / 1e6, values])
+
+    def _encode_packed(self, packed, widget) -> str:
+        encoding = getattr(widget, "_array_encoding", None)
+        if encoding is None:
+            return str(packed.reshape(-1).tolist())
+
+        # microseconds, then units of components
+        scales = getattr(self._type, "_quantization_scales", None)
+        if scales is not None:
+            scales = (1e6,) + tuple(scales)
+        # seconds of the whole span, and Cartesian3 in meters
+        return encode_array(packed, encoding, scales=scales, float32=False)
@@ -86,29 +86,14 @@ class Sensor(abc.ABC):
         self,
         satellite: cesiumpy.Satellite,
     ) -> cesiumpy.SampledPositionProperty:
-        sampled_position = cesiumpy.SampledPositionProperty(
-            name=f"{self.name}_position",
-        )
-
-        for time, lla_B, _ in satellite.position.samples:
-            lla_S = lla_B  # TBI
-
-            sampled_position.add_sample(
-                time=time,
-                position=lla_S,
-            )
-
-        return sampled_position
+        # sensors are mounted at the position of the satellite, whose property
+        # is shared so that its samples are only written once in the page
+        return satellite.position
 
     def _generate_orientation(
         self,
         satellite: cesiumpy.Satellite,
     ) -> cesiumpy.SampledProperty:
-        sampled_orientation = cesiumpy.SampledProperty(
-            type=cesiumpy.Quaternion,
-            name=f"{self.name}_orientation",
-        )
-
         x_direction: cesiumpy.Cartesian3 = cesiumpy.Cartesian3(0.0, 0.0, 1.0)
 
         q_S_B: Optional[cesiumpy.Quaternion] = None
@@ -126,16 +111,33 @@ class Sensor(abc.ABC):
                     angle=cesiumpy.math.to_radians(180.0),
                 )
 
-        for time, q_B_ECEF, _ in satellite.orientation.samples:
-            if q_S_B is not None:
-                q_S_ECEF = q_S_B * q_B_ECEF
+        orientation: cesiumpy.SampledProperty = satellite.orientation
 
-            else:
-                q_S_ECEF = q_B_ECEF
+        # sensors pointing along the z axis share the satellite orientation
+        if q_S_B is None:
+            return orientation
+
+        sampled_orientation = cesiumpy.SampledProperty(
+            type=cesiumpy.Quaternion,
+            name=f"{self.name}_orientation",
+        )
+        if orientation.interpolation != "linear":
+            sampled_orientation.set_interpolation_options(
+                orientation.interpolation, orientation.interpolation_degree
+            )
+
+        if orientation._objects:
+            # products with quaternions computed by Cesium are deferred
+            for time, q_B_ECEF, _ in orientation.samples:
+                sampled_orientation.add_sample(
+                    time=time,
+                    value=q_S_B * q_B_ECEF,
+                )
 
-            sampled_orientation.add_sample(
-                time=time,
-                value=q_S_ECEF,
+        else:
+            sampled_orientation.add_samples(
+                orientation.times,
+                cesiumpy.orientation.multiply(orientation.values, q_S_B.to_list()),
             )
 
         return sampled_orientation
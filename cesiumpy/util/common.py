@@ -6,6 +6,7 @@ import collections
 import importlib
 import itertools
 import datetime
+import sys
 
 from cesiumpy.util import case
 
@@ -103,17 +104,30 @@ def validate_listlike_lonlat(x, key):
 
 
 def validate_listlike_lonlatalt(x, key):
-    """validate whether x is list-likes consists from lon, lat, alt tuples"""
+    """
+    validate whether x is list-likes consists from lon, lat, alt tuples, either
+    flat or of shape (N, 3), and return it as contiguous float64 array of shape
+    (N, 3). Arrays which are already so are not copied.
+    """
+    import numpy as np
+
+    msg = "{key} must be a list consists from longitude and latitude: {x}"
     try:
-        assert len(x) % 3 == 0
-        all(validate_longitude(e, key=key) for e in x[::3])
-        all(validate_latitude(e, key=key) for e in x[1::3])
-        # validation will raise ValueError immediately
-    except ValueError:
-        msg = "{key} must be a list consists from longitude and latitude: {x}"
+        values = np.asarray(x, dtype=np.float64)
+    except (TypeError, ValueError):
         raise ValueError(msg.format(key=key, x=x))
 
-    return x
+    if values.ndim == 1 and len(values) % 3 == 0:
+        values = values.reshape(-1, 3)
+    if values.ndim != 2 or values.shape[1] != 3:
+        raise ValueError(msg.format(key=key, x=x))
+    values = np.ascontiguousarray(values)
+
+    # comparisons are False for NaN, which is invalid as well
+    valid = (np.abs(values[:, 0]) <= 180).all() and (np.abs(values[:, 1]) <= 90).all()
+    if not valid:
+        raise ValueError(msg.format(key=key, x=x))
+    return values
 
 
 # --------------------------------------------------
@@ -139,23 +153,20 @@ def is_latitude(x):
     return False
 
 
-try:
-    import numpy as np
-
-    listlike_types = (list, tuple, np.ndarray)
-except ImportError:
-    listlike_types = (list, tuple)
-
-
 def is_listlike(x):
     """whether the input can be regarded as list"""
+    if isinstance(x, (list, tuple)):
+        return True
     if hasattr(x, "__array__"):
         # array interface
         x = x.__array__()
         if x.ndim == 0:
             # 0 dimensional array
             return False
-    return isinstance(x, listlike_types)
+    # numpy is not imported here as importing it is slow, arrays can only
+    # exist once it is imported
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(x, np.ndarray)
 
 
 def is_listlike_2elem(x):
@@ -181,9 +192,10 @@ def to_jsscalar(x, widget=None):
     """convert x to JavaScript representation"""
 
     from cesiumpy.base import _CesiumObject, _CesiumEnum
+    from cesiumpy.util.serializer import encode_time, intern_script
 
     if isinstance(x, (_CesiumObject, _CesiumEnum)):
-        return x.generate_script(widget=widget)
+        return intern_script(x.generate_script(widget=widget), widget=widget)
 
     if isinstance(x, bool):
         # convert to JavaScript repr
@@ -191,7 +203,7 @@ def to_jsscalar(x, widget=None):
     elif isinstance(x, str):
         x = f'"{x}"'
     elif isinstance(x, datetime.datetime):
-        x = f'Cesium.JulianDate.fromIso8601("{x.isoformat()}")'
+        x = encode_time(x, widget=widget)
     elif isinstance(x, dict):
         x = "".join(to_jsobject(x, widget=widget))
     elif isinstance(x, list):
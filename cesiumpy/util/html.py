@@ -2,21 +2,36 @@
 
 from __future__ import unicode_literals
 
+import base64
 import os
+import re
+import string
 import warnings
-from typing import List, Union
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 
-def build_html(*args):
-    results = []
+def iter_html(*args) -> Iterator[str]:
+    """Yield HTML lines from str, list of str or iterators of str"""
     for a in args:
-        if isinstance(a, list):
-            results.extend(a)
-        elif isinstance(a, str):
-            results.append(a)
+        if isinstance(a, str):
+            yield a
+        elif isinstance(a, (list, Iterator)):
+            yield from a
         else:
             raise ValueError(type(a))
-    return os.linesep.join(results)
+
+
+def build_html(*args):
+    return os.linesep.join(iter_html(*args))
+
+
+def write_html(fp, *args) -> None:
+    """Write HTML lines to file-like object one by one"""
+    for i, line in enumerate(iter_html(*args)):
+        if i > 0:
+            fp.write(os.linesep)
+        fp.write(line)
 
 
 def check_uri(sourceUri):
@@ -36,34 +51,276 @@ def wrap_uri(sourceUri):
 
 
 def wrap_scripts(scripts: Union[List[str], str]) -> List[str]:
+    return list(iter_wrap_scripts(scripts))
+
+
+def iter_wrap_scripts(
+    scripts: Union[Iterable[str], str], indent: int = 2
+) -> Iterator[str]:
+    """Lazily wrap scripts with script tag, consuming scripts one by one"""
     if isinstance(scripts, str):
         scripts = [scripts]
 
     # filter None and empty str
-    scripts = [s for s in scripts if ((s is not None) and len(s) > 0)]
+    scripts = (s for s in scripts if ((s is not None) and len(s) > 0))
+
+    yield '<script type="text/javascript">'
+    yield from _iter_add_indent(
+        _iter_wrap_async_init(scripts, indent=indent), indent=indent
+    )
+    yield "</script>"
 
-    before: List[str] = [
-        '<script type="text/javascript">',
-    ]
 
-    after: List[str] = [
-        "</script>",
-    ]
+def _wrap_async_init(scripts: List[str]) -> List[str]:
+    return list(_iter_wrap_async_init(scripts))
 
-    return before + _add_indent(_wrap_async_init(scripts)) + after
 
+def _iter_wrap_async_init(scripts: Iterable[str], indent: int = 2) -> Iterator[str]:
+    yield "async function init() {"
+    yield from _iter_add_indent(scripts, indent=indent)
+    yield "}"
+    yield "init();"
+
+
+# --------------------------------------------------
+# Compact output
+# --------------------------------------------------
+
+# string literals are kept as they are, captured to be returned by split
+_STRING = re.compile(r"""("(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)""")
+# spaces around punctuation which are always removable, replaced without regex
+_PUNCTUATION_SPACES = [(f"{c} ", c) for c in ",:;{(["] + [(f" {c}", c) for c in "})]"]
+_SPACES = re.compile(r"[ \t]+")
+_IDENTIFIER = re.compile(r"[\w$]")
+# lookbehinds follow the first character, so that the scan stays fast
+_FLOAT = re.compile(r"\d(?<![\w$.]\d)\d*(?:\.\d*(?:[eE][+-]?\d+)?|[eE][+-]?\d+)")
+_CESIUM = re.compile(r"Cesium\.(?<![\w$.]Cesium\.)")
+
+# short name of Cesium namespace in compact output
+CESIUM_ALIAS = "$C"
+
+# keys of entity options are shortened in compact output, and expanded back
+# in the page by a function looking them up in a table filled as they appear
+KEY_TABLE = "$K"
+KEY_EXPANDER = "$E"
+_KEY_SCRIPTS = [
+    f"const {KEY_TABLE}={{}};",
+    f"function {KEY_EXPANDER}(o){{const r={{}};for(const k in o){{const v=o[k];"
+    f"r[{KEY_TABLE}[k]||k]=v&&v.constructor===Object?{KEY_EXPANDER}(v):v;}}"
+    "return r;}",
+]
+_ENTITY_ADD = re.compile(r"^((?:await )?[\w$.]+\.entities\.add\()(\{.*\})(\);)$", re.S)
+# keys directly following the opening brace or a comma, and brackets
+_KEY_OR_BRACKET = re.compile(r"(?<=[{,])([A-Za-z_$][\w$]*):(\{)?|[{}()\[\]]")
+
+
+def _strip_spaces(match) -> str:
+    # a space is needed between identifiers, and between signs as in "a - -1"
+    string, start, end = match.string, match.start(), match.end()
+    if start == 0 or end == len(string):
+        return ""
+    before, after = string[start - 1], string[end]
+    if _IDENTIFIER.match(before) and _IDENTIFIER.match(after):
+        return " "
+    if before in "+-" and after in "+-":
+        return " "
+    return ""
+
+
+def compact_script(
+    script: str, digits: Optional[int] = 10, alias: Optional[str] = None
+) -> str:
+    """
+    Remove spaces from script outside of string literals, format floats
+    with the specified number of significant digits, and refer to Cesium
+    namespace by alias if specified
+    """
+
+    def _format_float(match) -> str:
+        return format(float(match.group()), f".{digits}g")
+
+    parts = _STRING.split(script)
+    for i in range(0, len(parts), 2):
+        part = parts[i]
+        for old, new in _PUNCTUATION_SPACES:
+            part = part.replace(old, new)
+        if " " in part or "\t" in part:
+            part = _SPACES.sub(_strip_spaces, part)
+        if digits is not None:
+            part = _FLOAT.sub(_format_float, part)
+        if alias is not None:
+            part = _CESIUM.sub(f"{alias}.", part)
+        parts[i] = part
+    return "".join(parts)
+
+
+def _short_key(index: int) -> str:
+    letters = string.ascii_letters
+    name = ""
+    while True:
+        index, remainder = divmod(index, len(letters))
+        name = letters[remainder] + name
+        if index == 0:
+            return "$" + name
+        index -= 1
 
-def _wrap_async_init(scripts: List[str]) -> List[str]:
-    before: List[str] = [
-        "async function init() {",
-    ]
 
-    after: List[str] = [
-        "}",
-        "init();",
-    ]
+class _KeyShortener:
+    """
+    Shorten keys of the options of entities added by compacted scripts,
+    such as "pixelSize", which Cesium only reads by their full names.
 
-    return before + _add_indent(scripts) + after
+    Only keys of the object literals nested as values of keys are shortened,
+    which are the ones expanded back by KEY_EXPANDER. Objects passed to
+    functions and constructors are kept as they are.
+    """
+
+    def __init__(self):
+        self._names: Dict[str, str] = {}
+        self._pending: Dict[str, str] = {}
+
+    def _shorten(self, key: str) -> str:
+        name = self._names.get(key)
+        if name is None:
+            name = _short_key(len(self._names))
+            if len(name) >= len(key):
+                return key
+            self._names[key] = name
+            self._pending[name] = key
+        return name
+
+    def shorten(self, script: str) -> List[str]:
+        """
+        Return script with shortened keys, preceded by the declarations of
+        the new keys, and of KEY_EXPANDER at first
+        """
+        match = _ENTITY_ADD.match(script)
+        if match is None:
+            return [script]
+
+        # whether keys of the enclosing brackets are shortened
+        stack: List[bool] = []
+
+        def _replace(match) -> str:
+            key = match.group(1)
+            if key is None:
+                bracket = match.group()
+                if bracket in "{([":
+                    stack.append(bracket == "{" and not stack)
+                elif stack:
+                    stack.pop()
+                return bracket
+
+            shortened = stack[-1]
+            if match.group(2) is not None:
+                stack.append(shortened)
+            if not shortened:
+                return match.group()
+            return self._shorten(key) + ":" + (match.group(2) or "")
+
+        parts = _STRING.split(match.group(2))
+        for i in range(0, len(parts), 2):
+            parts[i] = _KEY_OR_BRACKET.sub(_replace, parts[i])
+        script = "{add}{expander}({options}){end}".format(
+            add=match.group(1),
+            expander=KEY_EXPANDER,
+            options="".join(parts),
+            end=match.group(3),
+        )
+
+        if not self._pending:
+            return [script]
+        # the expander is declared with the first keys
+        scripts = _KEY_SCRIPTS[:] if len(self._pending) == len(self._names) else []
+        keys = ",".join(f'{name}:"{key}"' for name, key in self._pending.items())
+        self._pending.clear()
+        return scripts + [f"Object.assign({KEY_TABLE},{{{keys}}});", script]
+
+
+def iter_compact_scripts(
+    scripts: Iterable[str], digits: Optional[int] = 10, short_keys: bool = True
+) -> Iterator[str]:
+    """
+    Lazily compact scripts, referring to Cesium namespace by CESIUM_ALIAS,
+    and shortening keys of entity options if short_keys is True
+    """
+    yield f"const {CESIUM_ALIAS}=Cesium;"
+    if not short_keys:
+        for s in scripts:
+            yield compact_script(s, digits=digits, alias=CESIUM_ALIAS)
+        return
+
+    shortener = _KeyShortener()
+    for s in scripts:
+        yield from shortener.shorten(
+            compact_script(s, digits=digits, alias=CESIUM_ALIAS)
+        )
+
+
+# --------------------------------------------------
+# Compressed output
+# --------------------------------------------------
+
+# id of the element holding the compressed scripts
+PAYLOAD_ID = "cesiumpy-payload"
+
+# decompress the payload in the browser, then execute it as a script element
+_DECOMPRESS_SCRIPTS = [
+    "(async function () {",
+    f'  const payload = document.getElementById("{PAYLOAD_ID}").textContent;',
+    "  const binary = atob(payload);",
+    "  const bytes = new Uint8Array(binary.length);",
+    "  for (let i = 0; i < binary.length; i++) {",
+    "    bytes[i] = binary.charCodeAt(i);",
+    "  }",
+    "  const stream = new Blob([bytes])",
+    "    .stream()",
+    '    .pipeThrough(new DecompressionStream("gzip"));',
+    '  const script = document.createElement("script");',
+    "  script.text = await new Response(stream).text();",
+    "  document.body.appendChild(script);",
+    "})();",
+]
+
+
+def iter_compressed_scripts(
+    scripts: Iterable[str], level: int = 6, line_length: int = 4096
+) -> Iterator[str]:
+    """
+    Lazily gzip scripts and embed them as base64 lines, followed by a script
+    decompressing and executing them in the browser with DecompressionStream
+    """
+
+    # gzip container, as DecompressionStream does not accept raw zlib streams
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    # base64 of 3 bytes is 4 characters, so that lines can be encoded separately
+    size = line_length // 4 * 3
+
+    def _iter_lines(data: bytes, final: bool = False) -> Iterator[str]:
+        view = memoryview(data)
+        end = len(data) if final else len(data) // size * size
+        for start in range(0, end, size):
+            stop = start + size
+            yield base64.b64encode(view[start:stop]).decode("ascii")
+
+    yield f'<script type="application/octet-stream" id="{PAYLOAD_ID}">'
+
+    remainder = b""
+    for s in scripts:
+        if s is None or len(s) == 0:
+            continue
+        data = compressor.compress((s + "\n").encode("utf-8"))
+        if data:
+            data = remainder + data
+            yield from _iter_lines(data)
+            complete = len(data) // size * size
+            remainder = data[complete:]
+    yield from _iter_lines(remainder + compressor.flush(), final=True)
+
+    yield "</script>"
+    yield '<script type="text/javascript">'
+    yield from _iter_add_indent(_DECOMPRESS_SCRIPTS)
+    yield "</script>"
 
 
 def _add_indent(script, indent=2):
@@ -71,5 +328,10 @@ def _add_indent(script, indent=2):
     if not isinstance(script, list):
         script = [script]
 
+    return list(_iter_add_indent(script, indent=indent))
+
+
+def _iter_add_indent(scripts: Iterable[str], indent: int = 2) -> Iterator[str]:
     indent = " " * indent
-    return [indent + s for s in script]
+    for s in scripts:
+        yield indent + s
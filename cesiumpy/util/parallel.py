@@ -0,0 +1,181 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+import collections
+import datetime
+import io
+import pickle
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# keys of instance dict which are not needed to generate scripts
+_DROPPED_STATE = (
+    "_trait_notifiers",
+    "_trait_validators",
+    "_script_cache",
+    "_script_fingerprints",
+    "_script_parents",
+    "_script_tracked",
+)
+
+# --------------------------------------------------
+# Compact pickle
+# --------------------------------------------------
+
+
+def _restore(klass: type, state: dict):
+    # bypass HasTraits construction, scripts only read the instance dict
+    obj = object.__new__(klass)
+    obj.__dict__.update(state)
+    obj.__dict__["_trait_notifiers"] = {}
+    obj.__dict__["_trait_validators"] = {}
+    return obj
+
+
+class _CompactPickler(pickle.Pickler):
+    """
+    Pickler storing JavaScript instances as their class and instance dict,
+    which is much cheaper to load than the state of HasTraits.
+    """
+
+    def reducer_override(self, obj):
+        # cesiumpy.util.trait depends on serializer, which is imported first
+        from cesiumpy.util.trait import _JavaScriptObject
+
+        if not isinstance(obj, _JavaScriptObject):
+            return NotImplemented
+
+        state = {
+            key: value
+            for key, value in obj.__dict__.items()
+            if key not in _DROPPED_STATE
+        }
+        return _restore, (type(obj), state)
+
+
+def dumps(obj) -> bytes:
+    """Pickle obj, storing JavaScript instances in compact form"""
+    buffer = io.BytesIO()
+    _CompactPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+
+# --------------------------------------------------
+# Workers
+# --------------------------------------------------
+
+
+class _WorkerWidget:
+    """
+    Widget passed to scripts generated in worker processes, collecting
+    registered properties instead of emitting them.
+    """
+
+    _constants = None
+
+    def __init__(
+        self,
+        varname: str,
+        array_encoding: Optional[str] = None,
+        time_epoch: Optional[datetime.datetime] = None,
+        fixed_frame: bool = False,
+    ) -> None:
+        self._varname = varname
+        self._array_encoding = array_encoding
+        self._time_epoch = time_epoch
+        self._fixed_frame = fixed_frame
+        self._property_map: Dict[str, List[str]] = {}
+
+    def register_property(self, property: str, scripts: List[str]) -> None:
+        self._property_map[property] = scripts
+
+
+def _generate_items(
+    varname: str,
+    items: list,
+    array_encoding: Optional[str] = None,
+    time_epoch: Optional[datetime.datetime] = None,
+    fixed_frame: bool = False,
+) -> List[Tuple[Dict[str, List[str]], str]]:
+    widget = _WorkerWidget(
+        varname,
+        array_encoding=array_encoding,
+        time_epoch=time_epoch,
+        fixed_frame=fixed_frame,
+    )
+
+    results = []
+    for item in items:
+        widget._property_map = {}
+        script = item.generate_script(widget=widget)
+        results.append((widget._property_map, script))
+    return results
+
+
+def _generate_chunk(
+    varname: str,
+    payload: bytes,
+    array_encoding: Optional[str] = None,
+    time_epoch: Optional[datetime.datetime] = None,
+    fixed_frame: bool = False,
+) -> List[Tuple[Dict[str, List[str]], str]]:
+    return _generate_items(
+        varname, pickle.loads(payload), array_encoding, time_epoch, fixed_frame
+    )
+
+
+def iter_parallel_scripts(
+    items: list,
+    widget,
+    workers: int,
+    chunk_size: Optional[int] = None,
+) -> Iterator[Tuple[Dict[str, List[str]], str]]:
+    """
+    Yield (registered properties, script) of items in order, generating
+    chunks of items in a process pool.
+
+    Chunks of items are sent to workers in compact pickled form, so that
+    concurrent calls are independent and any start method of the platform
+    works.
+
+    Parameters
+    ----------
+
+    items: list
+        Instances to generate scripts of.
+    widget: _CesiumBase
+        Widget the scripts are generated for.
+    workers: int
+        Number of worker processes.
+    chunk_size: int, optional
+        Number of items sent to a worker at once, by default splits items in
+        4 chunks per worker.
+    """
+
+    # imported here, as they are slow to import and rarely needed
+    import concurrent.futures
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(items) // (4 * workers)))
+
+    varname = widget._varname
+    array_encoding = getattr(widget, "_array_encoding", None)
+    time_epoch = getattr(widget, "_time_epoch", None)
+    fixed_frame = getattr(widget, "_fixed_frame", False)
+
+    def _submit(executor, start: int) -> concurrent.futures.Future:
+        stop = start + chunk_size
+        payload = dumps(items[start:stop])
+        return executor.submit(
+            _generate_chunk, varname, payload, array_encoding, time_epoch, fixed_frame
+        )
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        # bound chunks in flight, so that results are not all held
+        futures: collections.deque = collections.deque()
+        for start in range(0, len(items), chunk_size):
+            futures.append(_submit(executor, start))
+            if len(futures) >= 2 * workers:
+                yield from futures.popleft().result()
+        while futures:
+            yield from futures.popleft().result()
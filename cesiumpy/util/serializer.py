@@ -0,0 +1,504 @@
+# Apache License 2.0
+
+from __future__ import annotations
+
+import base64
+import datetime
+import functools
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from cesiumpy.util import case
+import cesiumpy.util.common as com
+
+# --------------------------------------------------
+# Value encoders
+# --------------------------------------------------
+
+Encoder = Callable[[Any, Any], str]
+
+
+def _encode_script(x, widget=None) -> str:
+    return intern_script(x.generate_script(widget=widget), widget=widget)
+
+
+def _encode_bool(x, widget=None) -> str:
+    return "true" if x else "false"
+
+
+def _encode_str(x, widget=None) -> str:
+    return f'"{x}"'
+
+
+def _encode_datetime(x, widget=None) -> str:
+    return encode_time(x, widget=widget)
+
+
+def _encode_dict(x, widget=None) -> str:
+    return "".join(com.to_jsobject(x, widget=widget))
+
+
+def _encode_list(x, widget=None) -> str:
+    return "[{0}]".format(", ".join([encode(e, widget=widget) for e in x]))
+
+
+def _encode_number(x, widget=None) -> str:
+    return str(x)
+
+
+def _encode_other(x, widget=None) -> str:
+    return f"{x}"
+
+
+# encoders keyed by exact type, subclasses are resolved once and cached
+_ENCODERS: Dict[type, Encoder] = {
+    bool: _encode_bool,
+    str: _encode_str,
+    float: _encode_number,
+    int: _encode_number,
+    datetime.datetime: _encode_datetime,
+    dict: _encode_dict,
+    list: _encode_list,
+}
+
+
+def _resolve_encoder(klass: type) -> Encoder:
+    """Resolve encoder of the passed type, in the same order as com.to_jsscalar"""
+
+    # cesiumpy.util.trait depends on this module
+    from cesiumpy.util.trait import _JavaScriptObject, _JavaScriptEnum
+
+    if issubclass(klass, (_JavaScriptObject, _JavaScriptEnum)):
+        encoder = _encode_script
+    elif issubclass(klass, bool):
+        encoder = _encode_bool
+    elif issubclass(klass, str):
+        encoder = _encode_str
+    elif issubclass(klass, datetime.datetime):
+        encoder = _encode_datetime
+    elif issubclass(klass, dict):
+        encoder = _encode_dict
+    elif issubclass(klass, list):
+        encoder = _encode_list
+    else:
+        encoder = _encode_other
+
+    _ENCODERS[klass] = encoder
+    return encoder
+
+
+def encode(x, widget=None) -> str:
+    """convert x to JavaScript representation, dispatching on its type"""
+    try:
+        encoder = _ENCODERS[type(x)]
+    except KeyError:
+        encoder = _resolve_encoder(type(x))
+    return encoder(x, widget)
+
+
+_EMPTY: Dict[str, Any] = {}
+_MISSING = object()
+
+
+# --------------------------------------------------
+# Constant table
+# --------------------------------------------------
+
+
+class ConstantTable:
+    """
+    Table hoisting repeated JavaScript expressions into constants.
+
+    Expressions are replaced by placeholders while scripts are generated.
+    Once all scripts are known, resolve declares each repeated expression as
+    a constant right before the first script using it, and writes the others
+    inline, so that every expression is evaluated once.
+
+    Parameters
+    ----------
+
+    prefix: str, default "_c"
+        Prefix of constant names.
+    min_length: int, default 16
+        Expressions shorter than this are kept inline.
+    """
+
+    def __init__(self, prefix: str = "_c", min_length: int = 16) -> None:
+        self._prefix = prefix
+        self._min_length = min_length
+
+        # expression -> index of its placeholder, and expressions by index
+        self._indices: Dict[str, int] = {}
+        self._expressions: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._expressions)
+
+    def intern(self, script: str) -> str:
+        """Return placeholder of script, resolved by resolve"""
+        if len(script) < self._min_length:
+            return script
+
+        index = self._indices.get(script)
+        if index is None:
+            index = len(self._expressions)
+            self._indices[script] = index
+            self._expressions.append(script)
+        return f"\x00{index}\x00"
+
+    def resolve(self, scripts: List[str]) -> Iterator[str]:
+        """
+        Yield scripts with placeholders replaced, preceded by the
+        declarations of the constants they use first
+        """
+
+        # number of times each expression is written, those written in an
+        # inlined expression count as many times as it is written
+        counts = [0] * len(self._expressions)
+        for script in scripts:
+            for index in _PLACEHOLDER.findall(script):
+                counts[int(index)] += 1
+        # expressions include placeholders of the ones interned before them
+        for index in range(len(self._expressions) - 1, -1, -1):
+            uses = 1 if counts[index] > 1 else counts[index]
+            for nested in _PLACEHOLDER.findall(self._expressions[index]):
+                counts[int(nested)] += uses
+
+        names: Dict[int, str] = {}
+        declarations: List[str] = []
+
+        def _replace(match) -> str:
+            index = int(match.group(1))
+            name = names.get(index)
+            if name is not None:
+                return name
+
+            expression = _PLACEHOLDER.sub(_replace, self._expressions[index])
+            if counts[index] < 2:
+                return expression
+            name = f"{self._prefix}{len(names)}"
+            names[index] = name
+            declarations.append(f"const {name} = {expression};")
+            return name
+
+        for script in scripts:
+            script = _PLACEHOLDER.sub(_replace, script)
+            yield from declarations
+            declarations.clear()
+            yield script
+
+
+_PLACEHOLDER = re.compile("\x00([0-9]+)\x00")
+
+
+def intern_script(script: str, widget=None) -> str:
+    """Return a constant referring to script if the widget hoists constants"""
+    constants = getattr(widget, "_constants", None)
+    if constants is None:
+        return script
+    return constants.intern(script)
+
+
+# --------------------------------------------------
+# Typed arrays
+# --------------------------------------------------
+
+# array encodings, to the little-endian dtype and the JavaScript typed array
+ARRAY_ENCODINGS: Dict[str, Tuple[str, str]] = {
+    "float64": ("<f8", "Float64Array"),
+    "float32": ("<f4", "Float32Array"),
+}
+
+# lossy encoding of rows as integers in units of per-column scales, stored
+# as zigzag varints of the differences to the previous row
+QUANTIZED_ENCODING = "quantized"
+
+# functions decoding base64 arrays in the page, declared once per output
+ARRAY_DECODER = "cesiumpyDecodeArray"
+QUANTIZED_DECODER = "cesiumpyDecodeQuantized"
+ARRAY_DECODER_SCRIPTS = [
+    f"function {ARRAY_DECODER}(data, type) {{",
+    "  const binary = atob(data);",
+    "  const bytes = new Uint8Array(binary.length);",
+    "  for (let i = 0; i < binary.length; i++) {",
+    "    bytes[i] = binary.charCodeAt(i);",
+    "  }",
+    "  return new type(bytes.buffer);",
+    "}",
+    f"function {QUANTIZED_DECODER}(data, scales) {{",
+    "  const binary = atob(data);",
+    "  const last = scales.map(() => 0);",
+    "  const values = [];",
+    "  let value = 0, factor = 1, column = 0;",
+    "  for (let i = 0; i < binary.length; i++) {",
+    "    const byte = binary.charCodeAt(i);",
+    "    value += (byte & 127) * factor;",
+    "    factor *= 128;",
+    "    if (byte < 128) {",
+    "      last[column] += value % 2 ? -(value + 1) / 2 : value / 2;",
+    "      values.push(last[column] / scales[column]);",
+    "      column = (column + 1) % scales.length;",
+    "      value = 0;",
+    "      factor = 1;",
+    "    }",
+    "  }",
+    "  return values;",
+    "}",
+]
+
+
+def validate_array_encoding(encoding: Optional[str]) -> Optional[str]:
+    encodings = list(ARRAY_ENCODINGS) + [QUANTIZED_ENCODING]
+    if encoding is not None and encoding not in encodings:
+        msg = "array_encoding must be one of {encodings}: {encoding}"
+        raise ValueError(msg.format(encodings=encodings, encoding=encoding))
+    return encoding
+
+
+def encode_varints(values) -> bytes:
+    """
+    Return signed integers as zigzag varints, 7 bits per byte from the
+    lowest ones, whose highest bit is set when more bytes follow
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.int64).reshape(-1)
+    zigzag = ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+    # groups of 7 bits of each value, as many as the largest value needs
+    n_bytes = max(int(zigzag.max(initial=0)).bit_length() + 6, 7) // 7
+    shifts = np.arange(n_bytes, dtype=np.uint64) * np.uint64(7)
+    groups = (zigzag[:, np.newaxis] >> shifts) & np.uint64(127)
+    # value needs byte k when any of its bits are at or above 7k
+    needed = np.ones(groups.shape, dtype=bool)
+    needed[:, 1:] = (zigzag[:, np.newaxis] >> shifts[1:]) > 0
+    more = np.zeros(groups.shape, dtype=bool)
+    more[:, :-1] = needed[:, 1:]
+
+    data = groups.astype(np.uint8) | (more.astype(np.uint8) << 7)
+    return data[needed].tobytes()
+
+
+def encode_quantized(values, scales) -> str:
+    """
+    Return script decoding rows of values quantized in units of
+    1 / scales, see QUANTIZED_ENCODING
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64).reshape(-1, len(scales))
+    quantized = np.round(values * np.asarray(scales)).astype(np.int64)
+    deltas = np.diff(quantized, axis=0, prepend=np.zeros((1, len(scales)), np.int64))
+    data = base64.b64encode(encode_varints(deltas)).decode("ascii")
+    return '{decoder}("{data}", {scales})'.format(
+        decoder=QUANTIZED_DECODER, data=data, scales=list(scales)
+    )
+
+
+def encode_array(values, encoding: str, scales=None, float32: bool = True) -> str:
+    """
+    Return script decoding values as typed array of the specified encoding,
+    embedded as base64 of its bytes. Quantized encoding requires scales of
+    columns, and falls back to float64 without them. float32 falls back to
+    float64 unless float32 is True, for values whose 24 bit mantissa is too
+    coarse, such as coordinates in meters from the center of the Earth
+    in steps of 0.5 m, or seconds of a time span.
+    """
+    import numpy as np
+
+    if encoding == QUANTIZED_ENCODING:
+        if scales is not None:
+            return encode_quantized(values, scales)
+        encoding = "float64"
+    elif encoding == "float32" and not float32:
+        encoding = "float64"
+
+    dtype, klass = ARRAY_ENCODINGS[encoding]
+    data = np.ascontiguousarray(values, dtype=dtype).tobytes()
+    return '{decoder}("{data}", {klass})'.format(
+        decoder=ARRAY_DECODER, data=base64.b64encode(data).decode("ascii"), klass=klass
+    )
+
+
+# --------------------------------------------------
+# Times
+# --------------------------------------------------
+
+# function converting seconds from the document epoch to JulianDate in the page
+TIME_DECODER = "cesiumpyTime"
+
+# J2000 epoch, at noon as Julian days start
+J2000 = datetime.datetime(2000, 1, 1, 12, tzinfo=datetime.timezone.utc)
+_J2000_DAY = 2451545
+
+
+def _microseconds(delta: datetime.timedelta) -> int:
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _time_arguments(microseconds: int) -> str:
+    # integers are exact, as compact output only trims digits of floats
+    seconds, microseconds = divmod(microseconds, 1000000)
+    if microseconds:
+        return f"{seconds}, {microseconds}"
+    return str(seconds)
+
+
+def _as_utc(x: datetime.datetime) -> datetime.datetime:
+    # naive datetimes are in UTC, as the times of SampledProperty
+    if x.tzinfo is None:
+        return x.replace(tzinfo=datetime.timezone.utc)
+    return x
+
+
+def julian_date(x: datetime.datetime) -> Tuple[int, float]:
+    """
+    Return Julian day number and seconds of the day of x in UTC, as the
+    components of Cesium.JulianDate. Naive datetimes are in UTC.
+    """
+
+    microseconds = _microseconds(_as_utc(x) - J2000)
+    days, microseconds = divmod(microseconds, 86400 * 1000000)
+    return _J2000_DAY + days, microseconds / 1e6
+
+
+def time_decoder_script(epoch: datetime.datetime) -> str:
+    """
+    Return script declaring TIME_DECODER, which adds seconds and optional
+    microseconds to the epoch. The JulianDate is built in UTC, so that
+    Cesium accounts for leap seconds.
+    """
+
+    day, seconds = julian_date(epoch)
+    seconds, microseconds = divmod(round(seconds * 1e6), 1000000)
+    if microseconds:
+        offset = f"({microseconds} + (us || 0))"
+    else:
+        offset = "(us || 0)"
+    return (
+        f"function {TIME_DECODER}(s, us) {{ "
+        f"return new Cesium.JulianDate({day}, {seconds} + s + {offset} / 1000000); }}"
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_relative_time(x: datetime.datetime, epoch: datetime.datetime) -> str:
+    arguments = _time_arguments(_microseconds(_as_utc(x) - _as_utc(epoch)))
+    return f"{TIME_DECODER}({arguments})"
+
+
+def encode_time(x: datetime.datetime, widget=None) -> str:
+    """
+    Return script of x as Cesium.JulianDate, as seconds from the epoch of
+    the output if the widget encodes times relatively, see iter_script.
+    Repeated datetimes are converted once.
+    """
+
+    epoch = getattr(widget, "_time_epoch", None)
+    if epoch is None:
+        return f'Cesium.JulianDate.fromIso8601("{x.isoformat()}")'
+    return _encode_relative_time(x, epoch)
+
+
+# --------------------------------------------------
+# Object serializer
+# --------------------------------------------------
+
+
+class ObjectSerializer:
+    """
+    Serializer converting an instance to JavaScript Object, built once per class.
+
+    Parameters
+    ----------
+
+    fields: list of str or (str, ObjectSerializer)
+        Attribute names to serialize, in output order. A tuple adds a nested
+        object built from the same instance by the given serializer.
+    """
+
+    def __init__(
+        self,
+        fields: List[Union[str, Tuple[str, ObjectSerializer]]],
+    ) -> None:
+        self._fields: List[Tuple[str, str, Optional[ObjectSerializer]]] = []
+
+        keys = set()
+        for field in fields:
+            if isinstance(field, tuple):
+                key, nested = field
+            else:
+                key, nested = field, None
+
+            # keep the first position, as dict does
+            if key in keys:
+                continue
+            keys.add(key)
+
+            prefix = f"{case.snake_case_to_camel_case(key)}: "
+            self._fields.append((prefix, key, nested))
+
+    def serialize(self, obj, widget=None, children: Optional[list] = None) -> str:
+        """
+        Return JavaScript Object of obj. When children is passed, values
+        which are JavaScript instances or lists are appended to it.
+        """
+
+        # read trait values and plain attributes directly, getattr through the
+        # traitlets descriptor dominates the cost of serialization
+        attributes = obj.__dict__
+        trait_values = attributes.get("_trait_values", _EMPTY)
+
+        results = []
+        for prefix, key, nested in self._fields:
+            if nested is not None:
+                nested_script = nested.serialize(obj, widget=widget, children=children)
+                results.append(prefix + nested_script)
+                continue
+
+            value = trait_values.get(key, _MISSING)
+            if value is _MISSING:
+                value = attributes.get(key, _MISSING)
+                if value is _MISSING:
+                    value = getattr(obj, key)
+
+            if value is None:
+                continue
+
+            try:
+                encoder = _ENCODERS[type(value)]
+            except KeyError:
+                encoder = _resolve_encoder(type(value))
+            if children is not None and encoder in (_encode_script, _encode_list):
+                children.append(value)
+            results.append(prefix + encoder(value, widget))
+
+        if len(results) == 0:
+            return ""
+        return "{" + ", ".join(results) + "}"
+
+    def serialize_fields(self, obj, widget=None) -> List[Tuple[str, str]]:
+        """
+        Return (name, script) of the properties of obj which are not None,
+        in the order serialize outputs them.
+        """
+
+        attributes = obj.__dict__
+        trait_values = attributes.get("_trait_values", _EMPTY)
+
+        results = []
+        for prefix, key, nested in self._fields:
+            name = prefix[:-2]
+            if nested is not None:
+                results.append((name, nested.serialize(obj, widget=widget)))
+                continue
+
+            value = trait_values.get(key, _MISSING)
+            if value is _MISSING:
+                value = attributes.get(key, _MISSING)
+                if value is _MISSING:
+                    value = getattr(obj, key)
+
+            if value is not None:
+                results.append((name, encode(value, widget=widget)))
+        return results
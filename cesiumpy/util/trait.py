@@ -3,14 +3,19 @@
 from __future__ import unicode_literals
 
 import collections
+import contextlib
+import contextvars
 from enum import Enum
 import datetime
+import operator
 from typing import Optional
+import weakref
 
 import traitlets
 
 import cesiumpy.util.common as com
 import cesiumpy.util.html as html
+from cesiumpy.util.serializer import ObjectSerializer
 
 
 class MaybeTrait(traitlets.Instance):
@@ -71,6 +76,93 @@ class DateTimeTrait(traitlets.TraitType):
         return datetime.datetime.fromisoformat(s)
 
 
+# --------------------------------------------------
+# Script cache
+# --------------------------------------------------
+
+# incremented whenever a script has side effects on the widget, such as
+# registering a property, so that the enclosing scripts are not cached
+_script_side_effects: int = 0
+
+
+def mark_script_side_effect() -> None:
+    global _script_side_effects
+    _script_side_effects += 1
+
+
+def _unchanged(fingerprints: list) -> bool:
+    for value, fingerprint in fingerprints:
+        if isinstance(value, list):
+            if len(value) != len(fingerprint) or not all(
+                map(operator.is_, value, fingerprint)
+            ):
+                return False
+        elif value._script_fingerprint() != fingerprint:
+            return False
+    return True
+
+
+def _add_script_parent(attributes: dict, parents, ref: weakref.ref) -> None:
+    # other parents are kept in dict keyed by id, as instances are compared
+    # by their scripts
+    if isinstance(parents, dict):
+        parents[id(ref)] = ref
+    else:
+        attributes["_script_parents"] = {id(parents): parents, id(ref): ref}
+
+
+def _is_cacheable(widget) -> bool:
+    # scripts referring to hoisted constants, encoding arrays or times, or
+    # converting positions depend on the output options, so that they are
+    # only valid in one output
+    return (
+        getattr(widget, "_constants", None) is None
+        and getattr(widget, "_array_encoding", None) is None
+        and getattr(widget, "_time_epoch", None) is None
+        and not getattr(widget, "_fixed_frame", False)
+    )
+
+
+# --------------------------------------------------
+# Trusted construction
+# --------------------------------------------------
+
+# set while instances are built from values which are already validated, per
+# thread and per asyncio task
+_trusted: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "cesiumpy_trusted", default=False
+)
+
+
+@contextlib.contextmanager
+def trusted():
+    """
+    Context manager assigning traits without validation, for instances built
+    from values which are already valid, such as the output of a NumPy
+    pipeline. Values must be of the trait types, e.g. positions must be
+    Cartesian3 or lists of 3 floats and colors must be Color instances, as
+    they are not converted. Longitudes and latitudes are not range checked,
+    and str positions are not geocoded.
+
+    Examples
+    --------
+
+    >>> with cesiumpy.trusted():
+    ...     points = [cesiumpy.Point(position=p, color=color) for p in positions]
+    """
+
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+def is_trusted() -> bool:
+    """Return whether values are assigned without validation"""
+    return _trusted.get()
+
+
 # --------------------------------------------------
 # Container
 # --------------------------------------------------
@@ -121,7 +213,192 @@ class _JavaScriptObject(_HTMLObject):
     # Methods
 
     def generate_script(self, widget=None) -> str:
-        return "".join(com.to_jsobject(self._property_dict, widget=widget))
+        cacheable = _is_cacheable(widget)
+
+        attributes = self.__dict__
+        script = attributes.get("_script_cache")
+        if script is not None and cacheable:
+            fingerprints = attributes.get("_script_fingerprints")
+            if fingerprints is None or _unchanged(fingerprints):
+                return script
+
+        serializer = self._get_serializer()
+        if serializer is None:
+            return "".join(com.to_jsobject(self._property_dict, widget=widget))
+
+        if not cacheable:
+            return serializer.serialize(self, widget=widget)
+
+        side_effects = _script_side_effects
+        children = []
+        script = serializer.serialize(self, widget=widget, children=children)
+        if side_effects == _script_side_effects:
+            # stored apart from the script, as most scripts have none and
+            # containers kept for every instance slow down garbage collection
+            fingerprints = []
+            self._track_script(children, fingerprints)
+            attributes["_script_cache"] = script
+            if fingerprints:
+                attributes["_script_fingerprints"] = fingerprints
+            else:
+                attributes.pop("_script_fingerprints", None)
+        return script
+
+    def invalidate_script(self) -> None:
+        """
+        Drop the cached script of this instance and of all the instances
+        referring to it. Changes of traits and attributes invalidate the cache
+        automatically, and in-place modification of lists and Cartesian arrays
+        is detected when the script is generated again, this is only needed
+        after in-place modification of other mutable values such as dicts.
+        """
+
+        stack = [self]
+        seen = set()
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+
+            obj.__dict__.pop("_script_cache", None)
+            obj.__dict__.pop("_script_fingerprints", None)
+            parents = obj.__dict__.get("_script_parents")
+            if parents is None:
+                continue
+            if isinstance(parents, dict):
+                parents = list(parents.values())
+            else:
+                parents = [parents]
+            stack.extend(p for p in (ref() for ref in parents) if p is not None)
+
+    def __setattr__(self, name, value):
+        if _trusted.get() and name in self._traits:
+            # what traitlets stores once validated, no observers are notified
+            self._trait_values[name] = value
+            if self._script_tracked:
+                self._script_changed(value)
+            return
+
+        super().__setattr__(name, value)
+
+        # changes of traits are handled by notify_change, private attributes
+        # are internal states such as traitlets locks
+        if (
+            self._script_tracked
+            and not name.startswith("_")
+            and not self.has_trait(name)
+        ):
+            self._script_changed(value)
+
+    def notify_change(self, change) -> None:
+        # every trait change is notified here, before observers. This is much
+        # cheaper than an observer of all traits, registered on each instance
+        if self._script_tracked and change["type"] == "change":
+            self._script_changed(change["new"])
+        super().notify_change(change)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        for key in (
+            "_script_cache",
+            "_script_fingerprints",
+            "_script_parents",
+            "_script_tracked",
+        ):
+            state.pop(key, None)
+        return state
+
+    # Private methods
+
+    # whether changes invalidate the cached script, set once it is cached
+    _script_tracked = False
+
+    # whether instances never refer to other JavaScript instances, so that
+    # their values are not walked when tracked, such as Cartesian and Color
+    _script_leaf = False
+
+    def _track_script(
+        self, values: Optional[list] = None, fingerprints: Optional[list] = None
+    ) -> None:
+        """
+        Start tracking changes, so that the cached script of this instance
+        and of its parents is invalidated. Values referred by this instance are
+        tracked as well, as their changes also modify the script.
+        """
+
+        self.__dict__["_script_tracked"] = True
+
+        if values is None:
+            values = list(self._trait_values.values()) + list(self.__dict__.values())
+        self._track_script_values(values, fingerprints)
+
+    def _track_script_values(self, values, fingerprints: Optional[list]) -> None:
+        """
+        Track values, appending (value, fingerprint) of the mutable values the
+        script depends on to fingerprints. These are compared when the cached
+        script is used again, as in-place modification is not notified.
+        """
+
+        ref = weakref.ref(self)
+        for value in values:
+            if isinstance(value, _JavaScriptObject):
+                if value is self:
+                    continue
+                attributes = value.__dict__
+                parents = attributes.get("_script_parents")
+                if parents is None:
+                    # the only parent is stored as its weakref, which CPython
+                    # shares between calls
+                    attributes["_script_parents"] = ref
+                elif parents is not ref:
+                    _add_script_parent(attributes, parents, ref)
+                if "_script_tracked" not in attributes:
+                    if value._script_leaf:
+                        attributes["_script_tracked"] = True
+                    else:
+                        value._track_script()
+
+                if fingerprints is not None:
+                    if "_script_fingerprints" in attributes:
+                        fingerprints.extend(attributes["_script_fingerprints"])
+                    if value._script_fingerprint is not None:
+                        fingerprints.append((value, value._script_fingerprint()))
+            elif isinstance(value, (list, tuple)):
+                if fingerprints is not None and isinstance(value, list):
+                    # lists are compared by the identities of their items
+                    fingerprints.append((value, list(value)))
+                self._track_script_values(value, fingerprints)
+
+    def _script_changed(self, value) -> None:
+        self._track_script_values([value], None)
+        self.invalidate_script()
+
+    # method returning a value which changes when mutable values held by the
+    # instance are modified in place, None if it holds no such values
+    _script_fingerprint = None
+
+    # Class methods
+
+    @classmethod
+    def _get_serializer(cls) -> Optional[ObjectSerializer]:
+        """
+        Return the serializer compiled for this class, or None when the class
+        builds its properties dynamically and must use com.to_jsobject.
+        """
+
+        # do not inherit serializer compiled for parent class
+        if "_serializer" not in cls.__dict__:
+            cls._serializer = cls._build_serializer()
+        return cls._serializer
+
+    @classmethod
+    def _build_serializer(cls) -> Optional[ObjectSerializer]:
+        if cls._property_dict is not _JavaScriptObject._property_dict:
+            return None
+        if not isinstance(cls._props, list):
+            return None
+        return ObjectSerializer(cls._props)
 
 
 class _JavaScriptEnum(Enum):
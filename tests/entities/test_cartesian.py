@@ -90,6 +90,21 @@ class TestCartesian:
         with pytest.raises(ValueError, match=msg):
             cesiumpy.Cartesian3.fromDegreesArray([10, 20, 0.0, 20, 91, 0.0])
 
+    def test_cartesian3_array_values(self):
+        np = pytest.importorskip("numpy")
+
+        c = cesiumpy.Cartesian3.fromDegreesArray([1, 2, 3, 4, 5, 6])
+        assert c.x == [1, 2, 3, 4, 5, 6]
+        assert c.values.shape == (2, 3)
+        assert c.values.dtype == np.float64
+
+        arr = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        c = cartesian.Cartesian3Array(arr)
+        assert c.values is arr
+        assert c.x == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        assert isinstance(c.x, list)
+        assert len(c) == 6
+
     def test_cartesian4(self):
         c = cesiumpy.Cartesian4(5, 10, 20, 30)
         exp = "Cesium.Cartesian4(5.0, 10.0, 20.0, 30.0)"
@@ -0,0 +1,119 @@
+# Apache License 2.0
+
+import numpy as np
+import pytest
+
+import cesiumpy
+from cesiumpy.entities.cartesian_batch import CartesianBatch
+
+
+class TestCartesianBatch:
+    def test_init(self):
+        b = CartesianBatch([[1, 2, 3], [4, 5, 6]])
+        assert b.values.dtype == np.float64
+        assert b.values.shape == (2, 3)
+        assert len(b) == 2
+
+        c = CartesianBatch([cesiumpy.Cartesian3(1, 2, 3), cesiumpy.Cartesian3(4, 5, 6)])
+        np.testing.assert_array_equal(c.values, b.values)
+        np.testing.assert_array_equal(CartesianBatch(b).values, b.values)
+
+        with pytest.raises(ValueError):
+            CartesianBatch([1, 2, 3])
+
+        with pytest.raises(ValueError):
+            CartesianBatch([[1, 2], [3, 4]])
+
+    def test_items(self):
+        b = CartesianBatch([[1, 2, 3], [4, 5, 6]])
+        assert isinstance(b[1], cesiumpy.Cartesian3)
+        assert (b[1].x, b[1].y, b[1].z) == (4.0, 5.0, 6.0)
+        assert isinstance(b[1:], CartesianBatch)
+        assert len(b[1:]) == 1
+        assert [c.script for c in b] == [
+            "Cesium.Cartesian3(1.0, 2.0, 3.0)",
+            "Cesium.Cartesian3(4.0, 5.0, 6.0)",
+        ]
+        assert repr(b) == "CartesianBatch([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])"
+
+    def test_script(self):
+        b = CartesianBatch([[1, 2, 3], [4, 5, 6]])
+        exp = "Cesium.Cartesian3.unpackArray([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])"
+        assert b.script == exp
+        assert b.generate_script() == exp
+
+        v = cesiumpy.Viewer()
+        v._array_encoding = "float32"
+        assert b.generate_script(v).startswith(
+            'Cesium.Cartesian3.unpackArray(cesiumpyDecodeArray("'
+        )
+        # meters from the center of the Earth need float64
+        assert b.generate_script(v).endswith('", Float64Array))')
+
+        v._array_encoding = "quantized"
+        assert b.generate_script(v).endswith('", [100.0, 100.0, 100.0]))')
+
+    def test_algebra(self):
+        vectors = [(1, 2, 3), (-4, 5, 0.5), (0, -1, 2)]
+        other = cesiumpy.Cartesian3(2, -1, 3)
+        b = CartesianBatch(vectors)
+        cartesians = [cesiumpy.Cartesian3(*v) for v in vectors]
+
+        np.testing.assert_allclose(b.dot(other), [c.dot(other) for c in cartesians])
+        np.testing.assert_allclose(b.magnitude(), [c.magnitude() for c in cartesians])
+        np.testing.assert_allclose((b + other).values, np.add(vectors, (2, -1, 3)))
+        np.testing.assert_allclose((b - b).values, np.zeros((3, 3)))
+        np.testing.assert_allclose((-b).values, -np.array(vectors))
+        np.testing.assert_allclose((b * 2).values, np.array(vectors) * 2)
+        np.testing.assert_allclose(
+            (b / [1, 2, 4]).values, np.array(vectors) / [[1], [2], [4]]
+        )
+        np.testing.assert_allclose(b.normalized().magnitude(), np.ones(3))
+
+        exp = np.cross(vectors, (2, -1, 3))
+        np.testing.assert_allclose(b.cross(other).values, exp)
+        np.testing.assert_allclose(b.cross(b).values, np.zeros((3, 3)))
+
+    def test_angle_with(self):
+        b = CartesianBatch([[1, 0, 0], [0, 1, 0], [-1, 0, 0], [1, 1, 0]])
+        exp = [0.0, np.pi / 2, np.pi, np.pi / 4]
+        np.testing.assert_allclose(b.angle_with([1, 0, 0]), exp)
+
+        with pytest.raises(ValueError):
+            b.angle_with(cesiumpy.Cartesian3.fromDegrees(0, 0, 0))
+
+    def test_rotate(self):
+        b = CartesianBatch([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+        # 90 degrees around z axis
+        q = cesiumpy.Quaternion(0, 0, np.sin(np.pi / 4), np.cos(np.pi / 4))
+        exp = [[0, 1, 0], [-1, 0, 0], [0, 0, 1]]
+        np.testing.assert_allclose(b.rotate(q).values, exp, atol=1e-12)
+
+        # one quaternion per vector, 180 degrees around x, y and z axes
+        q = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]]
+        exp = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        np.testing.assert_allclose(b.rotate(q).values, exp, atol=1e-12)
+
+        with pytest.raises(ValueError):
+            b.rotate([0, 0, 1])
+
+        with pytest.raises(ValueError):
+            b.rotate(
+                cesiumpy.orientation._QuaternionFromProduct(
+                    cesiumpy.Quaternion.unit(), cesiumpy.Quaternion.unit()
+                )
+            )
+
+    def test_from_degrees(self):
+        b = CartesianBatch.from_degrees([0, 90], [0, 0])
+        np.testing.assert_allclose(
+            b.values, [[6378137.0, 0, 0], [0, 6378137.0, 0]], atol=1e-6
+        )
+
+        p = cesiumpy.Polyline(positions=[0, 0, 0, 90, 0, 0])
+        b = p.positions.to_fixed_frame()
+        assert isinstance(b, CartesianBatch)
+        np.testing.assert_allclose(
+            b.values, [[6378137.0, 0, 0], [0, 6378137.0, 0]], atol=1e-6
+        )
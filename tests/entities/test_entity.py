@@ -274,6 +274,17 @@ class TestEntity:
         e = e.copy()
         assert e.generate_script() == exp
 
+    def test_polyline_simplify(self):
+        e = cesiumpy.Polyline(positions=[-77, 35, 0, -77.05, 35, 0, -77.1, 35, 0])
+        assert e.removed_vertices == 0
+
+        e = cesiumpy.Polyline(
+            positions=[-77, 35, 0, -77.05, 35, 0, -77.1, 35, 0], simplify=10.0
+        )
+        exp = "{polyline: {positions: Cesium.Cartesian3.fromDegreesArrayHeights([-77.0, 35.0, 0.0, -77.1, 35.0, 0.0])}}"
+        assert e.generate_script() == exp
+        assert e.removed_vertices == 1
+
     def test_polylinevolume(self):
         e = cesiumpy.PolylineVolume(
             positions=[-120, 20, -90, 25, -60, 20],
@@ -565,6 +576,17 @@ class TestEntity:
         e = e.copy()
         assert e.generate_script() == exp
 
+    def test_polygon_simplify(self):
+        hierarchy = [1, 1, 0, 1.5, 1, 0, 1.5, 1.00001, 0, 2, 1, 0, 2, 2, 0]
+        e = cesiumpy.Polygon(hierarchy, simplify=1000.0)
+        exp = "{polygon: {hierarchy: Cesium.Cartesian3.fromDegreesArrayHeights([1.0, 1.0, 0.0, 2.0, 1.0, 0.0, 2.0, 2.0, 0.0])}}"
+        assert e.generate_script() == exp
+        assert e.removed_vertices == 2
+
+        # rings are not collapsed
+        e = cesiumpy.Polygon(hierarchy, simplify=1e7)
+        assert len(e.hierarchy.values) == 3
+
     def test_entities_repr(self):
         e = cesiumpy.Point(position=[-110, 40, 0])
         exp = "Point(-110.0, 40.0, 0.0)"
@@ -20,6 +20,19 @@ class TestIO:
         assert all([isinstance(e, cesiumpy.Polygon) for e in res])
         assert res[0].generate_script() == exp
 
+    def test_geojson_simplify(self):
+        path = os.path.join(current_dir, "data", "jpn.geo.json")
+        res = cesiumpy.io.read_geojson(path)
+        simplified = cesiumpy.io.read_geojson(path, simplify=100.0)
+
+        assert len(simplified) == len(res)
+        for e, s in zip(res, simplified):
+            assert len(s.hierarchy.values) + s.removed_vertices == len(
+                e.hierarchy.values
+            )
+            assert len(s.hierarchy.values) >= 3
+        assert sum(s.removed_vertices for s in simplified) > 0
+
     @pytest.mark.skip(reason="GDAL required to install fiona")
     def test_shape(self):
         path = os.path.join(current_dir, "data", "coastl_jpn.shp")
@@ -0,0 +1,63 @@
+# Apache License 2.0
+
+import os
+
+import pytest
+
+import cesiumpy
+from cesiumpy.extension.lod import LOD_LEVELS, to_lod
+
+current_dir = os.path.dirname(__file__)
+
+
+class TestLOD:
+    def test_to_lod(self):
+        # track which wiggles by about 10 meters
+        positions = [(-77 + i * 0.01, 35 + (i % 2) * 1e-4) for i in range(9)]
+        e = cesiumpy.Polyline(positions=positions)
+
+        res = to_lod(e, levels=[(0.0, None), (1e5, 1.0), (1e6, 100.0)])
+        assert [len(r.positions.values) for r in res] == [9, 2]
+        assert [r.removed_vertices for r in res] == [0, 7]
+
+        conditions = [r.distance_display_condition.generate_script() for r in res]
+        assert conditions == [
+            "new Cesium.DistanceDisplayCondition(0.0, 1000000.0)",
+            "new Cesium.DistanceDisplayCondition(1000000.0, Number.MAX_VALUE)",
+        ]
+
+        # source entity is not modified
+        assert e.distance_display_condition is None
+
+    def test_to_lod_entities(self):
+        polygon = cesiumpy.Polygon([1, 1, 0, 1.5, 1.00001, 0, 2, 1, 0, 2, 2, 0])
+        wall = cesiumpy.Wall(
+            positions=[(-107, 43), (-102, 43.01), (-97, 43), (-97, 40)],
+            maximum_heights=[1, 2, 3, 4],
+            minimum_heights=0,
+        )
+        point = cesiumpy.Point(position=[0, 0, 0])
+
+        res = to_lod([polygon, wall, point], levels=[(0.0, None), (1e6, 5e4)])
+        assert len(res) == 5
+        assert [len(r.positions.values) for r in res[:2]] == [4, 3]
+        assert res[3].maximum_heights == [1, 3, 4]
+        assert res[3].minimum_heights == [0, 0, 0]
+        assert res[4] is point
+
+        with pytest.raises(ValueError):
+            to_lod(polygon, levels=[(1e6, 5e4), (0.0, None)])
+
+    def test_geojson_lod(self):
+        path = os.path.join(current_dir, "data", "jpn.geo.json")
+        res = cesiumpy.io.read_geojson(path)
+        lod = cesiumpy.io.read_geojson(path, lod=True)
+
+        assert len(res) < len(lod) <= len(res) * len(LOD_LEVELS)
+        assert all(e.distance_display_condition is not None for e in lod)
+
+        # the closest level keeps all the vertices
+        closest = [e for e in lod if e.distance_display_condition.near == 0.0]
+        assert [len(e.hierarchy.values) for e in closest] == [
+            len(e.hierarchy.values) for e in res
+        ]
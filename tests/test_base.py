@@ -1,8 +1,16 @@
 # Apache License 2.0
 
+from datetime import datetime, timedelta, timezone
+import base64
+import gzip
+import io
+import re
+
+import numpy as np
 import pytest
 
 import cesiumpy
+from cesiumpy.util import serializer
 
 
 @pytest.fixture
@@ -441,3 +449,337 @@ class TestViewer:
 
         with pytest.raises(ValueError):
             viewer.scripts.add(1)
+
+    def test_write_html(self, viewer: cesiumpy.Viewer):
+        for i in range(3):
+            viewer.entities.add(cesiumpy.Point(position=[-120 + i, 40, 0]))
+
+        buffer = io.StringIO()
+        viewer.write_html(buffer)
+        assert buffer.getvalue() == viewer.to_html()
+
+        # iter_html is lazy
+        lines = viewer.iter_html()
+        assert next(lines) == '<meta charset="utf-8">'
+
+    def test_sampled_property_precedes_entity(
+        self,
+        viewer: cesiumpy.Viewer,
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+        viewer.entities.add(cesiumpy.Point(position=sampled_position))
+        viewer.entities.add(cesiumpy.Point(position=sampled_position))
+        script = viewer.script
+
+        name = f"widget.{sampled_position.name}"
+        definitions = [i for i, s in enumerate(script) if s.startswith(f"{name} = new")]
+        usages = [i for i, s in enumerate(script) if f"position: {name}" in s]
+
+        # defined once, right before the first entity referring to it
+        assert len(definitions) == 1
+        assert len(usages) == 2
+        assert definitions[0] < usages[0]
+        assert script[usages[0] - 1].startswith(f"{name}.addSamplesPackedArray(")
+
+    def test_diff_script(self, viewer: cesiumpy.Viewer):
+        point = cesiumpy.Point(position=(-110, 40, 0))
+        cylinder = cesiumpy.Cylinder(
+            position=(-100, 40, 0), length=1e6, top_radius=1e5, bottom_radius=1e5
+        )
+        viewer.entities.add([point, cylinder])
+        html = viewer.to_html()
+
+        snapshot = viewer.snapshot()
+        assert len(snapshot) == 2
+        assert viewer.diff_script(since=snapshot) == []
+
+        # taking a snapshot does not change the page
+        assert viewer.to_html() == html
+
+        # entities without id are addressed by their position in the page
+        point.pixel_size = 5
+        viewer.entities.remove(cylinder)
+        viewer.entities.add(cesiumpy.Point(position=(-90, 40, 0)), id="added")
+        viewer.entities.add(cesiumpy.Point(position=(-80, 40, 0)))
+        assert viewer.diff_script(since=snapshot) == [
+            """var widgetSnapshotEntities = widget.entities.values.slice();""",
+            """widget.entities.remove(widgetSnapshotEntities[1]);""",
+            """widgetSnapshotEntities[0].point = {pixelSize: 5.0, color: Cesium.Color.WHITE};""",
+            """widget.entities.add({id: "added", position: Cesium.Cartesian3.fromDegrees(-90.0, 40.0, 0.0), point: {pixelSize: 10.0, color: Cesium.Color.WHITE}});""",
+            # added entities are given an id
+            """widget.entities.add({id: "entity0", position: Cesium.Cartesian3.fromDegrees(-80.0, 40.0, 0.0), point: {pixelSize: 10.0, color: Cesium.Color.WHITE}});""",
+        ]
+
+        snapshot = viewer.snapshot()
+        point.name = "point"
+        point.position = None
+        assert viewer.diff_script(since=snapshot) == [
+            """var widgetSnapshotEntities = widget.entities.values.slice();""",
+            """widgetSnapshotEntities[0].name = "point";""",
+            """widgetSnapshotEntities[0].position = undefined;""",
+        ]
+        assert point.id is None
+
+    def test_diff_script_sampled_property(
+        self,
+        viewer: cesiumpy.Viewer,
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+        viewer.entities.add(cesiumpy.Point(position=sampled_position), id="point")
+        snapshot = viewer.snapshot()
+        assert viewer.diff_script(since=snapshot) == []
+
+        time, value, _ = sampled_position.samples[-1]
+        sampled_position.add_sample(time, value)
+        script = viewer.diff_script(since=snapshot)
+
+        # property scripts are emitted again, then the entity is replaced
+        name = f"widget.{sampled_position.name}"
+        assert script[0].startswith(f"{name} = new Cesium.Sampled")
+        assert script[-2:] == [
+            """widget.entities.removeById("point");""",
+            f"""widget.entities.add({{id: "point", position: {name}, point: {{pixelSize: 10.0, color: Cesium.Color.WHITE}}}});""",
+        ]
+
+        # entities without id are replaced by entities with an id
+        point = viewer.entities[0]
+        point.id = None
+        snapshot = viewer.snapshot()
+        sampled_position.add_sample(time, value)
+        script = viewer.diff_script(since=snapshot)
+        assert (
+            script[0] == "var widgetSnapshotEntities = widget.entities.values.slice();"
+        )
+        assert script[-2:] == [
+            """widget.entities.remove(widgetSnapshotEntities[0]);""",
+            f"""widget.entities.add({{id: "entity0", position: {name}, point: {{pixelSize: 10.0, color: Cesium.Color.WHITE}}}});""",
+        ]
+        assert point.id == "entity0"
+
+    def test_hoist(self, viewer: cesiumpy.Viewer):
+        pin = cesiumpy.Pin.fromText("!", color=cesiumpy.color.GREEN)
+        for lon in (-120, -110, -100):
+            viewer.entities.add(cesiumpy.Billboard(position=[lon, 40, 0], image=pin))
+
+        script = list(viewer.iter_script(hoist=True))
+        entities = [s for s in script if s.startswith("widget.entities.add(")]
+        pin_script = (
+            """new Cesium.PinBuilder().fromText("!", Cesium.Color.GREEN, 48.0)"""
+        )
+
+        # the pin is drawn once, before the first entity using it
+        assert script.index(f"const _c0 = {pin_script};") < script.index(entities[0])
+        assert all("image: _c0" in entity for entity in entities)
+
+        # constants do not leak into cached scripts
+        assert "_c0" not in viewer.to_html()
+        assert "_c0" not in viewer.to_html()
+        assert viewer.to_html(hoist=True).count(pin_script) == 1
+
+    def test_compact(self, viewer: cesiumpy.Viewer):
+        for lon in (-120, -110, -100):
+            viewer.entities.add(
+                cesiumpy.Point(position=[lon + 0.123456789123, 40, 0], pixel_size=5)
+            )
+
+        lines = viewer.to_html(compact=True).splitlines()
+        assert "const $C=Cesium;" in lines
+        entity = "widget.entities.add($E({$a:$C.Cartesian3.fromDegrees(-119.8765432,40,0),$b:{$c:5,$d:_c0}}));"
+        # keys are declared at their first use
+        assert lines[lines.index(entity) - 1] == (
+            'Object.assign($K,{$a:"position",$b:"point",$c:"pixelSize",$d:"color"});'
+        )
+        # repeated expressions are hoisted unless disabled
+        assert lines.index("const _c0=$C.Color.WHITE;") < lines.index(entity)
+        assert "_c0" not in viewer.to_html(compact=True, hoist=False)
+
+    def test_compact_size(self, viewer: cesiumpy.Viewer):
+        for i in range(50):
+            lon = -120 + i * 0.1234567
+            viewer.entities.add(
+                cesiumpy.Point(position=[lon, 40.123456, 0], color=cesiumpy.color.RED)
+            )
+            viewer.entities.add(
+                cesiumpy.Label(position=[lon, 41.5, 1000], text=f"label {i}")
+            )
+            viewer.entities.add(
+                cesiumpy.Billboard(
+                    position=[lon, 42.2, 0],
+                    image=cesiumpy.Pin.fromText("!", color=cesiumpy.color.GREEN),
+                )
+            )
+            viewer.entities.add(
+                cesiumpy.Polyline(
+                    positions=[lon, 30.5, 0, lon + 0.5, 31.25, 0, lon + 1, 32.125, 0],
+                    width=2,
+                    material=cesiumpy.color.BLUE,
+                )
+            )
+            viewer.entities.add(
+                cesiumpy.Box(
+                    position=[lon, 35.0, 1e4],
+                    dimensions=(1e4, 2e4, 3e4),
+                    material=cesiumpy.color.RED.with_alpha(0.5),
+                )
+            )
+
+        # at least 30% smaller, the expander of keys being declared once
+        assert len(viewer.to_html(compact=True)) < 0.7 * len(viewer.to_html())
+
+    def test_compress(self, viewer: cesiumpy.Viewer):
+        viewer.entities.add(cesiumpy.Point(position=[-120, 40, 0]))
+
+        lines = viewer.to_html(compress=True).splitlines()
+        start = lines.index(
+            '<script type="application/octet-stream" id="cesiumpy-payload">'
+        )
+        end = lines.index("</script>", start)
+        script = gzip.decompress(base64.b64decode("".join(lines[start:end][1:])))
+
+        plain = viewer.to_html().splitlines()
+        start = plain.index('<script type="text/javascript">')
+        plain = plain[start:-1][1:]
+        assert script.decode("utf-8").splitlines() == [s[2:] for s in plain]
+
+    def test_array_encoding(self, viewer: cesiumpy.Viewer):
+        positions = [-120.5, 25.25, 0.0, -90.125, 30.0, 100.0]
+        viewer.entities.add(cesiumpy.Polyline(positions=positions))
+        plain = viewer.to_html()
+
+        script = list(viewer.iter_script(array_encoding="float64"))
+        assert script[0] == "function cesiumpyDecodeArray(data, type) {"
+        (entity,) = [s for s in script if s.startswith("widget.entities.add(")]
+
+        match = re.search(r'cesiumpyDecodeArray\("([^"]*)", Float64Array\)', entity)
+        values = np.frombuffer(base64.b64decode(match.group(1)), dtype="<f8")
+        assert values.tolist() == positions
+
+        script = viewer.to_html(array_encoding="float32")
+        assert "Float32Array" in script
+        assert "fromDegreesArrayHeights([-120.5" not in script
+
+        # encoded scripts are not cached
+        assert viewer.to_html() == plain
+
+        with pytest.raises(ValueError, match="array_encoding must be one of"):
+            viewer.to_html(array_encoding="int8")
+
+    def test_float32_array_encoding(
+        self,
+        viewer: cesiumpy.Viewer,
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+        # degrees are kept to about 1 m, 1e-5 degrees being about 1.1 m
+        rng = np.random.default_rng(0)
+        degrees = np.column_stack(
+            [
+                rng.uniform(-180.0, 180.0, 1000),
+                rng.uniform(-90.0, 90.0, 1000),
+                rng.uniform(0.0, 1e4, 1000),
+            ]
+        )
+        viewer.entities.add(cesiumpy.Polyline(positions=degrees.reshape(-1).tolist()))
+        script = list(viewer.iter_script(array_encoding="float32"))
+        entity = [s for s in script if s.startswith("widget.entities.add(")][-1]
+        match = re.search(r'cesiumpyDecodeArray\("([^"]*)", Float32Array\)', entity)
+        values = np.frombuffer(base64.b64decode(match.group(1)), dtype="<f4")
+        errors = np.abs(values.reshape(-1, 3) - degrees)
+        assert errors[:, :2].max() < 1e-5
+        assert errors[:, 2].max() < 1e-3
+
+        # meters from the center of the Earth and samples are kept as float64
+        viewer.entities.add(cesiumpy.Point(position=sampled_position))
+        script = list(viewer.iter_script(array_encoding="float32"))
+        (samples,) = [s for s in script if ".addSamplesPackedArray(" in s]
+        assert "Float64Array" in samples
+        assert "Float32Array" not in samples
+
+    def test_fixed_frame(self, viewer: cesiumpy.Viewer):
+        viewer.entities.add(cesiumpy.Point(position=[90, 0, 100]))
+        viewer.entities.add(cesiumpy.Polyline(positions=[0, 0, 0, 90, 0, 0]))
+        plain = viewer.to_html()
+
+        script = list(viewer.iter_script(fixed_frame=True))
+        point, polyline = [s for s in script if s.startswith("widget.entities.add(")]
+        assert "position: new Cesium.Cartesian3(" in point
+        assert "Cesium.Cartesian3.unpackArray(" in polyline
+        assert "fromDegrees" not in "".join(script)
+
+        x, y, z = (
+            re.search(r"new Cesium.Cartesian3\(([^)]*)\)", point).group(1).split(",")
+        )
+        np.testing.assert_allclose(
+            [float(x), float(y), float(z)], [0.0, 6378237.0, 0.0], atol=1e-6
+        )
+
+        # converted scripts are not cached
+        assert viewer.to_html() == plain
+
+        transform = cesiumpy.Transforms.eastNorthUpToFixedFrame((90, 0, 100))
+        assert transform.generate_script(viewer) == (
+            "Cesium.Transforms.eastNorthUpToFixedFrame("
+            "Cesium.Cartesian3.fromDegrees(90.0, 0.0, 100.0))"
+        )
+        viewer._fixed_frame = True
+        assert transform.generate_script(viewer).startswith(
+            "Cesium.Transforms.eastNorthUpToFixedFrame(new Cesium.Cartesian3("
+        )
+
+    def test_quantized_array_encoding(self, viewer: cesiumpy.Viewer):
+        positions = [-120.5, 25.25, 0.0, -120.500001, 25.250002, 100.0]
+        viewer.entities.add(cesiumpy.Polyline(positions=positions))
+
+        script = list(viewer.iter_script(array_encoding="quantized"))
+        assert "function cesiumpyDecodeQuantized(data, scales) {" in script
+        (entity,) = [s for s in script if s.startswith("widget.entities.add(")]
+
+        # zigzag varints of micro degrees and centimeters, then of their deltas
+        match = re.search(
+            r'cesiumpyDecodeQuantized\("([^"]*)", \[1000000.0, 1000000.0, 100.0\]\)',
+            entity,
+        )
+        data = base64.b64decode(match.group(1))
+        exp = serializer.encode_varints([-120500000, 25250000, 0, -1, 2, 10000])
+        assert data == exp
+
+    def test_relative_times(self, viewer: cesiumpy.Viewer):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        clock = cesiumpy.Clock(
+            start_time=start, stop_time=start + timedelta(days=1, seconds=0.5)
+        )
+        viewer.clock_view_model = cesiumpy.ClockViewModel(clock)
+        plain = viewer.to_html()
+
+        script = list(viewer.iter_script(relative_times=True))
+        decoder = "function cesiumpyTime(s, us) { return new Cesium.JulianDate(2460310, 43200 + s + (us || 0) / 1000000); }"
+        assert decoder in script
+        assert script.index(decoder) < len(script) - 1
+        assert "startTime: cesiumpyTime(0), stopTime: cesiumpyTime(86400, 500000)" in (
+            script[script.index(decoder) + 1]
+        )
+
+        # enabled in compact output by default
+        assert "cesiumpyTime(86400,500000)" in viewer.to_html(compact=True)
+        assert "cesiumpyTime" not in viewer.to_html(compact=True, relative_times=False)
+
+        # scripts of relative times are not cached
+        assert viewer.to_html() == plain
+
+        # J2000 without clock
+        viewer.clock_view_model = None
+        assert "new Cesium.JulianDate(2451545, 0 + s + (us || 0) / 1000000)" in (
+            viewer.to_html(relative_times=True)
+        )
+
+        # times far from the epoch keep their microseconds in compact output
+        prop = cesiumpy.SampledPositionProperty()
+        prop.add_sample(
+            datetime(2024, 1, 1, 0, 0, 0, 987654), cesiumpy.Cartesian3(1, 2, 3)
+        )
+        viewer.entities.add(cesiumpy.Point(position=prop))
+        assert "cesiumpyTime(757339200,987654)" in viewer.to_html(compact=True)
+
+    def test_encode_varints(self):
+        data = serializer.encode_varints([0, -1, 1, 63, -64, 64, 300, -(2**40)])
+        exp = [0, 1, 2, 126, 127, 128, 1, 216, 4, 255, 255, 255, 255, 255, 63]
+        assert list(data) == exp
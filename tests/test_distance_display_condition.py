@@ -0,0 +1,29 @@
+# Apache License 2.0
+
+import pytest
+
+import cesiumpy
+
+
+class TestDistanceDisplayCondition:
+    def test_script(self):
+        c = cesiumpy.DistanceDisplayCondition(10.0, 20.0)
+        assert c.generate_script() == "new Cesium.DistanceDisplayCondition(10.0, 20.0)"
+
+        c = cesiumpy.DistanceDisplayCondition(10.0)
+        exp = "new Cesium.DistanceDisplayCondition(10.0, Number.MAX_VALUE)"
+        assert c.generate_script() == exp
+
+        with pytest.raises(ValueError):
+            cesiumpy.DistanceDisplayCondition(20.0, 10.0)
+
+    def test_entity(self):
+        e = cesiumpy.Polyline(
+            positions=[-77, 35, 0.0, -77.1, 35, 0.0],
+            distance_display_condition=cesiumpy.DistanceDisplayCondition(0.0, 1e5),
+        )
+        exp = "{polyline: {positions: Cesium.Cartesian3.fromDegreesArrayHeights([-77, 35, 0.0, -77.1, 35, 0.0]), distanceDisplayCondition: new Cesium.DistanceDisplayCondition(0.0, 100000.0)}}"
+        assert e.generate_script() == exp
+
+        e = e.copy()
+        assert e.generate_script() == exp
@@ -0,0 +1,29 @@
+# Apache License 2.0
+
+import subprocess
+import sys
+
+import pytest
+
+
+class TestImport:
+    # "import cesiumpy" took around 330ms when numpy, geopy and shapely were
+    # imported eagerly, orbit and geodesy import numpy
+    @pytest.mark.parametrize(
+        "module",
+        ["numpy", "geopy", "shapely", "cesiumpy.orbit", "cesiumpy.math.geodesy"],
+    )
+    def test_heavy_modules_not_imported(self, module):
+        script = f"import sys, cesiumpy; assert {module!r} not in sys.modules"
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+    def test_lazy_attributes(self):
+        import cesiumpy
+
+        assert "geocode" in dir(cesiumpy)
+        assert cesiumpy.geocode.__name__ == "cesiumpy.extension.geocode"
+        assert cesiumpy.ConicSensor.__module__ == "cesiumpy.sensor"
+        assert cesiumpy.BingMapsImageryProvider.__module__ == "cesiumpy.provider"
+
+        with pytest.raises(AttributeError):
+            cesiumpy.XXX
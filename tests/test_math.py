@@ -1,5 +1,8 @@
 # Apache License 2.0
 
+import numpy as np
+import pytest
+
 import cesiumpy
 
 
@@ -11,3 +14,225 @@ class TestMath:
 
         rad = cesiumpy.Math.RADIANS_PER_DEGREE
         assert rad.script == "Cesium.Math.RADIANS_PER_DEGREE"
+
+
+class TestGeodesy:
+    def test_geodetic_to_ecef(self):
+        geodesy = cesiumpy.math.geodesy
+
+        xyz = geodesy.geodetic_to_ecef([0, 90, 0], [0, 0, 90], [0, 100, 0])
+        np.testing.assert_allclose(
+            xyz,
+            [
+                [geodesy.WGS84_A, 0, 0],
+                [0, geodesy.WGS84_A + 100, 0],
+                [0, 0, geodesy.WGS84_B],
+            ],
+            atol=1e-6,
+        )
+
+        c = cesiumpy.Cartesian3.fromDegrees(90, 0, 100).to_fixed_frame()
+        assert not c._is_degrees
+        np.testing.assert_allclose([c.x, c.y, c.z], xyz[1], atol=1e-6)
+
+    def test_ecef_to_geodetic(self):
+        geodesy = cesiumpy.math.geodesy
+
+        rng = np.random.default_rng(0)
+        lla = np.column_stack(
+            [
+                rng.uniform(-180, 180, 1000),
+                rng.uniform(-90, 90, 1000),
+                rng.uniform(-1e3, 1e6, 1000),
+            ]
+        )
+        xyz = geodesy.geodetic_to_ecef(lla[:, 0], lla[:, 1], lla[:, 2])
+        np.testing.assert_allclose(geodesy.ecef_to_geodetic(xyz), lla, atol=1e-6)
+
+        # on the polar axis far from the Earth, such as above satellite orbits
+        heights = np.tile([1e7, 1e8, 1e9], 2)
+        signs = np.repeat([1.0, -1.0], 3)
+        xyz = np.zeros((6, 3))
+        xyz[:, 2] = signs * (geodesy.WGS84_B + heights)
+        np.testing.assert_allclose(
+            geodesy.ecef_to_geodetic(xyz)[:, 1:],
+            np.column_stack([90.0 * signs, heights]),
+            atol=1e-6,
+        )
+
+    def test_local_frames(self):
+        geodesy = cesiumpy.math.geodesy
+
+        rotation = geodesy.enu_rotation([10, -120], [20, 45])
+        np.testing.assert_allclose(
+            rotation @ np.swapaxes(rotation, -1, -2),
+            np.broadcast_to(np.eye(3), (2, 3, 3)),
+            atol=1e-12,
+        )
+
+        # up is the offset of the height
+        xyz = geodesy.geodetic_to_ecef(10, 20, 5)
+        np.testing.assert_allclose(
+            geodesy.ecef_to_enu(xyz, 10, 20), [0, 0, 5], atol=1e-6
+        )
+        np.testing.assert_allclose(
+            geodesy.ecef_to_ned(xyz, 10, 20), [0, 0, -5], atol=1e-6
+        )
+
+        xyz = geodesy.enu_to_ecef([1, 2, 3], 10, 20)
+        np.testing.assert_allclose(
+            geodesy.ecef_to_enu(xyz, 10, 20), [1, 2, 3], atol=1e-6
+        )
+        np.testing.assert_allclose(
+            geodesy.ned_to_ecef([2, 1, -3], 10, 20), xyz, atol=1e-6
+        )
+
+        matrix = geodesy.east_north_up_to_fixed_frame(0, 0)
+        np.testing.assert_allclose(
+            matrix,
+            [[0, 0, 1, geodesy.WGS84_A], [1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1]],
+            atol=1e-9,
+        )
+        matrix = geodesy.north_east_down_to_fixed_frame(0, 0)
+        np.testing.assert_allclose(
+            matrix[:3, :3], [[0, 0, -1], [0, 1, 0], [1, 0, 0]], atol=1e-9
+        )
+
+    def test_great_circle_distance(self):
+        geodesy = cesiumpy.math.geodesy
+
+        distance = geodesy.great_circle_distance(0, 0, [0, 90, 180], [90, 0, 0])
+        np.testing.assert_allclose(
+            distance, np.array([0.5, 0.5, 1.0]) * np.pi * geodesy.MEAN_RADIUS
+        )
+
+    def test_bounding_sphere(self):
+        geodesy = cesiumpy.math.geodesy
+
+        center, radius = geodesy.bounding_sphere([[-1, 0, 0], [1, 0, 0], [0, 2, 0]])
+        np.testing.assert_allclose(center, [0, 1, 0])
+        assert radius == pytest.approx(2**0.5)
+
+
+class TestSimplify:
+    def test_douglas_peucker(self):
+        simplify = cesiumpy.math.simplify
+
+        xyz = [[0, 0, 0], [1, 0.1, 0], [2, -0.1, 0], [3, 5, 0], [4, 6, 0], [5, 7, 0]]
+        mask = simplify.douglas_peucker(xyz, 0.5)
+        assert mask.tolist() == [True, False, True, True, False, True]
+
+        # collinear vertices are removed whatever the tolerance is
+        mask = simplify.douglas_peucker(xyz, 0.05)
+        assert mask.tolist() == [True, True, True, True, False, True]
+
+        # each level splits all the segments at once
+        rng = np.random.default_rng(0)
+        xyz = np.cumsum(rng.normal(size=(1000, 3)), axis=0)
+        mask = simplify.douglas_peucker(xyz, 2.0)
+        kept = np.flatnonzero(mask)
+        assert 2 < len(kept) < 1000
+        for start, end in zip(kept[:-1], kept[1:]):
+            points = xyz[start:end][1:]
+            distance = simplify._segment_distance(
+                points,
+                np.broadcast_to(xyz[start], points.shape),
+                np.broadcast_to(xyz[end], points.shape),
+            )
+            assert (distance <= 2.0).all()
+
+    def test_douglas_peucker_ring(self):
+        simplify = cesiumpy.math.simplify
+
+        angles = np.linspace(0, 2 * np.pi, 100, endpoint=False)
+        ring = np.stack([np.cos(angles), np.sin(angles), np.zeros(100)], axis=1)
+        ring = np.concatenate([ring, ring[:1]])
+
+        # rings keep a triangle however large the tolerance is
+        mask = simplify.douglas_peucker(ring, 10.0)
+        assert np.flatnonzero(mask).tolist() == [0, 25, 50, 100]
+
+        mask = simplify.douglas_peucker(ring[:-1], 10.0, closed=True)
+        assert np.flatnonzero(mask).tolist() == [0, 25, 50]
+
+        mask = simplify.douglas_peucker(ring[:-1], 10.0)
+        assert np.flatnonzero(mask).tolist() == [0, 99]
+
+    def test_simplify_positions(self):
+        simplify = cesiumpy.math.simplify
+
+        # the equator sags below chords by about 2.4 meters per 0.1 degree
+        positions = [[0, 0, 0], [0.05, 0, 0], [0.1, 0, 0]]
+        assert len(simplify.simplify_positions(positions, 1.0)) == 3
+        assert len(simplify.simplify_positions(positions, 10.0)) == 2
+
+
+class TestInterpolation:
+    def test_windows(self):
+        interpolation = cesiumpy.math.interpolation
+
+        times = np.arange(10.0)
+        # degree + 1 samples around each time, shifted inside at both ends
+        indices = interpolation.windows(times, [0.0, 0.5, 4.5, 9.0], 3)
+        assert indices.tolist() == [
+            [0, 1, 2, 3],
+            [0, 1, 2, 3],
+            [3, 4, 5, 6],
+            [6, 7, 8, 9],
+        ]
+        assert interpolation.windows(times[:2], [0.5], 5).tolist() == [[0, 1]]
+
+    def test_interpolate(self):
+        interpolation = cesiumpy.math.interpolation
+
+        times = np.arange(10.0)
+        values = np.stack([times**3, times], axis=1)
+        query = [0.25, 4.5, 8.75]
+
+        # polynomials up to degree are interpolated exactly
+        result = interpolation.interpolate(times, values, query, 3)
+        np.testing.assert_allclose(result, [[q**3, q] for q in query])
+
+        result = interpolation.interpolate(times, values, [4.5], 1)
+        np.testing.assert_allclose(result, [[(64 + 125) / 2, 4.5]])
+
+    def test_interpolate_quaternions(self):
+        interpolation = cesiumpy.math.interpolation
+
+        # rotation about a fixed axis at constant rate
+        times = np.arange(10.0)
+        angles = 0.3 * times
+        axis = np.array([0.0, 0.6, 0.8])
+        q = np.column_stack(
+            [np.sin(angles / 2)[:, np.newaxis] * axis, np.cos(angles / 2)]
+        )
+
+        result = interpolation.interpolate_quaternions(times, q, [2.5, 7.25], 1)
+        expected = [0.3 * 2.5, 0.3 * 7.25]
+        angles = interpolation.quaternion_angles(result, [0.0, 0.0, 0.0, 1.0])
+        np.testing.assert_allclose(angles, expected)
+        np.testing.assert_allclose(result[:, 1:3] / result[:, 1:2], [[1, 4 / 3]] * 2)
+
+    def test_decimate_mask(self):
+        interpolation = cesiumpy.math.interpolation
+
+        # circular orbit sampled every second
+        times = np.arange(5000.0)
+        angles = 2 * np.pi * times / 5400.0
+        xyz = 7000e3 * np.column_stack(
+            [np.cos(angles), np.sin(angles), np.zeros_like(times)]
+        )
+
+        mask = interpolation.decimate_mask(times, xyz, 1.0, degree=5)
+        assert mask[0] and mask[-1]
+        assert mask.sum() < len(times) / 10
+
+        # within the error bound at all samples
+        kept = np.flatnonzero(mask)
+        result = interpolation.interpolate(times[kept], xyz[kept], times, 5)
+        assert np.linalg.norm(result - xyz, axis=1).max() <= 1.0
+
+        # a line is interpolated exactly from its ends
+        line = times[:, np.newaxis]
+        mask = interpolation.decimate_mask(times, line, 1e-6)
+        assert np.flatnonzero(mask).tolist() == [0, 4999]
@@ -0,0 +1,237 @@
+# Apache License 2.0
+
+from datetime import datetime, timezone
+import io
+
+import numpy as np
+import pytest
+
+import cesiumpy
+from cesiumpy import orbit
+from cesiumpy.orbit import propagation
+
+# verification case of "Revisiting Spacetrack Report #3"
+VANGUARD = [
+    "1 00005U 58002B   00179.78495062  .00000023  00000-0  28098-4 0  4753",
+    "2 00005  34.2682 348.7242 1859667 331.7664  19.3264 10.82419157413667",
+]
+
+# circular orbit at about 200 km, which decays within days
+LOW = [
+    "1 00006U 58002B   00179.78495062  .00000023  00000-0  10000-2 0  4756",
+    "2 00006  34.2682 348.7242 0001000 331.7664  19.3264 16.20000000413668",
+]
+
+
+@pytest.fixture
+def epoch() -> datetime:
+    return datetime(2024, 3, 20, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def times() -> np.ndarray:
+    return np.datetime64("2024-03-20") + np.arange(0, 86401, 600) * np.timedelta64(
+        1, "s"
+    )
+
+
+class TestKepler:
+    def test_solve_kepler(self):
+        rng = np.random.default_rng(0)
+        mean_anomaly = rng.uniform(-10.0, 10.0, size=(10, 100))
+        for e in (0.0, 0.1, 0.9, 0.999):
+            anomaly = orbit.solve_kepler(mean_anomaly, e)
+            np.testing.assert_allclose(
+                anomaly - e * np.sin(anomaly),
+                np.remainder(mean_anomaly, 2 * np.pi),
+                atol=1e-12,
+            )
+
+    def test_rates(self, epoch: datetime):
+        # about 5 degrees per day westward at the altitude of ISS
+        elements = orbit.KeplerianElements(6778e3, 0, 51.6, 0, 0, 0, epoch, True)
+        raan, _, _ = elements.rates()
+        np.testing.assert_allclose(np.degrees(raan) * 86400, -5.0, atol=0.01)
+
+        # sun-synchronous orbit, 360 degrees per year eastward
+        elements = orbit.KeplerianElements(7078e3, 0, 98.19, 0, 0, 0, epoch, True)
+        raan, _, _ = elements.rates()
+        np.testing.assert_allclose(np.degrees(raan) * 86400, 360 / 365.25, atol=0.01)
+
+        elements = orbit.KeplerianElements(
+            7078e3, 0, 98.19, 0, 0, 0, epoch, True, j2=False
+        )
+        assert elements.rates()[0].tolist() == [0.0]
+
+    def test_propagate_inertial(self, epoch: datetime, times: np.ndarray):
+        elements = orbit.KeplerianElements(
+            semi_major_axis=[7e6, 8e6],
+            eccentricity=[0.0, 0.2],
+            inclination=[0.0, 1.0],
+            raan=0.3,
+            argument_of_perigee=0.2,
+            mean_anomaly=0.1,
+            epoch=epoch,
+            j2=False,
+        )
+        assert len(elements) == 2
+
+        positions, velocities = elements.propagate_inertial(times)
+        assert positions.shape == velocities.shape == (2, len(times), 3)
+
+        # conserved energy and angular momentum of two-body orbits
+        energy = np.linalg.norm(
+            velocities, axis=-1
+        ) ** 2 / 2 - orbit.elements.MU_EARTH / np.linalg.norm(positions, axis=-1)
+        np.testing.assert_allclose(
+            energy,
+            np.broadcast_to(
+                -orbit.elements.MU_EARTH / (2 * elements.semi_major_axis[:, None]),
+                energy.shape,
+            ),
+        )
+        momentum = np.cross(positions, velocities)
+        np.testing.assert_allclose(momentum, momentum[:, :1].repeat(len(times), 1))
+
+        with pytest.raises(ValueError, match="eccentricity must be in"):
+            orbit.KeplerianElements(7e6, 1.0, 0, 0, 0, 0, epoch)
+
+    def test_getitem(self, epoch: datetime):
+        elements = orbit.KeplerianElements(
+            np.arange(1, 6) * 1e7, 0, 0, 0, 0, 0, epoch, names=list("abcde")
+        )
+        chunk = elements[1:3]
+        assert len(chunk) == 2
+        assert chunk.semi_major_axis.tolist() == [2e7, 3e7]
+        assert chunk.names.tolist() == ["b", "c"]
+        assert chunk.j2
+        assert len(elements) == 5
+
+
+class TestTLE:
+    def test_parse(self):
+        tle = orbit.TLE(["VANGUARD 1"] + VANGUARD + LOW)
+        assert len(tle) == 2
+        assert tle.names.tolist() == ["VANGUARD 1", "6"]
+        assert tle.satellite_number.tolist() == [5, 6]
+        assert tle.epoch[0] == np.datetime64("2000-06-27T18:50:19.733568")
+        np.testing.assert_allclose(tle.bstar, [0.28098e-4, 1e-3])
+        np.testing.assert_allclose(tle.eccentricity, [0.1859667, 0.0001])
+        np.testing.assert_allclose(np.degrees(tle.inclination), 34.2682)
+        np.testing.assert_allclose(tle.period[0], 133.1, atol=0.01)
+        assert not tle.deep_space.any()
+
+        with pytest.raises(ValueError, match="invalid checksum"):
+            orbit.TLE([VANGUARD[0][:68] + "0", VANGUARD[1]])
+
+    def test_read_tle(self, tmp_path):
+        path = tmp_path / "catalog.txt"
+        path.write_text("0 VANGUARD 1\n" + "\n".join(VANGUARD) + "\n")
+        assert orbit.read_tle(str(path)).names.tolist() == ["VANGUARD 1"]
+        assert len(orbit.read_tle(io.StringIO("\n".join(LOW)))) == 1
+
+    def test_sgp4(self):
+        tle = orbit.TLE(VANGUARD)
+        positions, velocities = orbit.sgp4.sgp4(tle, [[0.0, 360.0, 720.0]])
+        np.testing.assert_allclose(
+            positions[0],
+            [
+                [7022.46529266, -1400.08296755, 0.03995155],
+                [-7154.03120202, -3783.17682504, -3536.19412294],
+                [-7134.59340119, 6531.68641334, 3260.27186483],
+            ],
+            atol=1e-6,
+        )
+        np.testing.assert_allclose(
+            velocities[0, :2],
+            [
+                [1.893841015, 6.405893759, 4.534807250],
+                [4.741887409, -4.151817765, -2.093935425],
+            ],
+            atol=1e-8,
+        )
+
+    def test_sgp4_decay(self):
+        tle = orbit.TLE(LOW)
+        positions, _ = orbit.sgp4.sgp4(tle, [[0.0, 1440.0, 30 * 1440.0]])
+        assert not np.isnan(positions[0, :2]).any()
+        assert np.isnan(positions[0, 2]).all()
+
+    def test_deep_space(self):
+        # geostationary satellite
+        geo = [
+            "1 26038U 00004A   24080.50000000 -.00000267  00000-0  00000+0 0  9990",
+            "2 26038   0.0313  89.2386 0002573 200.5426  98.1963  1.00271998 88890",
+        ]
+        geo = [line[:68] + str(orbit.tle._checksum(line)) for line in geo]
+        tle = orbit.TLE(geo)
+        assert tle.deep_space.tolist() == [True]
+        with pytest.raises(ValueError, match="deep-space satellites"):
+            orbit.propagate(tle, np.datetime64("2024-03-20"))
+
+
+class TestPropagate:
+    def test_fixed_frame(self, epoch: datetime, times: np.ndarray):
+        # geostationary satellite above longitude 0
+        theta = orbit.gmst(np.datetime64("2024-03-20"))
+        a = (orbit.elements.MU_EARTH / orbit.frames.EARTH_ROTATION_RATE**2) ** (1 / 3)
+        elements = orbit.KeplerianElements(a, 0, 0, 0, 0, theta, epoch, j2=False)
+
+        ephemeris = orbit.propagate(elements, times)
+        assert len(ephemeris) == 1
+        geodetic = cesiumpy.math.geodesy.ecef_to_geodetic(ephemeris.positions[0])
+        np.testing.assert_allclose(geodetic[:, :2], 0.0, atol=1e-3)
+        np.testing.assert_allclose(ephemeris.velocities, 0.0, atol=1e-6)
+
+    def test_gmst(self):
+        np.testing.assert_allclose(
+            np.degrees(orbit.gmst([datetime(2000, 1, 1, 12)])), [280.46061837]
+        )
+
+    def test_orientations(self, epoch: datetime, times: np.ndarray):
+        elements = orbit.KeplerianElements(7e6, 0.01, 1.0, 0.3, 0.2, 0.1, epoch)
+        ephemeris = orbit.propagate(elements, times)
+        q = ephemeris.orientations()
+        assert q.shape == (1, len(times), 4)
+
+        # z axis of the body frame points to the center of the Earth
+        z = cesiumpy.orientation.multiply(
+            cesiumpy.orientation.multiply(q, [0.0, 0.0, 1.0, 0.0]),
+            q * [-1.0, -1.0, -1.0, 1.0],
+        )[..., :3]
+        positions = ephemeris.positions
+        np.testing.assert_allclose(
+            z, -positions / np.linalg.norm(positions, axis=-1, keepdims=True)
+        )
+
+    def test_satellites(self):
+        tle = orbit.TLE(VANGUARD + LOW)
+        times = tle.epoch[0] + np.arange(0, 10 * 86400, 600) * np.timedelta64(1, "s")
+        ephemeris = orbit.propagate(tle, times)
+        assert ephemeris.names.tolist() == ["5", "6"]
+
+        satellites = ephemeris.satellites()
+        assert len(satellites) == 2
+        position = satellites[0].position
+        assert len(position) == len(times)
+        assert position.interpolation == "lagrange"
+        np.testing.assert_allclose(position.values, ephemeris.positions[0])
+
+        # samples after decay are dropped
+        assert 0 < len(satellites[1].position) < len(times)
+        assert len(satellites[1].orientation) == len(satellites[1].position)
+
+        viewer = cesiumpy.Viewer()
+        viewer.entities.add(cesiumpy.Point(position=position))
+        assert f"widget.{position.name}.addSamplesPackedArray(" in viewer.to_html()
+
+    def test_workers(self, monkeypatch, epoch: datetime, times: np.ndarray):
+        elements = orbit.KeplerianElements(
+            7e6, 0.001, 1.0, np.linspace(0, 6, 10), 0, np.linspace(0, 1, 10), epoch
+        )
+        expected = orbit.propagate(elements, times)
+
+        monkeypatch.setattr(propagation, "MIN_PARALLEL_SATELLITES", 4)
+        ephemeris = orbit.propagate(elements, times, workers=2, chunk_size=3)
+        np.testing.assert_array_equal(ephemeris.positions, expected.positions)
+        np.testing.assert_array_equal(ephemeris.velocities, expected.velocities)
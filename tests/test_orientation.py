@@ -1,8 +1,13 @@
 # Apache License 2.0
 
+import math
+
+import numpy as np
+
 from cesiumpy import Cartesian3
 from cesiumpy import Quaternion
 from cesiumpy import HeadingPitchRoll
+from cesiumpy import orientation
 
 
 class TestQuaternion:
@@ -13,23 +18,47 @@ class TestQuaternion:
         )
 
     def test_multiply_success(self):
+        # q1 * q2 is Cesium.Quaternion.multiply(q2, q1)
         assert (
             Quaternion(0.0, 0.0, 0.0, 1.0) * Quaternion(0.0, 1.0, 0.0, 0.0)
-        ).generate_script() == "Cesium.Quaternion.multiply(new Cesium.Quaternion(0.0, 1.0, 0.0, 0.0), new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0), new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0))"
+        ).generate_script() == "new Cesium.Quaternion(0.0, 1.0, 0.0, 0.0)"
+        assert (
+            Quaternion(1.0, 0.0, 0.0, 0.0) * Quaternion(0.0, 1.0, 0.0, 0.0)
+        ).generate_script() == "new Cesium.Quaternion(0.0, 0.0, -1.0, 0.0)"
 
-    def test_from_axis_angle_success(self):
+    def test_multiply_deferred_success(self):
+        deferred = orientation._QuaternionFromProduct(
+            Quaternion(0.0, 0.0, 0.0, 1.0), Quaternion(0.0, 1.0, 0.0, 0.0)
+        )
         assert (
-            Quaternion.from_axis_angle(Cartesian3(0.0, 0.0, 1.0), 1.2).generate_script()
-            == "Cesium.Quaternion.fromAxisAngle(new Cesium.Cartesian3(0.0, 0.0, 1.0), 1.2)"
+            Quaternion(0.0, 0.0, 0.0, 1.0) * deferred
+        ).generate_script() == "Cesium.Quaternion.multiply(Cesium.Quaternion.multiply(new Cesium.Quaternion(0.0, 1.0, 0.0, 0.0), new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0), new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0)), new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0), new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0))"
+
+    def test_from_axis_angle_success(self):
+        q = Quaternion.from_axis_angle(Cartesian3(0.0, 0.0, 2.0), 1.2)
+        np.testing.assert_allclose(
+            q.to_list(), [0.0, 0.0, math.sin(0.6), math.cos(0.6)]
         )
 
     def test_from_heading_pitch_roll_success(self):
-        assert (
-            Quaternion.from_heading_pitch_roll(
-                HeadingPitchRoll(1.0, 2.0, 3.0)
-            ).generate_script()
-            == "Cesium.Quaternion.fromHeadingPitchRoll(new Cesium.HeadingPitchRoll(1.0, 2.0, 3.0))"
+        # heading about the negative z axis
+        q = Quaternion.from_heading_pitch_roll(HeadingPitchRoll(1.0, 0.0, 0.0))
+        np.testing.assert_allclose(
+            q.to_list(), [0.0, 0.0, -math.sin(0.5), math.cos(0.5)], atol=1e-15
+        )
+
+        hpr = HeadingPitchRoll.from_quaternion(
+            Quaternion.from_heading_pitch_roll(HeadingPitchRoll(0.3, 0.2, 0.1))
         )
+        np.testing.assert_allclose([hpr.heading, hpr.pitch, hpr.roll], [0.3, 0.2, 0.1])
+
+    def test_normalized_success(self):
+        q = Quaternion(0.0, 0.0, 3.0, 4.0).normalized()
+        assert q.to_list() == [0.0, 0.0, 0.6, 0.8]
+
+    def test_slerp_success(self):
+        q = Quaternion.slerp(Quaternion.unit(), Quaternion(0.0, 0.0, 1.0, 0.0), 0.5)
+        np.testing.assert_allclose(q.to_list(), [0.0, 0.0, 0.5**0.5, 0.5**0.5])
 
 
 class TestHeadingPitchRoll:
@@ -40,15 +69,76 @@ class TestHeadingPitchRoll:
         )
 
     def test_from_degrees_success(self):
-        assert (
-            HeadingPitchRoll.from_degrees(1.0, 2.0, 3.0).generate_script()
-            == "Cesium.HeadingPitchRoll.fromDegrees(1.0, 2.0, 3.0)"
-        )
+        hpr = HeadingPitchRoll.from_degrees(90.0, 180.0, 0.0)
+        assert (hpr.heading, hpr.pitch, hpr.roll) == (math.pi / 2, math.pi, 0.0)
 
     def test_from_quaternion_success(self):
         assert (
             HeadingPitchRoll.from_quaternion(
                 Quaternion(0.0, 0.0, 0.0, 1.0)
             ).generate_script()
-            == "Cesium.HeadingPitchRoll.fromQuaternion(new Cesium.Quaternion(0.0, 0.0, 0.0, 1.0))"
+            == "new Cesium.HeadingPitchRoll(-0.0, -0.0, 0.0)"
+        )
+
+
+class TestVectorized:
+    def test_multiply(self):
+        rng = np.random.default_rng(0)
+        q = orientation.normalize(rng.normal(size=(100, 4)))
+        r = orientation.normalize(rng.normal(size=(100, 4)))
+
+        products = orientation.multiply(q, r)
+        expected = [
+            (Quaternion(*b.tolist()) * Quaternion(*a.tolist())).to_list()
+            for a, b in zip(q, r)
+        ]
+        np.testing.assert_allclose(products, expected)
+        np.testing.assert_allclose(np.linalg.norm(products, axis=1), 1.0)
+
+        # broadcast against a single quaternion
+        assert orientation.multiply(q, [0.0, 0.0, 0.0, 1.0]).shape == (100, 4)
+
+    def test_heading_pitch_roll(self):
+        rng = np.random.default_rng(0)
+        hpr = rng.uniform(-1.5, 1.5, size=(100, 3))
+        q = orientation.from_heading_pitch_roll(*hpr.T)
+        assert q.shape == (100, 4)
+        np.testing.assert_allclose(orientation.to_heading_pitch_roll(q), hpr)
+
+    def test_slerp(self):
+        axis = [0.0, 0.0, 1.0]
+        start = orientation.from_axis_angle(axis, 0.2)
+        end = orientation.from_axis_angle(axis, 1.0)
+
+        t = np.linspace(0.0, 1.0, 5)
+        np.testing.assert_allclose(
+            orientation.slerp(start, end, t),
+            orientation.from_axis_angle(axis, 0.2 + 0.8 * t),
+        )
+        # shortest rotation, whatever the sign of the end quaternion
+        np.testing.assert_allclose(
+            orientation.slerp(start, -end, t),
+            orientation.from_axis_angle(axis, 0.2 + 0.8 * t),
+        )
+        # nearly equal quaternions are interpolated linearly
+        np.testing.assert_allclose(orientation.slerp(start, start, 0.5), start)
+
+    def test_from_rotation_matrix(self):
+        rng = np.random.default_rng(0)
+        q = orientation.normalize(rng.normal(size=(100, 4)))
+        q[:4] = np.eye(4)
+        x, y, z, w = q.T
+        matrices = np.stack(
+            [
+                [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+                [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+                [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+            ]
+        ).transpose(2, 0, 1)
+
+        # the same rotation, with a non-negative scalar part
+        np.testing.assert_allclose(
+            orientation.from_rotation_matrix(matrices),
+            q * np.where(w < 0, -1.0, 1.0)[:, np.newaxis],
+            atol=1e-12,
         )
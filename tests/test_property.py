@@ -0,0 +1,282 @@
+# Apache License 2.0
+
+from datetime import datetime, timedelta
+import json
+import re
+
+import numpy as np
+import pytest
+
+import cesiumpy
+
+
+class TestSampledProperty:
+    def test_generate_script(
+        self,
+        sampled_position: cesiumpy.SampledPositionProperty,
+    ):
+        viewer = cesiumpy.Viewer()
+        viewer.entities.add(cesiumpy.Point(position=sampled_position))
+        name = f"widget.{sampled_position.name}"
+        (script,) = [s for s in viewer.script if s.startswith(f"{name}.add")]
+
+        # seconds from epoch and positions in the Earth-fixed frame
+        match = re.match(
+            rf"{name}\.addSamplesPackedArray\((\[.*\]), "
+            r'Cesium\.JulianDate\.fromIso8601\("2022-01-01T00:00:00\+00:00"\)\);$',
+            script,
+        )
+        packed = np.array(json.loads(match.group(1))).reshape(-1, 4)
+        assert packed[:3, 0].tolist() == [0.0, 30.0, 60.0]
+        np.testing.assert_allclose(
+            packed[0, 1:], [cesiumpy.math.geodesy.WGS84_A + 500e3, 0.0, 0.0]
+        )
+
+        script = "\n".join(viewer.iter_script(array_encoding="quantized"))
+        assert f"{name}.addSamplesPackedArray(cesiumpyDecodeQuantized(" in script
+        assert "[1000000.0, 100.0, 100.0, 100.0]" in script
+
+    def test_columns(
+        self,
+        sampled_position: cesiumpy.SampledPositionProperty,
+        instants: list[datetime],
+    ):
+        assert len(sampled_position) == len(instants)
+        assert sampled_position.epoch == instants[0]
+        assert sampled_position.values.shape == (len(instants), 3)
+        assert sampled_position.values[:3].tolist() == [
+            [0.0, 0.0, 500e3],
+            [1.0, 0.0, 500e3],
+            [2.0, 0.0, 500e3],
+        ]
+        assert sampled_position.times[1] == np.datetime64("2022-01-01T00:00:30")
+
+        # samples are built from columns
+        time, value, derivatives = sampled_position.samples[1]
+        assert time == instants[1]
+        assert value.script == "Cesium.Cartesian3.fromDegrees(1.0, 0.0, 500000.0)"
+        assert derivatives is None
+
+    def test_objects(self, epoch: datetime):
+        q = cesiumpy.Quaternion(0.0, 0.0, 0.0, 1.0)
+        computed = cesiumpy.orientation._QuaternionFromProduct(q, q)
+
+        prop = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+        prop.add_sample(epoch, q)
+        prop.add_sample(epoch + timedelta(seconds=1), computed)
+
+        # quaternions computed by Cesium are kept as they are
+        samples = prop.samples
+        assert samples[0][1].generate_script() == q.generate_script()
+        assert samples[1][1] is computed
+        assert prop.values[0].tolist() == [0.0, 0.0, 0.0, 1.0]
+        assert np.isnan(prop.values[1]).all()
+
+        viewer = cesiumpy.Viewer()
+        viewer.entities.add(
+            cesiumpy.Box(position=(0, 0, 0), orientation=prop, dimensions=(1, 1, 1))
+        )
+        name = f"widget.{prop.name}"
+        script = [s for s in viewer.script if s.startswith(f"{name}.")]
+        assert script == [
+            f"""{name}.addSamplesPackedArray([0.0, 0.0, 0.0, 0.0, 1.0], Cesium.JulianDate.fromIso8601("2022-01-01T00:00:00+00:00"));""",
+            f"""{name}.addSample("2022-01-01T00:00:01+00:00", {computed.generate_script()});""",
+        ]
+
+        # times relative to the epoch of the page
+        clock = cesiumpy.Clock(start_time=epoch)
+        viewer.clock_view_model = cesiumpy.ClockViewModel(clock)
+        script = [
+            s
+            for s in viewer.iter_script(relative_times=True)
+            if s.startswith(f"{name}.")
+        ]
+        assert script == [
+            f"{name}.addSamplesPackedArray([0.0, 0.0, 0.0, 0.0, 1.0], cesiumpyTime(0));",
+            f"{name}.addSample(cesiumpyTime(1), {computed.generate_script()});",
+        ]
+
+    def test_add_samples(self, epoch: datetime):
+        prop = cesiumpy.SampledPositionProperty()
+
+        times = np.datetime64("2022-01-01T00:00:00") + np.arange(3) * np.timedelta64(
+            1, "s"
+        )
+        prop.add_samples(times, [[0, 0, 1], [1, 0, 1], [2, 0, 1]], degrees=True)
+        assert prop.epoch == epoch
+
+        # seconds from another epoch
+        prop.add_samples(
+            [0.5], [[3, 0, 1]], epoch=epoch + timedelta(seconds=3), degrees=True
+        )
+        prop.add_sample(
+            epoch + timedelta(seconds=4), cesiumpy.Cartesian3.fromDegrees(4, 0, 1)
+        )
+
+        assert len(prop) == 5
+        assert [t for t, _, _ in prop.samples] == [
+            epoch + timedelta(seconds=s) for s in (0, 1, 2, 3.5, 4)
+        ]
+        assert prop.values[:, 0].tolist() == [0, 1, 2, 3, 4]
+
+        assert [s[0] for s in prop._packed_samples()] == [0.0, 1.0, 2.0, 3.5, 4.0]
+
+        with pytest.raises(ValueError):
+            prop.add_samples(times, [[0, 0], [1, 0], [2, 0]], degrees=True)
+
+        with pytest.raises(ValueError):
+            prop.add_samples(times, [[0, 0, 1], [1, 0, 1], [2, 0, 1]])
+
+        with pytest.raises(ValueError):
+            cesiumpy.SampledPositionProperty().add_samples([0.0], [[0, 0, 0]])
+
+        # naive datetimes are in UTC, as numpy.datetime64
+        mixed = cesiumpy.SampledPositionProperty()
+        mixed.add_samples(times, [[0, 0, 1], [1, 0, 1], [2, 0, 1]], degrees=True)
+        mixed.add_sample(
+            datetime(2022, 1, 1, 0, 0, 3), cesiumpy.Cartesian3.fromDegrees(3, 0, 1)
+        )
+        mixed.add_samples([datetime(2022, 1, 1, 0, 0, 4)], [[4, 0, 1]], degrees=True)
+        assert mixed.times[-2:].tolist() == [
+            datetime(2022, 1, 1, 0, 0, s) for s in (3, 4)
+        ]
+
+        naive = cesiumpy.SampledPositionProperty()
+        naive.add_sample(datetime(2022, 1, 1), cesiumpy.Cartesian3(1, 2, 3))
+        naive.add_sample(epoch + timedelta(seconds=1), cesiumpy.Cartesian3(1, 2, 3))
+        assert naive.times[1] == times[1]
+
+        # no samples, such as satellites decayed before the first time
+        empty = cesiumpy.SampledPositionProperty()
+        empty.add_samples(times[:0], np.zeros((0, 3)))
+        assert len(empty) == 0
+
+    def test_decimate(self, epoch: datetime):
+        # circular orbit sampled every second, in degrees
+        seconds = np.arange(3600.0)
+        longitudes = 360.0 * seconds / 5400.0
+        positions = np.column_stack(
+            [longitudes, np.zeros_like(seconds), np.full_like(seconds, 500e3)]
+        )
+
+        prop = cesiumpy.SampledPositionProperty()
+        prop.add_samples(seconds, positions, epoch=epoch, degrees=True)
+        prop.decimate(1.0, interpolation="lagrange")
+        assert 2 < len(prop) < 3600 / 10
+        assert (prop.interpolation, prop.interpolation_degree) == ("lagrange", 5)
+        # kept samples are unchanged
+        assert prop.values[0].tolist() == [0.0, 0.0, 500e3]
+        assert prop.times[-1] == np.datetime64("2022-01-01T00:59:59")
+
+        viewer = cesiumpy.Viewer()
+        viewer.entities.add(cesiumpy.Point(position=prop))
+        assert (
+            f"widget.{prop.name}.setInterpolationOptions({{interpolationAlgorithm: "
+            "Cesium.LagrangePolynomialApproximation, interpolationDegree: 5});"
+        ) in viewer.script
+
+        with pytest.raises(ValueError):
+            prop.set_interpolation_options("spline")
+
+    def test_decimate_orientation(self, epoch: datetime):
+        # rotation about the z axis at constant rate
+        seconds = np.arange(1000.0)
+        angles = 0.001 * seconds
+        q = np.column_stack(
+            [
+                np.zeros((1000, 2)),
+                np.sin(angles / 2),
+                np.cos(angles / 2),
+            ]
+        )
+
+        prop = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+        prop.add_samples(seconds, q, epoch=epoch)
+        prop.decimate(1e-6)
+        assert prop.interpolation == "linear"
+        assert len(prop) == 2
+
+        # quaternions computed by Cesium are unknown
+        prop.add_sample(
+            epoch + timedelta(seconds=1000),
+            cesiumpy.orientation._QuaternionFromProduct(
+                cesiumpy.Quaternion.unit(), cesiumpy.Quaternion.unit()
+            ),
+        )
+        with pytest.raises(ValueError):
+            prop.decimate(1e-6)
+
+    def test_get_value(self, epoch: datetime):
+        prop = cesiumpy.SampledPositionProperty()
+        seconds = np.arange(10.0)
+        prop.add_samples(
+            seconds, np.column_stack([seconds**3, seconds, -seconds]), epoch
+        )
+
+        # linear interpolation by default, as Cesium
+        value = prop.get_value(epoch + timedelta(seconds=4.5))
+        assert isinstance(value, cesiumpy.Cartesian3)
+        assert (value.x, value.y, value.z) == ((64 + 125) / 2, 4.5, -4.5)
+        assert prop.get_value(epoch + timedelta(seconds=9.5)) is None
+
+        # times as numpy.datetime64, datetime or seconds from epoch
+        prop.set_interpolation_options("hermite", 3)
+        times = np.datetime64("2022-01-01") + np.array([250, 8750], "timedelta64[ms]")
+        expected = [[0.25**3, 0.25, -0.25], [8.75**3, 8.75, -8.75]]
+        np.testing.assert_allclose(prop.get_value(times), expected)
+        np.testing.assert_allclose(prop.get_value([0.25, 8.75]), expected)
+        np.testing.assert_allclose(
+            prop.get_value([epoch + timedelta(seconds=s) for s in (0.25, 8.75)]),
+            expected,
+        )
+        assert np.isnan(prop.get_value([-1.0, 10.0])).all()
+
+        with pytest.raises(ValueError):
+            cesiumpy.SampledPositionProperty().get_value(epoch)
+
+    def test_unsorted_samples(self, epoch: datetime):
+        # Cesium merges samples in time order
+        prop = cesiumpy.SampledPositionProperty()
+        for s in (20, 0, 10):
+            prop.add_sample(epoch + timedelta(seconds=s), cesiumpy.Cartesian3(s, 0, 0))
+        assert prop.get_value(epoch + timedelta(seconds=5)).x == 5
+        assert prop.get_value(epoch + timedelta(seconds=15)).x == 15
+        assert prop.values[:, 0].tolist() == [0, 10, 20]
+
+        prop = cesiumpy.SampledPositionProperty()
+        prop.add_samples([3.0, 1.0, 2.0], [[3, 0, 0], [1, 0, 0], [2, 0, 0]], epoch)
+        np.testing.assert_allclose(prop.get_value([1.5, 2.5])[:, 0], [1.5, 2.5])
+
+        # samples kept as objects follow their times
+        derivatives = [cesiumpy.Cartesian3(1, 0, 0)]
+        prop.add_sample(epoch, cesiumpy.Cartesian3.fromDegrees(0, 0, 0), derivatives)
+        assert [t for t, _, _ in prop.samples] == [
+            epoch + timedelta(seconds=s) for s in (0, 1, 2, 3)
+        ]
+        assert isinstance(prop.samples[0][1], cesiumpy.Cartesian3)
+        assert prop.samples[0][2] is derivatives
+        assert list(prop._objects) == [0]
+
+        # collinear samples are decimated to the first and last ones
+        prop = cesiumpy.SampledPositionProperty()
+        prop.add_samples([3.0, 1.0, 2.0], [[3, 0, 0], [1, 0, 0], [2, 0, 0]], epoch)
+        assert prop.decimate(0.1).values[:, 0].tolist() == [1, 3]
+
+    def test_get_value_orientation(self, epoch: datetime):
+        prop = cesiumpy.SampledProperty(type=cesiumpy.Quaternion)
+        prop.add_samples([0.0, 1.0], [[0, 0, 0, 1], [0, 0, 1, 0]], epoch=epoch)
+
+        # halfway of the rotation of pi about the z axis
+        value = prop.get_value(epoch + timedelta(seconds=0.5))
+        np.testing.assert_allclose(
+            [value.x, value.y, value.z, value.w], [0, 0, 0.5**0.5, 0.5**0.5]
+        )
+
+        prop.add_sample(
+            epoch + timedelta(seconds=2),
+            cesiumpy.orientation._QuaternionFromProduct(
+                cesiumpy.Quaternion.unit(), cesiumpy.Quaternion.unit()
+            ),
+        )
+        with pytest.raises(ValueError):
+            prop.get_value(epoch)
@@ -132,3 +132,59 @@ class TestViewer:
         ds = cesiumpy.CzmlDataSource.from_file("tests/data/simple.czml")
         viewer = cesiumpy.Viewer(data_sources=[ds])
         assert "widget.dataSources.add(Cesium.CzmlDataSource.load" in viewer.to_html()
+
+    def test_satellite_sensors_share_position(
+        self,
+        asset_id: int,
+        sampled_position: cesiumpy.SampledPositionProperty,
+        sampled_orientation: cesiumpy.SampledProperty,
+    ):
+        satellite = cesiumpy.Satellite(
+            position=sampled_position,
+            orientation=sampled_orientation,
+            model=cesiumpy.IonResource(asset_id=asset_id),
+            sensors=[
+                cesiumpy.ConicSensor(
+                    direction=cesiumpy.Cartesian3(0.0, 0.0, +1.0),
+                    half_angle=cesiumpy.math.to_radians(1.0),
+                    length=100.0,
+                )
+                for _ in range(5)
+            ],
+        )
+
+        viewer = cesiumpy.Viewer()
+        satellite.render(viewer)
+        script = viewer.to_html()
+
+        # samples of the position are written once for the model and sensors
+        name = f"widget.{sampled_position.name}"
+        assert script.count(f"{name}.addSamplesPackedArray(") == 1
+        assert script.count(f"position: {name},") == 6
+
+    def test_sensor_orientation_samples(
+        self,
+        asset_id: int,
+        sampled_position: cesiumpy.SampledPositionProperty,
+        sampled_orientation: cesiumpy.SampledProperty,
+    ):
+        sensor = cesiumpy.ConicSensor(
+            direction=cesiumpy.Cartesian3(+1.0, 0.0, 0.0),
+            half_angle=cesiumpy.math.to_radians(1.0),
+            length=100.0,
+        )
+        satellite = cesiumpy.Satellite(
+            position=sampled_position,
+            orientation=sampled_orientation,
+            model=cesiumpy.IonResource(asset_id=asset_id),
+            sensors=[sensor],
+        )
+
+        viewer = cesiumpy.Viewer()
+        satellite.render(viewer)
+        script = viewer.to_html()
+
+        # orientations of sensors are computed in Python
+        assert "Cesium.Quaternion.multiply" not in script
+        name = f"widget.{sensor.name}_orientation"
+        assert script.count(f"{name}.addSamplesPackedArray(") == 1
@@ -1,5 +1,10 @@
 # Apache License 2.0
 
+import base64
+import gzip
+import io
+
+import pytest
 
 import cesiumpy.util.html as html
 
@@ -52,3 +57,86 @@ class TestHTML:
         res = html._add_indent(["aaa", "bbb"], indent=3)
         exp = ["   aaa", "   bbb"]
         assert res == exp
+
+    def test_iter_wrap_scripts(self):
+        scripts = iter(["aaa", "", "bbb"])
+        res = html.iter_wrap_scripts(scripts)
+        assert not isinstance(res, list)
+        assert list(res) == html.wrap_scripts(["aaa", "bbb"])
+
+    def test_write_html(self):
+        buffer = io.StringIO()
+        html.write_html(buffer, "aaa", ["bbb", "ccc"], iter(["ddd"]))
+        assert buffer.getvalue() == html.build_html("aaa", ["bbb", "ccc"], "ddd")
+
+        with pytest.raises(ValueError):
+            html.build_html(1)
+
+    def test_compact_script(self):
+        res = html.compact_script(
+            """widget.entities.add({name: "a, b", position: Cesium.Cartesian3.fromDegrees(-110.0, 40.00000000000001, 500000.0), point: {pixelSize: 10.0}});"""
+        )
+        exp = """widget.entities.add({name:"a, b",position:Cesium.Cartesian3.fromDegrees(-110,40,500000),point:{pixelSize:10}});"""
+        assert res == exp
+
+        # spaces between identifiers and between signs are kept
+        res = html.compact_script("var x = a - -1.5e-05;  const _c10 = new X(1e21);")
+        assert res == "var x=a- -1.5e-05;const _c10=new X(1e+21);"
+
+        res = html.compact_script("f(1.23456789, 1.5)", digits=3)
+        assert res == "f(1.23,1.5)"
+        res = html.compact_script("f(1.23456789, 1.5)", digits=None)
+        assert res == "f(1.23456789,1.5)"
+
+        res = html.compact_script(
+            'Cesium.Color.RED, "Cesium.x", a.Cesium.b', alias="$C"
+        )
+        assert res == '$C.Color.RED,"Cesium.x",a.Cesium.b'
+
+    def test_iter_compact_scripts(self):
+        scripts = [
+            """widget.entities.add({name: "a: b", position: _c0, point: {pixelSize: 10.0, color: Cesium.Color.RED}});""",
+            """widget.entities.add({position: _c0, polyline: {width: 2.0, material: new Cesium.PolylineGlowMaterialProperty({glowPower: 0.2})}});""",
+            """var x = {position: _c0};""",
+        ]
+        res = list(html.iter_compact_scripts(scripts))
+        assert res[:2] == ["const $C=Cesium;", "const $K={};"]
+        assert res[3:] == [
+            'Object.assign($K,{$a:"name",$b:"position",$c:"point",$d:"pixelSize",$e:"color"});',
+            """widget.entities.add($E({$a:"a: b",$b:_c0,$c:{$d:10,$e:$C.Color.RED}}));""",
+            'Object.assign($K,{$f:"polyline",$g:"width",$h:"material"});',
+            # keys of objects passed to constructors are kept
+            """widget.entities.add($E({$b:_c0,$f:{$g:2,$h:new $C.PolylineGlowMaterialProperty({glowPower:0.2})}}));""",
+            "var x={position:_c0};",
+        ]
+
+        res = list(html.iter_compact_scripts(scripts, short_keys=False))
+        assert res[1:] == [html.compact_script(s, alias="$C") for s in scripts]
+
+    def test_iter_wrap_scripts_without_indent(self):
+        res = list(html.iter_wrap_scripts(["aaa"], indent=0))
+        exp = [
+            '<script type="text/javascript">',
+            "async function init() {",
+            "aaa",
+            "}",
+            "init();",
+            "</script>",
+        ]
+        assert res == exp
+
+    def test_iter_compressed_scripts(self):
+        scripts = [f"var x{i} = {i};" for i in range(2000)]
+        res = list(html.iter_compressed_scripts(iter(scripts), line_length=64))
+
+        assert (
+            res[0] == f'<script type="application/octet-stream" id="{html.PAYLOAD_ID}">'
+        )
+        end = res.index("</script>")
+        # all lines but the last one are full
+        assert all(len(line) == 64 for line in res[1:end][:-1])
+        assert res[end + 1] == '<script type="text/javascript">'
+        assert "DecompressionStream" in "".join(res[end:][1:])
+
+        payload = base64.b64decode("".join(res[1:end]))
+        assert gzip.decompress(payload).decode("utf-8") == "\n".join(scripts) + "\n"
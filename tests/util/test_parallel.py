@@ -0,0 +1,79 @@
+# Apache License 2.0
+
+import pickle
+
+import cesiumpy
+import cesiumpy.util.parallel as parallel
+
+
+class TestParallel:
+    def test_compact_pickle(self, sampled_position):
+        entities = [
+            cesiumpy.Point(position=[-110, 40, 0], pixel_size=5),
+            cesiumpy.Box(
+                position=[-100, 40, 0],
+                dimensions=(1e4, 2e4, 3e4),
+                material=cesiumpy.color.RED.with_alpha(0.5),
+            ),
+            cesiumpy.Point(position=sampled_position),
+        ]
+
+        restored = pickle.loads(parallel.dumps(entities))
+        assert [type(e) for e in restored] == [type(e) for e in entities]
+        assert restored[0].generate_script() == entities[0].generate_script()
+        assert restored[1].generate_script() == entities[1].generate_script()
+
+        # properties are registered to the worker widget
+        results = parallel._generate_chunk("widget", parallel.dumps(entities))
+        assert [script for _, script in results][:2] == [
+            e.generate_script() for e in entities[:2]
+        ]
+        properties, script = results[2]
+        assert (
+            script
+            == f"{{position: widget.{sampled_position.name}, point: {{pixelSize: 10.0, color: Cesium.Color.WHITE}}}}"
+        )
+        assert list(properties) == [sampled_position.name]
+
+    def test_to_html(self, sampled_position):
+        viewer = cesiumpy.Viewer()
+        for lon in range(-120, -100):
+            viewer.entities.add(cesiumpy.Point(position=[lon, 40, 0]))
+            viewer.entities.add(cesiumpy.Point(position=sampled_position))
+
+        expected = viewer.to_html()
+        assert viewer.to_html(workers=2) == expected
+        assert viewer.to_html(workers=3, compact=True, hoist=False) == viewer.to_html(
+            compact=True, hoist=False
+        )
+
+    def test_concurrent(self):
+        points = [cesiumpy.Point(position=[lon, 40, 0]) for lon in range(-120, -100)]
+        boxes = [
+            cesiumpy.Box(position=[lon, 40, 0], dimensions=(1e4, 2e4, 3e4))
+            for lon in range(-120, -100)
+        ]
+        widget = cesiumpy.Viewer()
+
+        # chunks are sent to each pool, which do not share state
+        first = parallel.iter_parallel_scripts(points, widget, 2, chunk_size=1)
+        second = parallel.iter_parallel_scripts(boxes, widget, 4, chunk_size=1)
+        results = [next(first), next(second)]
+        results[1:1] = first
+        results.extend(second)
+        scripts = [p.generate_script(widget) for p in points]
+        scripts.extend(b.generate_script(widget) for b in boxes)
+        assert [s for _, s in results] == scripts
+
+    def test_short_list(self, monkeypatch):
+        viewer = cesiumpy.Viewer()
+        for lon in range(-120, -100):
+            viewer.entities.add(cesiumpy.Point(position=[lon, 40, 0]))
+        expected = viewer.to_html()
+
+        # lists not longer than workers are generated serially
+        def _raise(*args, **kwargs):
+            raise AssertionError("no pool expected")
+
+        monkeypatch.setattr(parallel, "iter_parallel_scripts", _raise)
+        assert viewer.to_html(workers=20) == expected
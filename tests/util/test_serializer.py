@@ -0,0 +1,155 @@
+# Apache License 2.0
+
+from datetime import datetime, timedelta, timezone
+
+import cesiumpy
+import cesiumpy.util.common as com
+import cesiumpy.util.serializer as serializer
+
+
+def _generic_script(obj, widget=None) -> str:
+    return "".join(com.to_jsobject(obj._property_dict, widget=widget))
+
+
+class TestSerializer:
+    def test_encode(self):
+        assert serializer.encode("x") == '"x"'
+        assert serializer.encode(True) == "true"
+        assert serializer.encode(False) == "false"
+        assert serializer.encode(1.5) == "1.5"
+        assert serializer.encode(3) == "3"
+        assert serializer.encode([False, 1.0, "a"]) == '[false, 1.0, "a"]'
+        assert serializer.encode({"pixel_size": 1.0}) == "{pixelSize: 1.0}"
+        assert (
+            serializer.encode(datetime(2022, 1, 1))
+            == 'Cesium.JulianDate.fromIso8601("2022-01-01T00:00:00")'
+        )
+        assert serializer.encode(cesiumpy.color.RED) == "Cesium.Color.RED"
+        assert (
+            serializer.encode(cesiumpy.VerticalOrigin.TOP)
+            == "Cesium.VerticalOrigin.TOP"
+        )
+
+    def test_entities_match_generic_path(self):
+        entities = [
+            cesiumpy.Point(position=[-120, 40, 0], name="x"),
+            cesiumpy.Point(position=[-120, 40, 0], pixel_size=3, show=False),
+            cesiumpy.Cylinder(
+                position=[-100, 40, 50e4],
+                length=100e4,
+                top_radius=10e4,
+                bottom_radius=10e4,
+                material=cesiumpy.color.AQUA.with_alpha(0.5),
+            ),
+            cesiumpy.Polyline(
+                positions=[-120, 25, 0, -90, 30, 0],
+                width=0.5,
+                material=cesiumpy.color.BLUE,
+            ),
+            cesiumpy.Label(position=[-120, 40, 0], text="x"),
+            cesiumpy.Billboard(position=[-120, 40, 0]),
+            cesiumpy.Box(dimensions=(40e4, 30e4, 50e4), position=[-120, 40, 0]),
+            cesiumpy.Wall(
+                positions=[-60, 40, 0, -65, 40, 0],
+                maximum_heights=10e4,
+                minimum_heights=0,
+            ),
+        ]
+        for entity in entities:
+            assert entity._get_serializer() is not None
+            assert entity.generate_script() == _generic_script(entity)
+
+    def test_serializer_per_class(self):
+        point = cesiumpy.Point._get_serializer()
+        assert point is cesiumpy.Point._get_serializer()
+        assert point is not cesiumpy.Cylinder._get_serializer()
+
+    def test_dynamic_property_dict_uses_generic_path(self):
+        from cesiumpy.entities.sensors.conic_sensor import ConicSensor
+
+        assert ConicSensor._get_serializer() is None
+
+
+class TestConstantTable:
+    def test_intern(self):
+        constants = serializer.ConstantTable()
+        script = "Cesium.Color.RED.withAlpha(0.5)"
+        nested = f"new Cesium.ColorMaterialProperty({script})"
+
+        token = constants.intern(script)
+        assert token != script
+        assert constants.intern(script) == token
+        outer = constants.intern(nested.replace(script, token))
+        once = constants.intern("Cesium.Color.BLUE.withAlpha(0.5)")
+        assert len(constants) == 3
+
+        # short expressions are not hoisted
+        assert constants.intern("Cesium.Math.PI") == "Cesium.Math.PI"
+
+        # repeated expressions are declared before the first script using
+        # them, the others are inlined
+        scripts = [f"a = {once};", f"b = {token};", f"c = {outer};"]
+        assert list(constants.resolve(scripts)) == [
+            "a = Cesium.Color.BLUE.withAlpha(0.5);",
+            f"const _c0 = {script};",
+            "b = _c0;",
+            "c = new Cesium.ColorMaterialProperty(_c0);",
+        ]
+
+        # an expression only used in a repeated one is evaluated once
+        constants = serializer.ConstantTable()
+        outer = constants.intern(nested.replace(script, constants.intern(script)))
+        assert list(constants.resolve([f"b = {outer};", f"c = {outer};"])) == [
+            f"const _c0 = {nested};",
+            "b = _c0;",
+            "c = _c0;",
+        ]
+
+
+class TestTimes:
+    def test_julian_date(self):
+        # Julian days start at noon
+        assert serializer.julian_date(datetime(2000, 1, 1, 12)) == (2451545, 0.0)
+        assert serializer.julian_date(datetime(2024, 1, 1)) == (2460310, 43200.0)
+        assert serializer.julian_date(
+            datetime(1999, 12, 31, 13, 0, 0, 500000, tzinfo=timezone.utc)
+        ) == (2451544, 3600.5)
+
+    def test_encode_time(self):
+        epoch = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert serializer.time_decoder_script(epoch) == (
+            "function cesiumpyTime(s, us) { "
+            "return new Cesium.JulianDate(2460310, 43200 + s + (us || 0) / 1000000); }"
+        )
+        assert serializer.time_decoder_script(
+            epoch + timedelta(hours=10, microseconds=987654)
+        ) == (
+            "function cesiumpyTime(s, us) { return new Cesium.JulianDate("
+            "2460310, 79200 + s + (987654 + (us || 0)) / 1000000); }"
+        )
+
+        class Widget:
+            _time_epoch = epoch
+
+        widget = Widget()
+        time = epoch + timedelta(hours=1)
+        assert serializer.encode_time(time, widget) == "cesiumpyTime(3600)"
+        assert serializer.encode(time, widget) == "cesiumpyTime(3600)"
+        assert (
+            serializer.encode(epoch - timedelta(seconds=1.25), widget)
+            == "cesiumpyTime(-2, 750000)"
+        )
+        # naive datetimes are in UTC
+        assert serializer.encode(datetime(2024, 1, 1), widget) == "cesiumpyTime(0)"
+        # microseconds are integers, which compact output keeps exactly
+        widget._time_epoch = serializer.J2000
+        assert (
+            serializer.encode(epoch + timedelta(microseconds=987654), widget)
+            == "cesiumpyTime(757339200, 987654)"
+        )
+
+        # times are absolute without epoch
+        assert (
+            serializer.encode_time(time)
+            == 'Cesium.JulianDate.fromIso8601("2024-01-01T01:00:00+00:00")'
+        )
@@ -1,7 +1,12 @@
 # Apache License 2.0
 
+import concurrent.futures
 
-from cesiumpy.util.trait import _DIV
+import pytest
+import traitlets
+
+import cesiumpy
+from cesiumpy.util.trait import _DIV, is_trusted
 
 
 class TestTrait:
@@ -18,3 +23,142 @@ class TestTrait:
 
         div = _DIV(id="xxx", width="90%", height="60%")
         assert div.script == """<div id="xxx" style="width:90%; height:60%;"><div>"""
+
+
+class TestScriptCache:
+    def test_trait_change(self):
+        e = cesiumpy.Point(position=(-110, 40, 0))
+        exp = """{position: Cesium.Cartesian3.fromDegrees(-110.0, 40.0, 0.0), point: {pixelSize: 10.0, color: Cesium.Color.WHITE}}"""
+        assert e.generate_script() == exp
+        assert e.generate_script() is e.generate_script()
+
+        e.pixel_size = 7
+        exp = """{position: Cesium.Cartesian3.fromDegrees(-110.0, 40.0, 0.0), point: {pixelSize: 7.0, color: Cesium.Color.WHITE}}"""
+        assert e.generate_script() == exp
+
+        e.name = "x"
+        exp = """{name: "x", position: Cesium.Cartesian3.fromDegrees(-110.0, 40.0, 0.0), point: {pixelSize: 7.0, color: Cesium.Color.WHITE}}"""
+        assert e.generate_script() == exp
+
+    def test_child_change(self):
+        e = cesiumpy.Point(position=(-110, 40, 0))
+        e.generate_script()
+
+        e.position.x = -100
+        exp = """{position: Cesium.Cartesian3.fromDegrees(-100.0, 40.0, 0.0), point: {pixelSize: 10.0, color: Cesium.Color.WHITE}}"""
+        assert e.generate_script() == exp
+
+        # replaced child is tracked as well
+        e.position = cesiumpy.Cartesian3.fromDegrees(-90, 40, 0)
+        e.generate_script()
+        e.position.y = 30
+        exp = """{position: Cesium.Cartesian3.fromDegrees(-90.0, 30.0, 0.0), point: {pixelSize: 10.0, color: Cesium.Color.WHITE}}"""
+        assert e.generate_script() == exp
+
+    def test_shared_child(self):
+        position = cesiumpy.Cartesian3.fromDegrees(-110, 40, 0)
+        e1 = cesiumpy.Point(position=position)
+        e2 = cesiumpy.Point(position=position, pixel_size=5)
+        e1.generate_script()
+        e2.generate_script()
+
+        position.z = 10
+        assert "10.0)" in e1.generate_script()
+        assert "10.0)" in e2.generate_script()
+
+    def test_in_place_list(self):
+        e = cesiumpy.Polyline(positions=[-120, 25, 0, -90, 30, 0])
+        e.generate_script()
+        e.positions.x[3] = -60
+        assert "[-120, 25, 0, -60, 30, 0]" in e.generate_script()
+
+        e = cesiumpy.Wall(
+            positions=[-120, 25, 0, -90, 30, 0],
+            maximum_heights=[10, 20],
+            minimum_heights=[0, 0],
+        )
+        e.generate_script()
+        e.maximum_heights[0] = 15
+        assert "maximumHeights: [15, 20]" in e.generate_script()
+
+        # items added in place are tracked as well
+        e = cesiumpy.TimeIntervalCollection(intervals=[])
+        e.generate_script()
+        interval = cesiumpy.TimeInterval(is_start_included=True)
+        e.intervals.append(interval)
+        assert "isStartIncluded: true" in e.generate_script()
+        interval.is_start_included = False
+        assert "isStartIncluded: false" in e.generate_script()
+
+    def test_in_place_array(self):
+        np = pytest.importorskip("numpy")
+
+        values = np.array([[-120.0, 25.0, 0.0], [-90.0, 30.0, 0.0]])
+        e = cesiumpy.Polyline(positions=cesiumpy.Cartesian3.fromDegreesArray(values))
+        viewer = cesiumpy.Viewer()
+        viewer.entities.add(e)
+        viewer.to_html()
+        e.positions.values[1, 0] = -60.0
+        assert "-60.0, 30.0, 0.0" in viewer.to_html()
+
+    def test_invalidate_script(self):
+        interval = cesiumpy.TimeInterval(data={"a": 1})
+        e = cesiumpy.TimeIntervalCollection(intervals=[interval])
+        e.generate_script()
+
+        # modification of dict is not detected
+        interval.data["a"] = 2
+        assert "a: 2" not in e.generate_script()
+
+        interval.invalidate_script()
+        assert "a: 2" in e.generate_script()
+
+    def test_side_effect_not_cached(self, sampled_position):
+        viewer = cesiumpy.Viewer()
+        e = cesiumpy.Point(position=sampled_position)
+        viewer.entities.add(e)
+
+        script = viewer.to_html()
+        assert "_script_cache" not in e.__dict__
+        assert viewer.to_html() == script
+
+
+class TestTrusted:
+    def test_same_script(self):
+        kwargs = dict(position=[-120.0, 40.0, 0.0], color=cesiumpy.color.RED)
+        e1 = cesiumpy.Point(**kwargs)
+        with cesiumpy.trusted():
+            e2 = cesiumpy.Point(**kwargs)
+        assert e2.generate_script() == e1.generate_script()
+
+    def test_not_validated(self):
+        with pytest.raises(traitlets.TraitError):
+            cesiumpy.Point(position=[-120.0, 40.0, 0.0], pixel_size="x")
+        with pytest.raises(ValueError):
+            cesiumpy.Point(position=[-200.0, 40.0, 0.0])
+
+        with cesiumpy.trusted():
+            e = cesiumpy.Point(position=[-200.0, 40.0, 0.0], pixel_size="x")
+        assert e.pixel_size == "x"
+        assert e.position.x == -200.0
+
+    def test_change_invalidates_script(self):
+        e = cesiumpy.Point(position=[-120.0, 40.0, 0.0])
+        e.generate_script()
+        with cesiumpy.trusted():
+            e.pixel_size = 20.0
+        assert "pixelSize: 20.0" in e.generate_script()
+
+    def test_restored(self):
+        with pytest.raises(RuntimeError):
+            with cesiumpy.trusted():
+                assert is_trusted()
+                raise RuntimeError
+        assert not is_trusted()
+
+    def test_thread(self):
+        # other threads keep validating values
+        with cesiumpy.trusted():
+            with concurrent.futures.ThreadPoolExecutor(1) as executor:
+                assert not executor.submit(is_trusted).result()
+            assert is_trusted()